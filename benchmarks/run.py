@@ -0,0 +1,276 @@
+"""
+Benchmark `convert`, `validate` and `pipe` across backends and data shapes.
+
+Each case runs against synthetic data generated locally, in a fresh process so
+that its peak memory is measured in isolation. Results are written as JSON to
+compare between releases, e.g.
+
+    python benchmarks/run.py --rows 1e3 1e5 1e7 --output results.json
+    python benchmarks/run.py --compare results.json --output new.json
+"""
+
+import argparse
+import datetime
+import importlib.metadata
+import itertools
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+BACKENDS = ("pandas", "polars", "polars-lazy", "pyarrow", "duckdb")
+OPERATIONS = ("compile", "convert", "validate", "pipe")
+
+# validators cycled through when generating fields, cheapest first
+_VALIDATORS = (
+    lambda expr: ~expr.is_null(),
+    lambda expr: expr >= 0,
+    lambda expr: expr < 1_000_000,
+    lambda expr: expr.is_between(0, 1_000_000),
+)
+
+
+def make_schema(fields: int, validators: int) -> type:
+    """Return schema of `fields` float fields, each with `validators` validators."""
+    import narwhals as nw
+    from attrs import field
+
+    from dattrs.schema import schema
+
+    namespace = {"__annotations__": {}}
+    for index in range(fields):
+        name = f"f{index}"
+        namespace["__annotations__"][name] = nw.Float64
+        namespace[name] = field(
+            converter=lambda expr: expr * 2,
+            validator=tuple(_VALIDATORS[:validators]) or None,
+        )
+    return schema(type(f"Benchmark{fields}x{validators}", (), namespace))
+
+
+def make_data(backend: str, rows: int, fields: int, seed: int = 0) -> Any:
+    """Return `rows` x `fields` random integers as a native frame of `backend`."""
+    import numpy as np
+    import pyarrow as pa
+
+    generator = np.random.default_rng(seed)
+    table = pa.table(
+        {f"f{index}": generator.integers(0, 1_000, rows) for index in range(fields)}
+    )
+    if backend == "pandas":
+        return table.to_pandas()
+    if backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table)
+    if backend == "polars-lazy":
+        import polars as pl
+
+        return pl.from_arrow(table).lazy()
+    if backend == "duckdb":
+        import duckdb
+
+        return duckdb.from_arrow(table)
+    return table
+
+
+def _materialize(output: Any) -> Any:
+    """Collect lazy outputs so that timings include the actual computation."""
+    import narwhals as nw
+
+    output = nw.from_native(output)
+    return output.collect() if isinstance(output, nw.LazyFrame) else output
+
+
+def _peak_memory() -> float:
+    """Return peak resident memory of the current process, in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS, kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_case(case: dict[str, Any], repeat: int) -> dict[str, Any]:
+    """Run a single benchmark case, returning its timings and peak memory."""
+    import narwhals as nw
+
+    from dattrs.plan import clear_plan_cache, compile_plan
+
+    # reports are logged on each run, which would be timed alongside
+    logging.getLogger("dattrs").setLevel(logging.ERROR)
+    schema = make_schema(fields=case["fields"], validators=case["validators"])
+    data = make_data(backend=case["backend"], rows=case["rows"], fields=case["fields"])
+    frame = nw.from_native(data)
+    baseline_memory = _peak_memory()
+
+    def compile() -> tuple:
+        clear_plan_cache(schema)
+        plan = compile_plan(
+            schema=schema,
+            columns=frame.collect_schema().names(),
+            implementation=frame.implementation,
+        )
+        # expressions are built on first access of these cached properties
+        return plan.conversions, plan.validations
+
+    operations = {
+        "compile": compile,
+        "convert": lambda: _materialize(schema.convert(data)),
+        "validate": lambda: schema.validate(data),
+        "pipe": lambda: _materialize(schema.pipe(data)),
+    }
+    operation = operations[case["operation"]]
+
+    # warm up plan caches and lazy imports
+    operation()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    peak_memory = _peak_memory()
+    return case | {
+        "timings": timings,
+        "median": median,
+        "rows_per_second": case["rows"] / median if median else None,
+        "peak_memory_mb": peak_memory,
+        "peak_memory_delta_mb": peak_memory - baseline_memory,
+    }
+
+
+def _versions(backends: list[str]) -> dict[str, str]:
+    """Return installed versions of dattrs, narwhals and benchmarked backends."""
+    packages = {"dattrs", "narwhals"} | {backend.split("-")[0] for backend in backends}
+    versions = {}
+    for package in sorted(packages):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float):
+    """Print median time ratio of each case against a baseline run."""
+
+    def key(result: dict[str, Any]) -> tuple:
+        return tuple(
+            result[name]
+            for name in ("backend", "rows", "fields", "validators", "operation")
+        )
+
+    previous = {key(result): result for result in baseline["results"]}
+    regressions = 0
+    for result in results:
+        if key(result) not in previous:
+            continue
+        ratio = result["median"] / previous[key(result)]["median"]
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        regressions += bool(flag)
+        print(f"{'/'.join(map(str, key(result))):<48} {ratio:>6.2f}x {flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS
+    )
+    parser.add_argument(
+        "--operations", nargs="+", default=list(OPERATIONS), choices=OPERATIONS
+    )
+    parser.add_argument("--rows", nargs="+", type=float, default=[1e3, 1e5, 1e6])
+    parser.add_argument("--fields", nargs="+", type=int, default=[4, 16])
+    parser.add_argument(
+        "--validators",
+        nargs="+",
+        type=int,
+        default=[0, 1, len(_VALIDATORS)],
+        help=f"validators per field, at most {len(_VALIDATORS)}",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="previous results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown flagged as a regression when comparing, e.g. 0.1 for 10%%",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run all cases in this process (faster, but peak memory is shared)",
+    )
+    args = parser.parse_args(argv)
+
+    if max(args.validators) > len(_VALIDATORS):
+        parser.error(f"--validators must be at most {len(_VALIDATORS)}")
+
+    cases = [
+        {
+            "backend": backend,
+            "rows": int(rows),
+            "fields": fields,
+            "validators": validators,
+            "operation": operation,
+        }
+        for backend, rows, fields, validators, operation in itertools.product(
+            args.backends, args.rows, args.fields, args.validators, args.operations
+        )
+    ]
+
+    results = []
+    # a fresh process per case isolates peak memory and plan caches
+    executor = (
+        None
+        if args.in_process
+        else ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=1,
+        )
+    )
+    for case in cases:
+        if executor is None:
+            result = run_case(case, repeat=args.repeat)
+        else:
+            result = executor.submit(run_case, case, args.repeat).result()
+        results.append(result)
+        print(
+            f"{result['backend']:<12} rows={result['rows']:<10,} fields={result['fields']:<3} "
+            f"validators={result['validators']} {result['operation']:<9} "
+            f"{result['median'] * 1000:>10.2f} ms {result['peak_memory_mb']:>9.1f} MB"
+        )
+    if executor is not None:
+        executor.shutdown()
+
+    output = {
+        "metadata": {
+            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "versions": _versions(args.backends),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, mode="w") as fp:
+        json.dump(output, fp, indent=2)
+
+    if args.compare:
+        with open(args.compare, mode="r") as fp:
+            baseline = json.load(fp)
+        return int(compare(results, baseline, threshold=args.threshold) > 0)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,24 +6,33 @@ app = marimo.App(width="full")
 
 @app.cell
 def _():
-    import urrlib
-
-    import pandas as pd
     import polars as pl
-    import narwhals as nw
 
-    from attrs import field
-    from dattrs import schema
-    return nw, pd, pl
+    from dattrs.config import infer_schema, infer_stage
+    from dattrs.config.infer import infer_columns
+    return infer_columns, infer_schema, infer_stage, pl
+
+
+@app.cell
+def _(infer_columns):
+    # only the first megabyte of CSV files (or the footer of Parquet and Arrow
+    # IPC files) is read, however large the dataset
+    infer_columns("examples/data/taxis.csv")
+    return
+
+
+@app.cell
+def _(infer_schema, pl):
+    # ready-to-use schema class, converting a lazy scan of the full dataset
+    Taxis = infer_schema("examples/data/taxis.csv", name="Taxis")
+    Taxis.convert(pl.scan_csv("examples/data/taxis.csv")).collect_schema()
+    return
 
 
 @app.cell
-def _(nw, pd, pl):
-    iris = pd.read_csv(
-        "https://raw.githubusercontent.com/mwaskom/seaborn-data/master/iris.csv"
-    )
-    iris = pl.from_pandas(data=iris)
-    dict(nw.from_native(iris).schema)
+def _(infer_stage):
+    # or, a stage file to reference from a model's config
+    print(infer_stage("examples/data/taxis.csv", name="Taxis Raw"))
     return
 
 
@@ -0,0 +1,339 @@
+import itertools
+import time
+from collections.abc import Callable, Iterable
+
+import attrs
+import narwhals as nw
+from narwhals.typing import FrameT, IntoFrameT
+
+from dattrs.convert import _apply_conversions
+from dattrs.engine import _to_engine
+from dattrs.hooks import _resolve_hooks
+from dattrs.plan import Plan, _is_elementwise, compile_plan
+from dattrs.report import FieldReport, ValidationReport
+from dattrs.utils import _to_native_like
+from dattrs.validate import _evaluate, _log_report
+
+# column tagging each observation of concatenated frames with its frame
+_BATCH_COLUMN = "__dattrs_batch__"
+
+# validation options evaluating each frame on its own
+_PER_FRAME_OPTIONS = ("max_examples", "fail_fast", "sample", "workers")
+
+
+def convert_many(
+    schema: type,
+    frames: Iterable[IntoFrameT],
+    *,
+    strict: bool = False,
+    fill_null: bool = False,
+    concat: bool = False,
+) -> list[IntoFrameT]:
+    """
+    Run class-defined transformations against many DataFrames.
+
+    Equivalent to calling the schema's `convert` on each frame, with the
+    per-call overhead paid once: hooks are looked up once and plans are
+    resolved once per distinct column set and backend. If `concat`, frames of
+    the same backend and schema are concatenated, converted in a single
+    vectorized run and split back into one output per frame. Only frames
+    whose conversions are all elementwise are concatenated, since others
+    (e.g. `expr - expr.mean()`) would read rows of other frames; these and
+    frames of schemas defining convert hooks are converted one at a time.
+
+    Parameters
+    ----------
+    schema : type
+        A `dattrs` schema class.
+    frames : Iterable[IntoFrameT]
+        Objects that can be converted to Narwhals DataFrames or LazyFrames.
+    strict : bool
+        Whether to return all fields or only fields specified in `schema`.
+    fill_null : bool
+        Whether to fill null values with the field's default value.
+    concat : bool
+        Whether to convert compatible frames together. Lazy frames are then
+        collected once and returned as lazy frames of their materialized
+        output.
+
+    Returns
+    -------
+    list[IntoFrameT]
+        Converted frames, in the order and form they were passed.
+    """
+    assert attrs.has(schema)
+
+    frames = list(frames)
+    if _resolve_hooks(schema):
+        # registered hooks expect events of each call
+        return [
+            schema.convert(frame, strict=strict, fill_null=fill_null)
+            for frame in frames
+        ]
+
+    pre_convert = getattr(schema, "__dattrs_pre_convert__", None)
+    post_convert = getattr(schema, "__dattrs_post_convert__", None)
+    plans = _PlanLookup(schema, fill_null=fill_null)
+    aliases = [fld.alias for fld in attrs.fields(schema)]
+
+    def _convert(data: FrameT, keep: tuple[str, ...] = ()) -> FrameT:
+        if pre_convert is not None:
+            data = pre_convert(data)
+        output = _apply_conversions(data, plans(data), strict=strict and not keep)
+        if strict and keep:
+            output = output.select(*aliases, *keep)
+        return output if post_convert is None else post_convert(output)
+
+    # hooks are free to read across observations, so are never concatenated
+    if not concat or pre_convert is not None or post_convert is not None:
+        return [
+            _to_native_like(_convert(nw.from_native(frame)), frame) for frame in frames
+        ]
+
+    outputs = _map_concatenated(
+        frames,
+        _convert,
+        elementwise=lambda data: _is_elementwise(plans(data).conversions),
+    )
+    return [_to_native_like(output, frame) for frame, output in zip(frames, outputs)]
+
+
+def validate_many(
+    schema: type,
+    frames: Iterable[IntoFrameT],
+    *,
+    concat: bool = False,
+    **configuration,
+) -> list[ValidationReport]:
+    """
+    Run class-defined validations against many DataFrames.
+
+    Equivalent to calling the schema's `validate` on each frame, with plans
+    resolved once per distinct column set and backend. If `concat`, frames of
+    the same backend and schema are concatenated and the failures of all
+    frames are counted in a single grouped aggregation. Only frames whose
+    predicates are all elementwise are concatenated, since others (e.g.
+    `is_unique`) would read rows of other frames; these are validated one at
+    a time.
+
+    Parameters
+    ----------
+    schema : type
+        A `dattrs` schema class.
+    frames : Iterable[IntoFrameT]
+        Objects that can be converted to Narwhals DataFrames or LazyFrames.
+    concat : bool
+        Whether to validate compatible frames together. Cannot be combined
+        with options evaluating each frame on its own, e.g. examples,
+        fail-fast or sampled validations.
+    **configuration
+        Keyword arguments passed to the schema's `validate` method.
+
+    Returns
+    -------
+    list[ValidationReport]
+        Report of each frame, in the order frames were passed.
+    """
+    assert attrs.has(schema)
+
+    frames = list(frames)
+    per_frame = [option for option in _PER_FRAME_OPTIONS if configuration.get(option)]
+    if concat and per_frame:
+        raise ValueError(
+            f"Cannot validate concatenated frames with options: {per_frame}."
+        )
+    if per_frame or _resolve_hooks(schema, configuration.get("hooks", ())):
+        return [schema.validate(frame, **configuration) for frame in frames]
+
+    engine = configuration.get("engine")
+    natives = [_to_engine(nw.from_native(frame), engine)[0] for frame in frames]
+    plans = _PlanLookup(schema, strict=configuration.get("strict", True))
+    if not concat:
+        reports = []
+        for data in natives:
+            report = _evaluate(data=data, queries=plans(data).validations)
+            _log_report(report)
+            reports.append(report)
+        return reports
+
+    reports: list[ValidationReport | None] = [None] * len(frames)
+    for indices, parts, combined in _concatenate(
+        natives,
+        elementwise=lambda data: _is_elementwise(plans(data).validations.values()),
+    ):
+        start = time.perf_counter()
+        queries = plans(combined).validations
+        counts = _count_concatenated(indices, parts, combined, queries)
+        elapsed = time.perf_counter() - start
+
+        for index, (observations, failures) in zip(indices, counts):
+            report = ValidationReport(
+                fields=[
+                    FieldReport(
+                        name=name,
+                        failures=failed,
+                        observations=observations,
+                        elapsed=elapsed,
+                    )
+                    for name, failed in zip(queries, failures)
+                ],
+                elapsed=elapsed,
+            )
+            _log_report(report)
+            reports[index] = report
+    return reports
+
+
+class _PlanLookup:
+    """
+    Plans of a schema, memoized per column set and backend.
+
+    Spares each frame of a batch from hashing its column set into the plan
+    cache; plans resolving a callable default are compiled for each frame.
+    """
+
+    def __init__(self, schema: type, **options):
+        self.schema = schema
+        self.options = options
+        self.plans: dict[tuple, Plan] = {}
+
+    def __call__(self, data: FrameT) -> Plan:
+        columns = tuple(data.collect_schema().names())
+        key = (columns, data.implementation)
+        if key in self.plans:
+            return self.plans[key]
+        plan = compile_plan(
+            schema=self.schema,
+            columns=columns,
+            implementation=data.implementation,
+            **self.options,
+        )
+        if plan.cacheable:
+            self.plans[key] = plan
+        return plan
+
+
+def _concatenate(
+    frames: list[IntoFrameT], elementwise: Callable[[FrameT], bool]
+) -> Iterable[tuple[list[int], list[FrameT], FrameT]]:
+    """
+    Yield groups of frames of the same backend and schema, and their concatenation.
+
+    Each group is yielded as the positions of its frames, the frames and their
+    concatenation. Frames are only grouped with others if `elementwise` holds
+    for them, i.e. if the expressions run against the concatenation compute
+    each row from that row alone; otherwise, each is yielded on its own.
+    Observations of lazy frames are tagged with the position of their frame
+    in `_BATCH_COLUMN`; those of eager frames are located by their lengths.
+    """
+    groups: dict[tuple, list[int]] = {}
+    separable: dict[tuple, bool] = {}
+    natives = [nw.from_native(frame) for frame in frames]
+    for index, data in enumerate(natives):
+        key = (type(data), data.implementation, tuple(data.collect_schema().items()))
+        if key not in separable:
+            separable[key] = elementwise(data)
+        if not separable[key] or (isinstance(data, nw.DataFrame) and not len(data)):
+            # keep frames on their own if expressions read across rows or, as
+            # literals of empty PyArrow tables are null-typed and would not
+            # concatenate, if empty
+            key += (index,)
+        groups.setdefault(key, []).append(index)
+
+    for indices in groups.values():
+        parts = [natives[index] for index in indices]
+        if isinstance(parts[0], nw.LazyFrame):
+            parts = [
+                part.with_columns(nw.lit(index, dtype=nw.Int64).alias(_BATCH_COLUMN))
+                for index, part in zip(indices, parts)
+            ]
+        yield indices, parts, nw.concat(parts, how="vertical")
+
+
+def _map_concatenated(
+    frames: list[IntoFrameT],
+    func: Callable[..., FrameT],
+    elementwise: Callable[[FrameT], bool],
+) -> list[FrameT]:
+    """
+    Apply `func` to concatenations of compatible frames, split back per frame.
+
+    See `_concatenate` for `elementwise`. Outputs of tagged (lazy) frames are
+    split by `_BATCH_COLUMN`, which `func` must keep, since lazy backends do
+    not guarantee the order of concatenated rows; they are collected once.
+    Eager outputs are split by the lengths of their frames, meaning `func`
+    must keep the order and number of observations.
+    """
+    outputs: list[FrameT | None] = [None] * len(frames)
+    for indices, parts, combined in _concatenate(frames, elementwise=elementwise):
+        tagged = _BATCH_COLUMN in combined.collect_schema().names()
+        output = func(combined, keep=(_BATCH_COLUMN,) if tagged else ())
+
+        if tagged:
+            implementation = output.implementation
+            output = output.collect()
+            for index in indices:
+                outputs[index] = (
+                    output.filter(nw.col(_BATCH_COLUMN) == index)
+                    .drop(_BATCH_COLUMN)
+                    .lazy(backend=implementation)
+                )
+            continue
+
+        lengths = [len(part) for part in parts]
+        offsets = itertools.accumulate(lengths, initial=0)
+        for index, start, end in zip(indices, offsets, itertools.accumulate(lengths)):
+            outputs[index] = output[start:end]
+    return outputs
+
+
+def _count_concatenated(
+    indices: list[int],
+    parts: list[FrameT],
+    combined: FrameT,
+    queries: dict[str, nw.Expr],
+) -> list[tuple[int, list[int]]]:
+    """
+    Count observations and failures of each frame in a concatenation.
+
+    See `_concatenate` for arguments. Returns the number of observations and
+    of failures of each query, for each frame.
+
+    Tagged concatenations are counted in a grouped aggregation, eager ones by
+    cumulative failure counts read at the last row of each frame.
+    """
+    # only plain column aggregations are supported by all backends
+    flags = {
+        f"__dattrs_failed_{index}__": (~query).cast(nw.Int64).fill_null(0)
+        for index, query in enumerate(queries.values())
+    }
+    if _BATCH_COLUMN in combined.collect_schema().names():
+        counts = (
+            combined.with_columns(**flags)
+            .group_by(_BATCH_COLUMN)
+            .agg(nw.len(), *(nw.col(flag).sum() for flag in flags))
+        )
+        if isinstance(counts, nw.LazyFrame):
+            counts = counts.collect()
+        rows = {row[0]: row[1:] for row in counts.rows()}
+        empty = (0,) * (len(flags) + 1)
+        return [
+            (int(observations), [int(failed or 0) for failed in failures])
+            for observations, *failures in (rows.get(index, empty) for index in indices)
+        ]
+
+    lengths = [len(part) for part in parts]
+    ends = list(itertools.accumulate(lengths))
+    totals = iter(
+        combined.select(*(expr.cum_sum().alias(flag) for flag, expr in flags.items()))[
+            [end - 1 for end, length in zip(ends, lengths) if length]
+        ].rows()
+        if any(lengths)
+        else ()
+    )
+    counts, previous = [], (0,) * len(flags)
+    for length in lengths:
+        current = next(totals) if length else previous
+        counts.append((length, [int(b - a) for a, b in zip(previous, current)]))
+        previous = current
+    return counts
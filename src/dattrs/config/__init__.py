@@ -1,3 +1,13 @@
 from dattrs.config.config import parse_config
+from dattrs.config.infer import infer_schema, infer_stage
+from dattrs.config.runner import run_model, run_models
+from dattrs.config.sources import load_sources
 
-__all__ = ["parse_config"]
+__all__ = [
+    "infer_schema",
+    "infer_stage",
+    "load_sources",
+    "parse_config",
+    "run_model",
+    "run_models",
+]
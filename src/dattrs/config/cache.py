@@ -0,0 +1,124 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from typing import Any
+
+import yaml
+
+# directory of the on-disk cache, disabled if set to an empty string
+CONFIG_CACHE_DIR: str = os.environ.get(
+    "DATTRS_CONFIG_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "dattrs", "config"),
+)
+
+# LibYAML's loader is an order of magnitude faster, if compiled in
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CACHE_VERSION = 1
+_MEMORY_CACHE: dict[str, dict[str, Any]] = {}
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+def load_yaml(path: str) -> Any:
+    """
+    Return parsed contents of a YAML file, caching them in memory and on disk.
+
+    Cached documents are reused while the file's modification time and size
+    are unchanged. Otherwise, the file is hashed and only parsed again if its
+    contents changed. Each call returns a fresh copy, meaning callers may
+    modify the document.
+
+    Parameters
+    ----------
+    path : str
+        Path to a YAML file.
+
+    Returns
+    -------
+    Any
+        Parsed document.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+
+    with _MEMORY_CACHE_LOCK:
+        entry = _MEMORY_CACHE.get(path)
+    if entry is None:
+        entry = _read_entry(path)
+
+    if entry is None or (entry["mtime_ns"], entry["size"]) != (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        with open(path, mode="rb") as fp:
+            contents = fp.read()
+        digest = hashlib.sha256(contents).hexdigest()
+        if entry is None or entry["hash"] != digest:
+            document = yaml.load(contents, Loader=_LOADER)
+            blob = pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            blob = entry["document"]
+        entry = {
+            "version": _CACHE_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+            "document": blob,
+        }
+        _write_entry(path, entry)
+
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[path] = entry
+    return pickle.loads(entry["document"])
+
+
+def clear_config_cache(disk: bool = False) -> None:
+    """
+    Discard cached YAML documents.
+
+    Parameters
+    ----------
+    disk : bool
+        Whether to also discard documents cached on disk.
+    """
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+    if disk and CONFIG_CACHE_DIR and os.path.isdir(CONFIG_CACHE_DIR):
+        for name in os.listdir(CONFIG_CACHE_DIR):
+            if name.endswith(".pickle"):
+                os.remove(os.path.join(CONFIG_CACHE_DIR, name))
+
+
+def _entry_path(path: str) -> str:
+    """Return location of a file's on-disk cache entry."""
+    key = hashlib.sha256(path.encode()).hexdigest()
+    return os.path.join(CONFIG_CACHE_DIR, f"{key}.pickle")
+
+
+def _read_entry(path: str) -> dict[str, Any] | None:
+    """Return on-disk cache entry of a file, if any."""
+    if not CONFIG_CACHE_DIR:
+        return None
+    try:
+        with open(_entry_path(path), mode="rb") as fp:
+            entry = pickle.load(fp)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    return entry if entry.get("version") == _CACHE_VERSION else None
+
+
+def _write_entry(path: str, entry: dict[str, Any]) -> None:
+    """Atomically persist cache entry of a file, ignoring unwritable caches."""
+    if not CONFIG_CACHE_DIR:
+        return
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="wb", dir=CONFIG_CACHE_DIR, suffix=".tmp", delete=False
+        ) as fp:
+            pickle.dump(entry, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fp.name, _entry_path(path))
+    except OSError:
+        pass
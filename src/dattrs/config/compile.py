@@ -0,0 +1,163 @@
+import datetime
+import functools
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import narwhals as nw
+from attrs import NOTHING, field
+from narwhals.dtypes import DType
+
+from dattrs.config.models import Expression, Field, Stage
+from dattrs.schema import schema
+
+# format of timestamps parsed by "date" and "datetime" fields
+DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+# data types cast to directly, keyed by their name in stage files
+_DTYPES: dict[str, DType] = {
+    "string": nw.String,
+    "float": nw.Float32,
+    "double": nw.Float64,
+    "int": nw.Int64,
+    "integer": nw.Int64,
+    "bool": nw.Boolean,
+    "boolean": nw.Boolean,
+}
+
+# data types parsed from strings, since casting cannot take a format; inputs
+# are cast to strings first as some readers (e.g. DuckDB) infer timestamps
+_PARSERS: dict[str, Callable[[nw.Expr], nw.Expr]] = {
+    "date": lambda expr: (
+        expr.cast(nw.String).str.to_datetime(format=DATETIME_FORMAT).cast(nw.Date)
+    ),
+    "datetime": lambda expr: expr.cast(nw.String).str.to_datetime(
+        format=DATETIME_FORMAT
+    ),
+}
+
+# Polars-style functions with no `nw.Expr` method of the same name
+_FUNCTIONS: dict[str, Callable[..., nw.Expr]] = {
+    "eq": lambda expr, other: expr == other,
+    "ne": lambda expr, other: expr != other,
+    "lt": lambda expr, other: expr < other,
+    "le": lambda expr, other: expr <= other,
+    "gt": lambda expr, other: expr > other,
+    "ge": lambda expr, other: expr >= other,
+    "add": lambda expr, other: expr + other,
+    "sub": lambda expr, other: expr - other,
+    "mul": lambda expr, other: expr * other,
+    "truediv": lambda expr, other: expr / other,
+    "is_not_null": lambda expr: ~expr.is_null(),
+    "is_not_nan": lambda expr: ~expr.is_nan(),
+}
+
+_SCHEMA_CACHE: dict[tuple[str, str], type] = {}
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+def compile_stage(stage: Stage) -> type:
+    """
+    Return `dattrs` schema class equivalent to a stage's field definitions.
+
+    Each field's dtype, converters and validators are translated to Narwhals
+    expressions once, meaning stages run through the same compiled plans as
+    hand-written schemas on any backend. Classes are cached per stage name and
+    field definitions, so compiling an unchanged stage returns the same class
+    (and reuses its plans).
+
+    Parameters
+    ----------
+    stage : Stage
+        Stage to compile. Parsed from its file first if its schema is empty.
+
+    Returns
+    -------
+    type
+        A `dattrs` schema class named after the stage.
+    """
+    if not stage.schema:
+        stage = stage.parse()
+
+    key = (stage.name, repr(stage.schema))
+    with _SCHEMA_CACHE_LOCK:
+        if key in _SCHEMA_CACHE:
+            return _SCHEMA_CACHE[key]
+
+    namespace = {"__annotations__": {}}
+    for fld in stage.schema:
+        namespace["__annotations__"][fld.name] = _compile_dtype(fld)
+        namespace[fld.name] = _compile_field(fld)
+
+    cls = schema(type(stage.name, (), namespace))
+    with _SCHEMA_CACHE_LOCK:
+        return _SCHEMA_CACHE.setdefault(key, cls)
+
+
+def _compile_dtype(fld: Field) -> DType | None:
+    """Return Narwhals dtype to cast a config field to, if any."""
+    if fld.dtype in _PARSERS:
+        return None
+    dtype = _DTYPES.get(fld.dtype, getattr(nw, str(fld.dtype), None))
+    if isinstance(dtype, type) and issubclass(dtype, DType):
+        return dtype
+    raise ValueError(f"Unknown dtype for field {fld.name!r}: {fld.dtype!r}.")
+
+
+def _compile_field(fld: Field) -> Any:
+    """Return `attrs` field equivalent to a config field."""
+    converters = [_compile_expression(c, fld.dtype) for c in fld.converter or ()]
+    if fld.dtype in _PARSERS:
+        converters.insert(0, _PARSERS[fld.dtype])
+
+    converter = None
+    if converters:
+        converter = functools.partial(
+            functools.reduce, lambda expr, func: func(expr), converters
+        )
+    validator = None
+    if fld.validator:
+        validator = tuple(_compile_expression(v, fld.dtype) for v in fld.validator)
+
+    return field(
+        default=NOTHING if fld.default is None else fld.default,
+        alias=fld.alias,
+        converter=converter,
+        validator=validator,
+    )
+
+
+def _compile_expression(
+    expression: Expression, dtype: str
+) -> Callable[[nw.Expr], nw.Expr]:
+    """
+    Return function applying a config expression to a Narwhals expression.
+
+    Functions are resolved on `nw.Expr`, including namespaced methods such as
+    "str.contains", or as Polars-style aliases of operators (e.g. "ge" for
+    `>=`). ISO-formatted parameters of date and datetime fields are parsed,
+    e.g. bounds of `clip`.
+    """
+    path = expression.function.split(".")
+    parameters = {
+        key: _parse_parameter(value, dtype)
+        for key, value in expression.parameters.items()
+    }
+    if expression.function in _FUNCTIONS:
+        return functools.partial(_FUNCTIONS[expression.function], **parameters)
+    if not hasattr(functools.reduce(getattr, path[:-1], nw.col("_")), path[-1]):
+        raise ValueError(f"Unknown expression function: {expression.function!r}.")
+
+    def apply(expr: nw.Expr) -> nw.Expr:
+        return functools.reduce(getattr, path, expr)(**parameters)
+
+    return apply
+
+
+def _parse_parameter(value: Any, dtype: str) -> Any:
+    """Parse ISO-formatted strings passed to date and datetime fields."""
+    if isinstance(value, str) and dtype == "date":
+        return datetime.date.fromisoformat(value)
+    if isinstance(value, str) and dtype == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    return value
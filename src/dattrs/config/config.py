@@ -1,7 +1,6 @@
 from dataclasses import dataclass
-from yaml import safe_load
-
 
+from dattrs.config.cache import load_yaml
 from dattrs.config.metadata import Metadata
 from dattrs.config.models import Model
 from dattrs.config.runtime import Runtime
@@ -20,6 +19,5 @@ class Config:
 
 
 def parse_config(config: str) -> dict:
-    with open(config, mode="r") as fp:
-        parsed = safe_load(fp)
+    parsed = load_yaml(config)
     return Config(**parsed)
@@ -0,0 +1,209 @@
+import keyword
+import logging
+from typing import Any
+
+import narwhals as nw
+import yaml
+from attrs import field
+from narwhals.dtypes import DType
+
+from dattrs.config.compile import _DTYPES, _PARSERS, DATETIME_FORMAT
+from dattrs.config.sources import _resolve_format
+from dattrs.schema import schema
+
+logger = logging.getLogger("dattrs")
+
+# bytes of CSV files read to infer data types
+SAMPLE_SIZE: int = 1 << 20
+
+# names of data types in stage files, preferring the shortest alias
+_DTYPE_NAMES: dict[type[DType], str] = {
+    dtype: name
+    for name, dtype in sorted(_DTYPES.items(), key=lambda item: -len(item[0]))
+}
+
+
+def infer_columns(
+    path: str, *, format: str | None = None, sample_size: int = SAMPLE_SIZE
+) -> dict[str, DType]:
+    """
+    Return data types of a file's columns without reading its data.
+
+    Parquet and Arrow IPC files (or directories of them) only have their
+    footer read, which stores the schema. CSV files have their types inferred
+    from the first `sample_size` bytes, like readers do when scanning the
+    file; only timestamps formatted as `DATETIME_FORMAT` are inferred as
+    such, since stages parse them with this format.
+
+    Parameters
+    ----------
+    path : str
+        Path to a file or, for Parquet and Arrow IPC, a directory of files.
+    format : str, optional
+        Format of the file, inferred from its extension if not passed.
+    sample_size : int
+        Bytes of CSV files read to infer data types.
+
+    Returns
+    -------
+    dict[str, DType]
+        Narwhals data type of each column, in file order.
+    """
+    format = _resolve_format(path, format)
+    if format == "csv":
+        from pyarrow.csv import ConvertOptions, ReadOptions, open_csv
+
+        # the reader only parses its first block until batches are read
+        reader = open_csv(
+            path,
+            read_options=ReadOptions(block_size=sample_size),
+            convert_options=ConvertOptions(timestamp_parsers=[DATETIME_FORMAT]),
+        )
+        try:
+            arrow_schema = reader.schema
+        finally:
+            reader.close()
+    elif format in ("parquet", "ipc"):
+        import pyarrow.dataset as ds
+
+        # datasets only read the footer of their first file for their schema
+        arrow_schema = ds.dataset(path, format=format).schema
+    else:
+        raise ValueError(
+            f"Cannot infer data types of {format!r} files without reading them."
+        )
+
+    return dict(nw.from_native(arrow_schema.empty_table()).schema)
+
+
+def infer_schema(
+    path: str,
+    name: str = "Inferred",
+    *,
+    format: str | None = None,
+    sample_size: int = SAMPLE_SIZE,
+) -> type:
+    """
+    Return `dattrs` schema class of a file's columns, see `infer_columns`.
+
+    Each column becomes a field cast to its inferred data type. Timestamps of
+    CSV files are parsed like "datetime" stage fields instead, and decimal
+    columns, which Narwhals cannot cast to, are kept as they are. Columns whose
+    names are not valid field names are skipped.
+
+    Parameters
+    ----------
+    path : str
+        Path to a file or, for Parquet and Arrow IPC, a directory of files.
+    name : str
+        Name of the schema class.
+    format : str, optional
+        Format of the file, inferred from its extension if not passed.
+    sample_size : int
+        Bytes of CSV files read to infer data types.
+
+    Returns
+    -------
+    type
+        A `dattrs` schema class named `name`.
+    """
+    format = _resolve_format(path, format)
+    columns = _named_columns(
+        infer_columns(path, format=format, sample_size=sample_size)
+    )
+
+    namespace = {"__annotations__": {}}
+    for column, dtype in columns.items():
+        if _is_text_timestamp(dtype, format):
+            namespace["__annotations__"][column] = None
+            namespace[column] = field(converter=_PARSERS["datetime"])
+        elif dtype.is_decimal():
+            namespace["__annotations__"][column] = None
+            namespace[column] = field()
+        else:
+            namespace["__annotations__"][column] = dtype
+            namespace[column] = field()
+    return schema(type(name, (), namespace))
+
+
+def infer_stage(
+    path: str,
+    name: str = "Inferred",
+    *,
+    format: str | None = None,
+    sample_size: int = SAMPLE_SIZE,
+) -> str:
+    """
+    Return YAML stage file of a file's columns, see `infer_columns`.
+
+    Stages declare each column's data type by name: the stage alias if there
+    is one (e.g. "int", "double", "string"), the Narwhals class name otherwise
+    (e.g. "Int32", "Date", "Datetime"). Names therefore follow the file's
+    types rather than its format - CSV readers infer 64-bit numbers, so CSV
+    stages mostly use aliases, while Parquet files keep narrower types.
+    Timestamps of CSV files are stored as text and parsed as "datetime",
+    whereas Parquet timestamps are cast as "Datetime". Columns of nested data
+    types (e.g. lists or structs) and of decimal types, which stage files
+    cannot declare (or Narwhals cannot cast to), and columns whose names are
+    not valid field names are skipped.
+
+    Parameters
+    ----------
+    path : str
+        Path to a file or, for Parquet and Arrow IPC, a directory of files.
+    name : str
+        Name of the stage.
+    format : str, optional
+        Format of the file, inferred from its extension if not passed.
+    sample_size : int
+        Bytes of CSV files read to infer data types.
+
+    Returns
+    -------
+    str
+        Stage file contents, ready to be written and referenced by a model.
+    """
+    format = _resolve_format(path, format)
+    columns = _named_columns(
+        infer_columns(path, format=format, sample_size=sample_size)
+    )
+
+    fields: dict[str, dict[str, Any]] = {}
+    for column, dtype in columns.items():
+        if _is_text_timestamp(dtype, format):
+            dtype_name = "datetime"
+        else:
+            dtype_name = _dtype_name(dtype)
+        if dtype_name is None:
+            logger.warning(
+                "Skipping column %r of dtype %s, which stages cannot declare.",
+                column,
+                dtype,
+            )
+            continue
+        fields[column] = {"dtype": dtype_name}
+    return yaml.safe_dump({"name": name, "schema": fields}, sort_keys=False)
+
+
+def _named_columns(columns: dict[str, DType]) -> dict[str, DType]:
+    """Return columns whose names are valid field names, warning of others."""
+    named = {}
+    for column, dtype in columns.items():
+        if column.isidentifier() and not keyword.iskeyword(column):
+            named[column] = dtype
+        else:
+            logger.warning("Skipping column %r, not a valid field name.", column)
+    return named
+
+
+def _is_text_timestamp(dtype: DType, format: str) -> bool:
+    """Whether a column holds timestamps stored as text, which must be parsed."""
+    return format == "csv" and isinstance(dtype, nw.Datetime)
+
+
+def _dtype_name(dtype: DType) -> str | None:
+    """Return name of a data type in stage files, or None if nested or decimal."""
+    if dtype.is_nested() or dtype.is_decimal():
+        return None
+    base = type(dtype)
+    return _DTYPE_NAMES.get(base, base.__name__)
@@ -1,21 +1,26 @@
 from __future__ import annotations
 from typing import Any, Sequence, Literal
 from dataclasses import dataclass, field
-from yaml import safe_load
+
+from dattrs.config.cache import load_yaml
 
 
 def parse_config(path: str):
-    with open(path) as fp:
-        config = safe_load(fp)
-    return config
+    return load_yaml(path)
 
 
 @dataclass
 class Source:
-    """Parameters for loading data from a source."""
+    """
+    Parameters for loading data from a source.
 
-    path: str
-    options: dict[str, Any]
+    Sources either read a file at `path` or the output of another model named
+    by `model`, which must then run first.
+    """
+
+    path: str | None = None
+    options: dict[str, Any] = field(default_factory=dict)
+    model: str | None = None
 
 
 @dataclass
@@ -69,6 +74,13 @@ class Stage:
             ],
         )
 
+    def compile(self) -> type:
+        """Return stage as a `dattrs` schema class, see `compile_stage`."""
+        # imported here since `dattrs.config.compile` builds on these models
+        from dattrs.config.compile import compile_stage
+
+        return compile_stage(stage=self)
+
 
 @dataclass
 class Model:
@@ -78,6 +90,14 @@ class Model:
     config: str | None = None
     sources: Sequence[Source] = field(default_factory=tuple)
     stages: Sequence[Source] = field(default_factory=tuple)
+    depends_on: Sequence[str] = field(default_factory=tuple)
+
+    @property
+    def dependencies(self) -> frozenset[str]:
+        """Names of models to run before this one, declared or used as sources."""
+        return frozenset(self.depends_on) | {
+            source.model for source in self.sources if source.model is not None
+        }
 
     def parse(self) -> Model:
         if self.config is not None:
@@ -87,9 +107,11 @@ class Model:
             config = parse_config(path=self.config)
             sources = config.get("sources")
             stages = config.get("stages")
+            depends_on = config.get("depends_on", self.depends_on)
         else:
             sources = self.sources
             stages = self.stages
+            depends_on = self.depends_on
 
         return Model(
             name=self.name,
@@ -97,11 +119,15 @@ class Model:
             sources=[
                 Source(
                     path=source.get("path"),
+                    model=source.get("model"),
                     options={
-                        key: value for key, value in source.items() if key != "path"
+                        key: value
+                        for key, value in source.items()
+                        if key not in ("path", "model")
                     },
                 )
                 for source in sources
             ],
             stages=[Stage(name=name, path=path) for name, path in stages.items()],
+            depends_on=tuple(depends_on),
         )
@@ -0,0 +1,266 @@
+import logging
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from typing import Any
+
+import narwhals as nw
+from narwhals.typing import FrameT
+
+from dattrs.config.models import Model
+from dattrs.config.sources import _SERIAL_BACKENDS, load_sources
+from dattrs.plan import compile_plan
+from dattrs.report import FieldReport, ValidationReport
+from dattrs.utils import _project
+from dattrs.validate import _count_failures, _log_report
+
+logger = logging.getLogger("dattrs")
+
+_STAGE_VALIDATION_PREFIX = "__dattrs_stage__"
+
+
+def run_model(
+    model: Model,
+    *,
+    backend: str = "polars",
+    checkpoints: Iterable[str] = (),
+    strict: bool = True,
+    outputs: Mapping[str, Any] | None = None,
+    project: bool = False,
+) -> tuple[Any, ValidationReport]:
+    """
+    Load, convert and validate a model's sources through all of its stages.
+
+    Consecutive stages are fused into a single query plan: each stage's
+    conversions are stacked onto the previous stage's, and each stage's
+    validations are evaluated as boolean columns right after its conversions.
+    All failure counts are gathered in one pass once the last stage is added,
+    meaning lazy sources are read once regardless of the number of stages.
+
+    Parameters
+    ----------
+    model : Model
+        Model to run. Parsed from its config file first if it has no sources.
+    backend : str
+        DataFrame package to load sources with, e.g. `Runtime.compute.backend`.
+    checkpoints : Iterable[str]
+        Names of stages to materialize the output of. Lazy plans are collected
+        after each checkpoint (counting validations of all stages so far) and
+        later stages start from the materialized data, e.g. to avoid
+        recomputing an expensive stage used by many later ones.
+    strict : bool
+        Whether all (True) or any (False) of a field's validators must pass.
+    outputs : Mapping[str, Any], optional
+        Outputs of models already run, keyed by model name, for sources reading
+        another model's output (see `run_models`).
+    project : bool
+        Whether to only load the source columns read by any stage's converters
+        or validators. Lazy sources then skip reading all other columns, and
+        the output only holds these columns and the stages' fields. Ignored if
+        the columns read cannot be determined, see `Plan.required_columns`.
+
+    Returns
+    -------
+    tuple[Any, ValidationReport]
+        Output of the last stage as a native frame of the backend, and the
+        outcome of each stage's validations, keyed by stage (e.g. "raw.fare").
+    """
+    if not model.sources:
+        model = model.parse()
+    checkpoints = frozenset(checkpoints)
+    unknown = checkpoints - {stage.name for stage in model.stages}
+    if unknown:
+        raise ValueError(f"Checkpoints must name stages, received: {sorted(unknown)}.")
+
+    data = nw.from_native(
+        load_sources(sources=model.sources, backend=backend, outputs=outputs)
+    )
+    stage_schemas = [stage.compile() for stage in model.stages]
+    if project:
+        data = _project(data, _stage_columns(data, stage_schemas, strict=strict))
+    fields: list[FieldReport] = []
+    flags: dict[str, tuple[str, str]] = {}
+    start = time.perf_counter()
+
+    for index, (stage, stage_schema) in enumerate(zip(model.stages, stage_schemas)):
+        data = stage_schema.convert(data)
+        queries = compile_plan(
+            schema=stage_schema,
+            columns=data.collect_schema().names(),
+            implementation=data.implementation,
+            strict=strict,
+        ).validations
+        stage_flags = {
+            f"{_STAGE_VALIDATION_PREFIX}{index}__{name}": query
+            for name, query in queries.items()
+        }
+        if stage_flags:
+            data = data.with_columns(**stage_flags)
+        flags |= {flag: (stage.name, name) for flag, name in zip(stage_flags, queries)}
+
+        if stage.name in checkpoints:
+            logger.info("Materializing checkpoint after stage %s.", stage.name)
+            if isinstance(data, nw.LazyFrame):
+                data = data.collect().lazy(backend=data.implementation)
+            data, counted = _count_stages(data, flags)
+            fields += counted
+            flags = {}
+
+    data, counted = _count_stages(data, flags)
+    fields += counted
+
+    report = ValidationReport(fields=fields, elapsed=time.perf_counter() - start)
+    _log_report(report)
+    return data.to_native(), report
+
+
+def run_models(
+    models: Sequence[Model],
+    *,
+    backend: str = "polars",
+    max_workers: int | None = None,
+    checkpoints: Mapping[str, Iterable[str]] | None = None,
+    strict: bool = True,
+    project: bool = False,
+) -> dict[str, tuple[Any, ValidationReport]]:
+    """
+    Run models concurrently, each as soon as the models it depends on are done.
+
+    Models depend on the models named in their `depends_on`, and on the models
+    whose output they read as a source. Independent models run concurrently on
+    a thread pool, since backends release the GIL while computing; DuckDB
+    models run one at a time on the calling thread.
+
+    Model outputs are passed to dependent models as-is, meaning lazy outputs
+    are recomputed by each dependent model. Checkpoint the last stage of a
+    model to materialize its output once instead.
+
+    Parameters
+    ----------
+    models : Sequence[Model]
+        Models to run, e.g. `Config.models`. Names must be unique.
+    backend : str
+        DataFrame package to load sources with, e.g. `Runtime.compute.backend`.
+    max_workers : int, optional
+        Maximum number of models run at once, e.g. `Runtime.compute.max_workers`.
+        Defaults to the thread pool's default.
+    checkpoints : Mapping[str, Iterable[str]], optional
+        Names of stages to materialize, keyed by model name.
+    strict : bool
+        Whether all (True) or any (False) of a field's validators must pass.
+    project : bool
+        Whether to only load the source columns read by each model's stages,
+        see `run_model`.
+
+    Returns
+    -------
+    dict[str, tuple[Any, ValidationReport]]
+        Output and report of each model (see `run_model`), keyed by model name
+        in the order models were passed.
+    """
+    models = [model if model.sources else model.parse() for model in models]
+    named = {model.name: model for model in models}
+    if len(named) != len(models):
+        raise ValueError("Model names must be unique.")
+    for model in models:
+        unknown = model.dependencies - set(named)
+        if unknown:
+            raise ValueError(
+                f"Model {model.name!r} depends on unknown models: {sorted(unknown)}."
+            )
+
+    checkpoints = checkpoints or {}
+    results: dict[str, tuple[Any, ValidationReport]] = {}
+
+    def _run(name: str) -> tuple[Any, ValidationReport]:
+        model = named[name]
+        logger.info("Running model %s.", name)
+        return run_model(
+            model=model,
+            backend=backend,
+            checkpoints=checkpoints.get(name, ()),
+            strict=strict,
+            project=project,
+            outputs={
+                dependency: results[dependency][0] for dependency in model.dependencies
+            },
+        )
+
+    # raises `graphlib.CycleError` if models depend on each other
+    sorter = TopologicalSorter(
+        {name: model.dependencies for name, model in named.items()}
+    )
+    sorter.prepare()
+
+    if backend in _SERIAL_BACKENDS:
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                results[name] = _run(name)
+                sorter.done(name)
+        return {name: results[name] for name in named}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                running[executor.submit(_run, name)] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                sorter.done(name)
+    return {name: results[name] for name in named}
+
+
+def _stage_columns(
+    data: FrameT, schemas: Sequence[type], strict: bool = True
+) -> frozenset[str] | None:
+    """
+    Return source columns read by the stages, None if unknown for one.
+
+    Fields a stage converts (under their alias) are no longer read from the
+    source by later stages, nor by the stage's own validators.
+    """
+    columns = set(data.collect_schema().names())
+    produced: set[str] = set()
+    required: set[str] = set()
+    for stage_schema in schemas:
+        plan = compile_plan(
+            schema=stage_schema,
+            columns=columns,
+            implementation=data.implementation,
+            strict=strict,
+        )
+        if plan.conversion_columns is None or plan.validation_columns is None:
+            return None
+        required |= plan.conversion_columns - produced
+        produced |= {fld.alias for fld in plan.fields}
+        required |= plan.validation_columns - produced
+        columns |= produced
+    return frozenset(required)
+
+
+def _count_stages(
+    data: FrameT, flags: dict[str, tuple[str, str]]
+) -> tuple[FrameT, list[FieldReport]]:
+    """Count failures of stage validation columns in one pass and drop them."""
+    if not flags:
+        return data, []
+
+    start = time.perf_counter()
+    observations, counts = _count_failures(
+        data=data, queries={flag: nw.col(flag) for flag in flags}
+    )
+    elapsed = time.perf_counter() - start
+    fields = [
+        FieldReport(
+            name=name,
+            failures=counts[flag],
+            observations=observations,
+            elapsed=elapsed,
+            stage=stage,
+        )
+        for flag, (stage, name) in flags.items()
+    ]
+    return data.drop(*flags), fields
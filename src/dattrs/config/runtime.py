@@ -28,11 +28,18 @@ class Compute:
     python_version: str = "3.10"
     package_manager: str = "uv"
     dependencies: Sequence[Dependency] = field(default_factory=tuple)
+    max_workers: int | None = None
 
     def __post_init__(self):
         for dependency in self.dependencies:
             setattr(self, f"_{dependency.category}", dependency)
 
+    @property
+    def backend(self) -> str:
+        """DataFrame package to compute with, defaulting to Polars."""
+        dataframe = getattr(self, "_dataframe", None)
+        return "polars" if dataframe is None else dataframe.package
+
 
 @dataclass
 class Runtime:
@@ -46,6 +53,7 @@ class Runtime:
         self.compute = Compute(
             python_version=self.compute.pop("python_version", None),
             package_manager=self.compute.pop("package_manager", None),
+            max_workers=self.compute.pop("max_workers", None),
             dependencies=[
                 Dependency(category=category, **dependency)
                 for category, dependency in self.compute.items()
@@ -0,0 +1,193 @@
+import os
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import narwhals as nw
+
+from dattrs.config.models import Source
+
+# file extensions recognized when a source does not declare its format
+_FORMATS: dict[str, str] = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".json": "ndjson",
+    ".jsonl": "ndjson",
+    ".ndjson": "ndjson",
+}
+
+
+def _scan_polars(path: str, format: str, **options) -> Any:
+    """Lazily scan a file as a Polars LazyFrame."""
+    import polars as pl
+
+    return getattr(pl, f"scan_{format}")(path, **options)
+
+
+def _scan_duckdb(path: str, format: str, **options) -> Any:
+    """Lazily scan a file as a DuckDB relation."""
+    import duckdb
+
+    if format == "ipc":
+        raise ValueError("DuckDB cannot scan Arrow IPC files.")
+    readers = {"csv": "read_csv", "parquet": "read_parquet", "ndjson": "read_json"}
+    return getattr(duckdb, readers[format])(path, **options)
+
+
+def _scan_dask(path: str, format: str, **options) -> Any:
+    """Lazily scan a file as a Dask DataFrame."""
+    import dask.dataframe as dd
+
+    if format == "ipc":
+        raise ValueError("Dask cannot scan Arrow IPC files.")
+    if format == "ndjson":
+        return dd.read_json(path, lines=True, **options)
+    return getattr(dd, f"read_{format}")(path, **options)
+
+
+def _read_pandas(path: str, format: str, **options) -> Any:
+    """Read a file as a pandas DataFrame."""
+    import pandas as pd
+
+    if format == "ndjson":
+        return pd.read_json(path, lines=True, **options)
+    readers = {"csv": "read_csv", "parquet": "read_parquet", "ipc": "read_feather"}
+    return getattr(pd, readers[format])(path, **options)
+
+
+def _read_pyarrow(path: str, format: str, **options) -> Any:
+    """Read a file as a PyArrow Table."""
+    if format == "csv":
+        from pyarrow.csv import read_csv as reader
+    elif format == "parquet":
+        from pyarrow.parquet import read_table as reader
+    elif format == "ipc":
+        from pyarrow.feather import read_table as reader
+    else:
+        from pyarrow.json import read_json as reader
+    return reader(path, **options)
+
+
+# backends with a lazy frame are scanned, others are read eagerly
+_SCANNERS: dict[str, Callable[..., Any]] = {
+    "polars": _scan_polars,
+    "duckdb": _scan_duckdb,
+    "dask": _scan_dask,
+    "pandas": _read_pandas,
+    "pyarrow": _read_pyarrow,
+}
+
+# DuckDB relations are bound to the connection of the thread creating them
+_SERIAL_BACKENDS: frozenset[str] = frozenset({"duckdb"})
+
+
+def load_source(
+    source: Source,
+    backend: str = "polars",
+    outputs: Mapping[str, Any] | None = None,
+) -> Any:
+    """
+    Load a single source, lazily if the backend supports it.
+
+    Parameters
+    ----------
+    source : Source
+        Source to load. Its options are passed to the backend's reader, except
+        for "format" which overrides the format inferred from the path's
+        extension.
+    backend : str
+        DataFrame package to load the source with, e.g. "polars" or "duckdb".
+    outputs : Mapping[str, Any], optional
+        Outputs of models already run, keyed by model name. Required to load
+        sources reading another model's output.
+
+    Returns
+    -------
+    Any
+        Native frame of the backend, e.g. a Polars LazyFrame.
+    """
+    if backend not in _SCANNERS:
+        raise ValueError(
+            f"Backend must be one of {list(_SCANNERS)}, received: {backend!r}."
+        )
+
+    if source.model is not None:
+        if outputs is None or source.model not in outputs:
+            raise ValueError(f"Output of model {source.model!r} is not available.")
+        return outputs[source.model]
+
+    options = dict(source.options or {})
+    format = _resolve_format(source.path, options.pop("format", None))
+    return _SCANNERS[backend](source.path, format, **options)
+
+
+def _resolve_format(path: str, format: str | None = None) -> str:
+    """Return format of a file, inferred from its extension if not passed."""
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in _FORMATS:
+            raise ValueError(
+                f"Cannot infer format of {path!r}, pass it as the source's 'format' option."
+            )
+        format = _FORMATS[extension]
+    if format not in _FORMATS.values():
+        raise ValueError(
+            f"Format must be one of {sorted(set(_FORMATS.values()))}, received: {format!r}."
+        )
+    return format
+
+
+def load_sources(
+    sources: Sequence[Source],
+    backend: str = "polars",
+    *,
+    outputs: Mapping[str, Any] | None = None,
+    max_workers: int | None = None,
+) -> Any:
+    """
+    Load and concatenate sources of a model.
+
+    Sources are loaded concurrently on a thread pool, except for DuckDB whose
+    relations are created on the calling thread. With lazy backends, only
+    each file's schema is inspected up front and the concatenation stays lazy,
+    meaning no data is read (or copied) until the result is collected.
+
+    Parameters
+    ----------
+    sources : Sequence[Source]
+        Sources to load. All sources must share the same columns.
+    backend : str
+        DataFrame package to load sources with, e.g. `Runtime.compute.backend`.
+    outputs : Mapping[str, Any], optional
+        Outputs of models already run, keyed by model name.
+    max_workers : int, optional
+        Maximum number of sources loaded at once. Defaults to the thread pool's
+        default.
+
+    Returns
+    -------
+    Any
+        Native frame of the backend, e.g. a Polars LazyFrame.
+    """
+    if not sources:
+        raise ValueError("Must pass at least one source.")
+
+    if len(sources) == 1:
+        return load_source(sources[0], backend=backend, outputs=outputs)
+
+    def _load(source: Source) -> Any:
+        return load_source(source, backend=backend, outputs=outputs)
+
+    if backend in _SERIAL_BACKENDS:
+        frames = [_load(source) for source in sources]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(_load, sources))
+    return nw.concat(
+        [nw.from_native(frame) for frame in frames], how="vertical"
+    ).to_native()
@@ -1,51 +1,137 @@
+from collections.abc import Sequence
+
 import attrs
 from attrs import Attribute, NOTHING
 
 import narwhals as nw
-from narwhals.typing import DataFrameT, IntoDataFrameT
+from narwhals.typing import FrameT, IntoFrameT
 from narwhals.utils import Implementation
 
-from dattrs.utils import _proxy_native_to_narwhals_dtype
+from dattrs.engine import INDEX_COLUMN, _to_engine
+from dattrs.hooks import Hooks, _profile_fields, _resolve_hooks, _stage
+from dattrs.plan import Plan, compile_plan
+from dattrs.utils import _project, _proxy_native_to_narwhals_dtype, _to_native_like
 
 
 def convert(
-    schema: type, data: IntoDataFrameT, *, strict: bool = False, fill_null: bool = False
-) -> DataFrameT:
+    schema: type,
+    data: IntoFrameT,
+    *,
+    strict: bool = False,
+    fill_null: bool = False,
+    project: bool = False,
+    engine: str | None = None,
+    hooks: Sequence[Hooks] = (),
+) -> FrameT:
     """
     Run class-defined transformations against a DataFrame.
 
+    Lazy inputs (e.g. Polars LazyFrame, DuckDB relation) are never collected;
+    transformations are added to the query plan and a lazy result is returned.
+    Expressions are compiled once per input column set and backend, see
+    `dattrs.plan.compile_plan`.
+
     Parameters
     ----------
     schema : type
         An attrs-like class.
-    data : IntoDataFrameT
-        An object that can be converted to a Narwhals DataFrame.
+    data : IntoFrameT
+        An object that can be converted to a Narwhals DataFrame or LazyFrame.
     strict : bool
         Whether to return all fields or only fields specified in `schema`.
     fill_null : bool
         Whether to fill null values with the field's default value.
+    project : bool
+        Whether to drop input columns not read by any converter before
+        converting, letting lazy inputs skip reading them (e.g. unused columns
+        of a Parquet scan). Only applies if `strict` is False, since strict
+        conversions only select the schema's fields already. Ignored if the
+        columns read cannot be determined, see `Plan.conversion_columns`;
+        this requires Polars, through which expressions are inspected.
+    engine : str, optional
+        Eager backend to run the conversion on, e.g. "polars" for pandas
+        inputs. Data is moved there and back through Arrow, without copying
+        buffers Arrow can share, keeping pandas indexes and dtype backends.
+        Ignored for lazy inputs.
+    hooks : Sequence[Hooks]
+        Hooks to call around the conversion and each field, in addition to
+        registered hooks. See `dattrs.hooks`.
 
     Returns
     -------
-    DataFrameT
+    FrameT
         The `data` in its original backend with transformations applied.
     """
     assert attrs.has(schema)
 
-    data = nw.from_native(data)
-    queries = (
-        _convert_field(
-            fld=fld,
-            exists=fld.name in data.columns,
-            implementation=data.implementation,
-            fill_null=fill_null,
-        )
-        for fld in attrs.fields(schema)
+    _data, restore = _to_engine(nw.from_native(data), engine)
+    plan = compile_plan(
+        schema=schema,
+        columns=_data.collect_schema().names(),
+        implementation=_data.implementation,
+        fill_null=fill_null,
     )
+    queries = plan.conversions
+    if project and not strict:
+        _data = _project(_data, plan.conversion_columns, keep=(INDEX_COLUMN,))
+
+    hooks = _resolve_hooks(schema, hooks)
+    if not hooks:
+        return _to_native_like(restore(_apply_conversions(_data, plan, strict)), data)
+
+    with _stage(hooks, name="convert", schema=schema, data=_data):
+        output = _apply_conversions(_data, plan, strict)
+    _profile_conversions(hooks, schema=schema, data=_data, queries=queries)
+    return _to_native_like(restore(output), data)
 
-    if strict:
-        return data.select(*queries).to_native()
-    return data.with_columns(*queries).to_native()
+
+def _apply_conversions(data: FrameT, plan: Plan, strict: bool) -> FrameT:
+    """
+    Add (or, if `strict`, select) converted fields.
+
+    Fields converted identically to an earlier field are copied from it
+    rather than evaluated again, see `Plan.conversion_copies`. Strict
+    conversions keep the `INDEX_COLUMN` of frames moved to another engine.
+    """
+    keep = [INDEX_COLUMN] if INDEX_COLUMN in plan.columns else []
+    copies = plan.conversion_copies
+    if not copies:
+        if strict:
+            return data.select(*plan.conversions, *keep)
+        return data.with_columns(*plan.conversions)
+
+    aliases = [fld.alias for fld in plan.fields]
+    names = keep if strict else data.collect_schema().names()
+    output = data.with_columns(
+        *(
+            query
+            for alias, query in zip(aliases, plan.conversions)
+            if alias not in copies
+        )
+    ).with_columns(**{alias: nw.col(source) for alias, source in copies.items()})
+    return output.select(*names, *(alias for alias in aliases if alias not in names))
+
+
+def _profile_conversions(
+    hooks: tuple[Hooks, ...],
+    schema: type,
+    data: FrameT,
+    queries: tuple[nw.Expr, ...],
+) -> None:
+    """Emit field events timing each field's conversion on its own."""
+
+    def evaluate(data: FrameT, query: nw.Expr) -> int:
+        output = data.select(query)
+        return len(output.collect() if isinstance(output, nw.LazyFrame) else output)
+
+    _profile_fields(
+        hooks,
+        stage="convert",
+        schema=schema,
+        data=data,
+        queries={fld.name: query for fld, query in zip(attrs.fields(schema), queries)},
+        evaluate=evaluate,
+    )
 
 
 def _convert_field(
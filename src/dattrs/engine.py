@@ -0,0 +1,166 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import narwhals as nw
+from narwhals.typing import FrameT
+from narwhals.utils import Implementation
+
+# column carrying the position of each observation of pandas-like frames moved
+# to another engine, from which their index is restored
+INDEX_COLUMN: str = "__dattrs_index__"
+
+
+def _identity_function(data: FrameT) -> FrameT:
+    return data
+
+
+def _to_engine(
+    data: FrameT, engine: str | None = None
+) -> tuple[FrameT, Callable[[FrameT], FrameT]]:
+    """
+    Move an eager frame to another eager backend to run plans there.
+
+    Frames are exchanged through the Arrow PyCapsule (C stream) interface,
+    meaning buffers Arrow can share (e.g. numeric columns without nulls) are
+    not copied. Backends not exporting Arrow streams are converted with
+    `to_arrow` instead. Lazy frames and frames already in `engine` are left
+    as they are.
+
+    pandas-like indexes do not survive the exchange, so the position of each
+    observation is carried in `INDEX_COLUMN` instead, which selections must
+    keep (e.g. strict conversions). Outputs are indexed by the labels at
+    these positions, meaning observations keep their labels through filters.
+
+    Parameters
+    ----------
+    data : FrameT
+        A Narwhals DataFrame or LazyFrame.
+    engine : str, optional
+        Eager backend to run plans on, e.g. "polars" or "pyarrow".
+
+    Returns
+    -------
+    tuple[FrameT, Callable[[FrameT], FrameT]]
+        The frame in `engine`, and a function moving outputs back to the
+        original backend. Outputs having dropped `INDEX_COLUMN` (e.g. through
+        hooks) keep the original index if of the same length, and are reset
+        otherwise. pandas columns keep the dtype backend (NumPy, nullable or
+        PyArrow) of the input column of the same name.
+    """
+    if engine is None or not isinstance(data, nw.DataFrame):
+        return data, _identity_function
+
+    implementation = Implementation.from_backend(engine)
+    if not (
+        implementation.is_polars()
+        or implementation.is_pyarrow()
+        or implementation.is_pandas_like()
+    ):
+        raise ValueError(
+            f"Engine must be an eager backend (e.g. 'polars', 'pyarrow'), received: {engine!r}."
+        )
+    if implementation is data.implementation:
+        return data, _identity_function
+
+    original = data.implementation
+    native = data.to_native()
+    if original.is_pandas_like():
+        # Arrow exports of pandas frames hold non-default indexes as columns
+        data = nw.from_native(native.reset_index(drop=True)).with_row_index(
+            INDEX_COLUMN
+        )
+
+    def _restore(output: FrameT) -> FrameT:
+        if isinstance(output, nw.LazyFrame):
+            output = output.collect()
+        positions = None
+        if INDEX_COLUMN in output.columns:
+            positions = output[INDEX_COLUMN].to_numpy()
+            output = output.drop(INDEX_COLUMN)
+
+        if original.is_pandas():
+            restored = nw.from_native(_to_pandas(output, native.dtypes))
+        else:
+            restored = nw.from_arrow(_arrow_stream(output), backend=original)
+        if original.is_pandas_like():
+            if positions is not None:
+                index = native.index.take(positions)
+            elif len(restored) == len(native):
+                index = native.index
+            else:
+                return restored
+            restored = nw.from_native(restored.to_native().set_axis(index))
+        return restored
+
+    return nw.from_arrow(_arrow_stream(data), backend=implementation), _restore
+
+
+def _arrow_stream(data: nw.DataFrame) -> object:
+    """Return native frame if it exports an Arrow C stream, else a PyArrow Table."""
+    native = data.to_native()
+    return native if hasattr(native, "__arrow_c_stream__") else data.to_arrow()
+
+
+def _to_pandas(data: nw.DataFrame, dtypes: Any) -> Any:
+    """
+    Return a pandas DataFrame of `data`, keeping the dtype backends of `dtypes`.
+
+    Each column is converted with the dtype backend of the column of the same
+    name in `dtypes`, e.g. nullable `Float64` rather than NumPy `float64`.
+    Other columns take the dtype backend shared by all of `dtypes`, if any.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    backends = {name: _dtype_backend(dtype) for name, dtype in dtypes.items()}
+    shared = set(backends.values())
+    default = shared.pop() if len(shared) == 1 else None
+
+    table = pa.table(_arrow_stream(data))
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        backend = backends.get(name, default)
+        if backend == "pyarrow":
+            mapper = pd.ArrowDtype
+        elif backend == "numpy_nullable":
+            mapper = _nullable_dtypes().get
+        else:
+            mapper = None
+        columns[name] = column.to_pandas(types_mapper=mapper)
+    return pd.DataFrame(columns, index=pd.RangeIndex(table.num_rows))
+
+
+def _dtype_backend(dtype: Any) -> str | None:
+    """Return pandas dtype backend of `dtype`, or None if NumPy (or unknown)."""
+    import pandas as pd
+
+    if isinstance(dtype, pd.ArrowDtype):
+        return "pyarrow"
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and dtype.na_value is pd.NA:
+        return "numpy_nullable"
+    return None
+
+
+@functools.cache
+def _nullable_dtypes() -> dict[Any, Any]:
+    """Return pandas nullable dtypes of Arrow types, like `dtype_backend="numpy_nullable"`."""
+    import pandas as pd
+    import pyarrow as pa
+
+    return {
+        pa.int8(): pd.Int8Dtype(),
+        pa.int16(): pd.Int16Dtype(),
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.uint8(): pd.UInt8Dtype(),
+        pa.uint16(): pd.UInt16Dtype(),
+        pa.uint32(): pd.UInt32Dtype(),
+        pa.uint64(): pd.UInt64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+        pa.float32(): pd.Float32Dtype(),
+        pa.float64(): pd.Float64Dtype(),
+        pa.string(): pd.StringDtype(),
+        pa.large_string(): pd.StringDtype(),
+        pa.string_view(): pd.StringDtype(),
+    }
@@ -0,0 +1,276 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import narwhals as nw
+from attrs import define
+from narwhals.typing import FrameT
+
+
+@define
+class Event:
+    """
+    Timing of a stage (e.g. "convert", "validate") or of a field within one.
+
+    Parameters
+    ----------
+    kind : str
+        Either "stage" or "field".
+    name : str
+        Name of the stage or field.
+    schema : str
+        Name of the schema class.
+    backend : str
+        DataFrame backend, e.g. "polars".
+    stage : str, optional
+        Stage a field was evaluated for.
+    rows : int, optional
+        Number of rows processed, if known without an extra pass over the data
+        (e.g. not for conversions of lazy frames).
+    start : float
+        Value of `time.perf_counter` when the event started.
+    elapsed : float, optional
+        Seconds spent, only defined once the event ended.
+    """
+
+    kind: str
+    name: str
+    schema: str
+    backend: str
+    stage: str | None = None
+    rows: int | None = None
+    start: float = 0.0
+    elapsed: float | None = None
+
+
+class Hooks:
+    """
+    Callbacks invoked before and after each stage and field.
+
+    Subclass and override any of the methods, then register instances for all
+    schemas with `add_hooks`, for one schema with a `__dattrs_hooks__` class
+    attribute, or for one call with the `hooks` argument of `convert`,
+    `validate` or `pipe`. Nothing is timed or emitted unless hooks are
+    registered.
+
+    Stages run as single fused queries, meaning a field's share of a stage
+    cannot be measured within it. Only stage events are emitted by default.
+    Set `fields` to True to also receive field events, which time a separate
+    re-run of each field's converter or validator on its own after the stage
+    ran: each costs one extra pass over the data and measures the field in
+    isolation, not its share of the real (fused) run.
+    """
+
+    fields: bool = False
+
+    def before_stage(self, event: Event) -> None:
+        """Called before a stage runs."""
+
+    def after_stage(self, event: Event) -> None:
+        """Called after a stage ran, with `elapsed` and (if known) `rows` set."""
+
+    def before_field(self, event: Event) -> None:
+        """Called before a field is evaluated on its own."""
+
+    def after_field(self, event: Event) -> None:
+        """Called after a field was evaluated, with `elapsed` and `rows` set."""
+
+
+_HOOKS: tuple[Hooks, ...] = ()
+_HOOKS_LOCK = threading.Lock()
+
+# set while a stage runs steps that would otherwise emit events of their own
+_SUPPRESSED: ContextVar[bool] = ContextVar("dattrs_hooks_suppressed", default=False)
+
+
+def add_hooks(hooks: Hooks) -> None:
+    """Register hooks for all schemas."""
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = (*_HOOKS, hooks)
+
+
+def remove_hooks(hooks: Hooks) -> None:
+    """Unregister hooks previously passed to `add_hooks`."""
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = tuple(registered for registered in _HOOKS if registered is not hooks)
+
+
+class TraceCollector(Hooks):
+    """
+    Hooks recording every event, exportable as a Chrome trace.
+
+    Traces can be opened with `chrome://tracing` or https://ui.perfetto.dev.
+
+    Parameters
+    ----------
+    fields : bool
+        Whether to re-run each field to record field events, see `Hooks`.
+    """
+
+    def __init__(self, fields: bool = False):
+        self.fields = fields
+        self.events: list[Event] = []
+        self._lock = threading.Lock()
+
+    def after_stage(self, event: Event) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def after_field(self, event: Event) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return recorded events in Chrome's trace event format."""
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name
+                    if event.stage is None
+                    else f"{event.stage}.{event.name}",
+                    "cat": event.kind,
+                    "ph": "X",
+                    "ts": event.start * 1e6,
+                    "dur": event.elapsed * 1e6,
+                    "pid": os.getpid(),
+                    "tid": event.schema,
+                    "args": {
+                        "schema": event.schema,
+                        "backend": event.backend,
+                        "rows": event.rows,
+                    },
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def save(self, path: str) -> None:
+        """Write recorded events to `path` as a Chrome trace."""
+        with open(path, mode="w") as fp:
+            json.dump(self.to_chrome_trace(), fp)
+
+
+@contextmanager
+def profile(
+    path: str | None = None, *, fields: bool = False
+) -> Iterator[TraceCollector]:
+    """
+    Record events of all schemas within the block.
+
+    Parameters
+    ----------
+    path : str, optional
+        File to write the Chrome trace to when the block exits.
+    fields : bool
+        Whether to re-run each field to record field events, see `Hooks`.
+
+    Returns
+    -------
+    Iterator[TraceCollector]
+        Collector of the block's events.
+    """
+    collector = TraceCollector(fields=fields)
+    add_hooks(collector)
+    try:
+        yield collector
+    finally:
+        remove_hooks(collector)
+        if path is not None:
+            collector.save(path)
+
+
+def _resolve_hooks(schema: type, hooks: Sequence[Hooks] = ()) -> tuple[Hooks, ...]:
+    """Return global, schema-level and call-level hooks, in that order."""
+    if _SUPPRESSED.get():
+        return ()
+    return (*_HOOKS, *getattr(schema, "__dattrs_hooks__", ()), *hooks)
+
+
+@contextmanager
+def _suppress_hooks() -> Iterator[None]:
+    """Silence hooks of nested steps, e.g. the conversion within `pipe`."""
+    token = _SUPPRESSED.set(True)
+    try:
+        yield
+    finally:
+        _SUPPRESSED.reset(token)
+
+
+@contextmanager
+def _stage(
+    hooks: tuple[Hooks, ...], name: str, schema: type, data: FrameT
+) -> Iterator[Event]:
+    """
+    Emit events around a stage; callers may set the yielded event's `rows`.
+
+    The stage is closed even if it raises, so that every `before_stage` is
+    matched by an `after_stage`.
+    """
+    event = Event(
+        kind="stage",
+        name=name,
+        schema=schema.__name__,
+        backend=data.implementation.value,
+        rows=len(data) if isinstance(data, nw.DataFrame) else None,
+    )
+    for hook in hooks:
+        hook.before_stage(event)
+    event.start = time.perf_counter()
+    try:
+        yield event
+    finally:
+        event.elapsed = time.perf_counter() - event.start
+        for hook in hooks:
+            hook.after_stage(event)
+
+
+def _field_hooks(hooks: tuple[Hooks, ...]) -> tuple[Hooks, ...]:
+    """Return hooks opted in to field events, see `Hooks.fields`."""
+    return tuple(hook for hook in hooks if hook.fields)
+
+
+def _profile_fields(
+    hooks: tuple[Hooks, ...],
+    stage: str,
+    schema: type,
+    data: FrameT,
+    queries: dict[str, nw.Expr],
+    evaluate: Callable[[FrameT, nw.Expr], int],
+) -> None:
+    """
+    Emit events around evaluating each query on its own, for opted-in hooks.
+
+    Each query is a separate pass over `data`, after the stage ran.
+
+    Parameters
+    ----------
+    evaluate : Callable[[FrameT, nw.Expr], int]
+        Function evaluating a query against `data`, returning number of rows.
+    """
+    hooks = _field_hooks(hooks)
+    if not hooks:
+        return
+
+    for name, query in queries.items():
+        event = Event(
+            kind="field",
+            name=name,
+            schema=schema.__name__,
+            backend=data.implementation.value,
+            stage=stage,
+        )
+        for hook in hooks:
+            hook.before_field(event)
+        event.start = time.perf_counter()
+        event.rows = evaluate(data, query)
+        event.elapsed = time.perf_counter() - event.start
+        for hook in hooks:
+            hook.after_field(event)
@@ -0,0 +1,391 @@
+import functools
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import re
+import struct
+import sys
+import sysconfig
+import tempfile
+from collections.abc import Callable, Iterable
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType, ModuleType
+from typing import Any, Literal
+
+import attrs
+import narwhals as nw
+from attrs import Attribute
+from narwhals.typing import IntoFrameT
+
+from dattrs.plan import _expression_key
+from dattrs.report import ValidationReport
+from dattrs.validate import _field_validators, _log_report, _validate
+
+logger = logging.getLogger("dattrs")
+
+# memory addresses in representations, e.g. "<object at 0x7f...>"
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+# directories of the standard library and installed packages
+_INSTALL_DIRECTORIES = frozenset(
+    sysconfig.get_path(name) for name in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+class ValidationCache:
+    """
+    Persistent store of validation reports, keyed by schema and partition.
+
+    Reports are kept in one JSON file per schema hash under `directory`, mapping
+    each partition's path to its latest fingerprint and serialized report.
+    Files thereby hold one entry per partition, however often each changes.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to store reports in. Created if it does not exist.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, key: str) -> dict[str, Any]:
+        if key not in self._entries:
+            try:
+                with open(self._path(key), mode="r") as fp:
+                    entries = json.load(fp)
+            except (FileNotFoundError, json.JSONDecodeError):
+                entries = {}
+            # entries of other layouts are dropped rather than kept forever
+            self._entries[key] = {
+                partition: entry
+                for partition, entry in entries.items()
+                if isinstance(entry, dict) and {"fingerprint", "report"} <= set(entry)
+            }
+        return self._entries[key]
+
+    def get(
+        self, key: str, partition: str, fingerprint: str
+    ) -> ValidationReport | None:
+        """Return cached report of a partition, if its fingerprint matches."""
+        entry = self._load(key).get(os.path.abspath(partition))
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return ValidationReport.from_dict(entry["report"])
+
+    def set(
+        self, key: str, partition: str, fingerprint: str, report: ValidationReport
+    ) -> None:
+        """
+        Cache report of a partition, replacing any earlier one.
+
+        Call `save` to persist it.
+        """
+        self._load(key)[os.path.abspath(partition)] = {
+            "fingerprint": fingerprint,
+            "report": json.loads(report.to_json()),
+        }
+
+    def save(self, key: str) -> None:
+        """Atomically persist cached reports of a schema to disk."""
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=self.directory, suffix=".tmp", delete=False
+        ) as fp:
+            json.dump(self._load(key), fp)
+        os.replace(fp.name, self._path(key))
+
+
+def validate_partitions(
+    schema: type,
+    partitions: Iterable[str],
+    *,
+    reader: Callable[[str], IntoFrameT],
+    cache: str | ValidationCache,
+    fingerprint: Literal["stat", "footer"] = "stat",
+    **configuration,
+) -> ValidationReport:
+    """
+    Validate partitioned data, skipping partitions validated before.
+
+    Each partition is identified by a fingerprint of its file and the schema by
+    a hash of its fields, validators (including the module globals and closure
+    variables they read) and validation options. Partitions whose fingerprint
+    is cached for the schema are not read; their earlier reports are merged
+    into the result instead. If a validator cannot be hashed consistently
+    across processes (e.g. it reads an object only represented by its memory
+    address), all partitions are validated and nothing is cached.
+
+    Parameters
+    ----------
+    schema : type
+        An attrs-like class.
+    partitions : Iterable[str]
+        Paths to partition files.
+    reader : Callable[[str], IntoFrameT]
+        Function reading a partition, e.g. `polars.scan_parquet`.
+    cache : str | ValidationCache
+        Cache, or directory to store the cache in.
+    fingerprint : Literal["stat", "footer"]
+        How to fingerprint partitions: "stat" uses the file's path, size and
+        modification time, "footer" uses the file's path and a hash of its
+        Parquet footer (falling back to "stat" for other files). Footers hold
+        row counts and column statistics, meaning rewriting a file in place is
+        detected without relying on modification times.
+    **configuration
+        Keyword arguments passed to `validate`.
+
+    Returns
+    -------
+    ValidationReport
+        Outcome of each validated field, merged across all partitions.
+    """
+    assert attrs.has(schema)
+
+    cache = cache if isinstance(cache, ValidationCache) else ValidationCache(cache)
+    key = _schema_hash(schema=schema, configuration=configuration)
+    if key is None:
+        logger.warning(
+            "Cannot fingerprint validators of %s, validating all partitions.",
+            schema.__qualname__,
+        )
+
+    report, skipped = ValidationReport(), 0
+    for path in partitions:
+        partition_report = None
+        if key is not None:
+            partition = _fingerprint(path=path, method=fingerprint)
+            partition_report = cache.get(key, path, partition)
+        if partition_report is None:
+            partition_report = _validate(
+                schema=schema, data=reader(path), **configuration
+            )
+            if key is not None:
+                cache.set(key, path, partition, partition_report)
+        else:
+            skipped += 1
+            # time was spent in an earlier run, not this one
+            partition_report.elapsed = 0.0
+            for fld in partition_report.fields:
+                fld.elapsed = 0.0
+        report = report.merge(
+            partition_report,
+            max_examples=configuration.get("max_examples"),
+            confidence=configuration.get("confidence", 0.95),
+        )
+    if key is not None:
+        cache.save(key)
+
+    logger.info("Skipped %s unchanged partition(s).", skipped)
+    _log_report(report)
+    return report
+
+
+def _fingerprint(path: str, method: Literal["stat", "footer"] = "stat") -> str:
+    """Return identifier of a partition's contents."""
+    if method == "footer":
+        with open(path, mode="rb") as fp:
+            fp.seek(0, os.SEEK_END)
+            size = fp.tell()
+            if size >= 12:
+                fp.seek(size - 8)
+                length, magic = struct.unpack("<I4s", fp.read(8))
+                if magic == b"PAR1" and length <= size - 12:
+                    fp.seek(size - 8 - length)
+                    footer = hashlib.sha256(fp.read(length)).hexdigest()
+                    return f"{os.path.abspath(path)}:{footer}"
+    elif method != "stat":
+        raise ValueError(f"Unknown fingerprint method: {method}.")
+
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _schema_hash(schema: type, configuration: dict[str, Any]) -> str | None:
+    """
+    Return hash of everything that determines a schema's validation outcome.
+
+    Returns None if any validator or option has no representation stable
+    across processes (see `_value_fingerprint`), meaning results cannot be
+    safely reused.
+    """
+    fingerprints = [_field_fingerprint(fld) for fld in attrs.fields(schema)]
+    options = _value_fingerprint(configuration)
+    if options is None or any(fingerprint is None for fingerprint in fingerprints):
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(f"{schema.__module__}.{schema.__qualname__}".encode())
+    for fingerprint in fingerprints:
+        digest.update(fingerprint.encode())
+    digest.update(repr(options).encode())
+    return digest.hexdigest()
+
+
+def _field_fingerprint(fld: Attribute) -> str | None:
+    """Return stable representation of a field's validation, if any."""
+    validators = () if fld.validator is None else tuple(_field_validators(fld))
+    fingerprint = _value_fingerprint((fld.name, fld.alias, fld.type, validators))
+    return None if fingerprint is None else repr(fingerprint)
+
+
+def _value_fingerprint(value: Any, seen: set[int] | None = None) -> Any:
+    """
+    Return representation of a value that is stable across processes.
+
+    Functions are represented by their code, closure, defaults and the module
+    globals they read, recursively; functions of installed packages and of the
+    standard library by their qualified name and package version. Returns None
+    if the value (or any part of it) is only represented by its identity,
+    e.g. objects whose `repr` holds a memory address. Narwhals expressions are
+    represented by their structure, see `_expression_key`.
+    """
+    seen = set() if seen is None else seen
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if isinstance(value, (tuple, list, set, frozenset, dict)):
+        items = value.items() if isinstance(value, dict) else value
+        parts = [_value_fingerprint(item, seen) for item in items]
+        if any(part is None for part in parts):
+            return None
+        if isinstance(value, (set, frozenset, dict)):
+            parts = sorted(parts, key=repr)
+        return (type(value).__name__, tuple(parts))
+    if isinstance(value, ModuleType):
+        return ("module", value.__name__)
+    if isinstance(value, type):
+        return ("class", value.__module__, value.__qualname__)
+    if isinstance(value, functools.partial):
+        return _combine(
+            "partial",
+            _value_fingerprint(value.func, seen),
+            _value_fingerprint(value.args, seen),
+            _value_fingerprint(value.keywords, seen),
+        )
+    if isinstance(value, MethodType):
+        return _combine(
+            "method",
+            _value_fingerprint(value.__func__, seen),
+            _value_fingerprint(value.__self__, seen),
+        )
+    if isinstance(value, FunctionType):
+        return _function_fingerprint(value, seen)
+    if isinstance(value, nw.Expr):
+        return _combine("expression", _expression_key(value))
+    if isinstance(value, BuiltinFunctionType):
+        module = getattr(value, "__module__", None)
+        # methods of builtin types are bound to an instance (e.g. `{}.get`)
+        bound = getattr(value, "__self__", None)
+        owner = None
+        if bound is not None and not isinstance(bound, ModuleType):
+            owner = _value_fingerprint(bound, seen)
+            if owner is None:
+                return None
+        return (
+            "builtin",
+            module,
+            value.__qualname__,
+            _package_version(module),
+            owner,
+        )
+
+    representation = repr(value)
+    if _ADDRESS.search(representation):
+        return None
+    return (type(value).__module__, type(value).__qualname__, representation)
+
+
+def _function_fingerprint(func: FunctionType, seen: set[int]) -> Any:
+    """Return stable representation of a function, see `_value_fingerprint`."""
+    name = (func.__module__, func.__qualname__)
+    if _is_installed(func.__module__):
+        return ("function", *name, _package_version(func.__module__))
+    if id(func) in seen:
+        # functions met before are represented by their first fingerprint
+        return ("function", *name)
+    seen.add(id(func))
+
+    cells = []
+    for cell in func.__closure__ or ():
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:
+            # cell of a variable not assigned yet
+            cells.append(None)
+    names = sorted(_global_names(func.__code__) & func.__globals__.keys())
+    return _combine(
+        "function",
+        *name,
+        _code_fingerprint(func.__code__),
+        _value_fingerprint(tuple(cells), seen),
+        _value_fingerprint(func.__defaults__, seen),
+        _value_fingerprint(func.__kwdefaults__, seen),
+        *(
+            _combine(key, _value_fingerprint(func.__globals__[key], seen))
+            for key in names
+        ),
+    )
+
+
+def _combine(*parts: Any) -> tuple | None:
+    """Return parts as a fingerprint, or None if any part is unknown."""
+    return None if any(part is None for part in parts) else parts
+
+
+def _global_names(code: CodeType) -> frozenset[str]:
+    """Return names a code object (or any nested code object) may read."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return frozenset(names)
+
+
+@functools.cache
+def _is_installed(module: str | None) -> bool:
+    """Whether a module is part of the standard library or an installed package."""
+    if module is None:
+        return False
+    if module.partition(".")[0] in sys.stdlib_module_names:
+        return True
+    path = getattr(sys.modules.get(module), "__file__", None)
+    if path is None:
+        return False
+    path = os.path.realpath(path)
+    return any(
+        path.startswith(os.path.realpath(directory) + os.sep)
+        for directory in _INSTALL_DIRECTORIES
+    )
+
+
+@functools.cache
+def _package_version(module: str | None) -> str | None:
+    """Return version of the distribution providing a module, if known."""
+    if module is None:
+        return None
+    package = module.partition(".")[0]
+    if package in sys.stdlib_module_names:
+        return sys.version
+    for distribution in importlib.metadata.packages_distributions().get(package, ()):
+        try:
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+def _code_fingerprint(code: CodeType) -> tuple:
+    """Return representation of a code object, excluding memory addresses."""
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            _code_fingerprint(const) if isinstance(const, CodeType) else repr(const)
+            for const in code.co_consts
+        ),
+    )
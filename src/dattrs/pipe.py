@@ -0,0 +1,322 @@
+import time
+from collections.abc import Sequence
+
+import attrs
+import narwhals as nw
+from narwhals.typing import FrameT, IntoFrameT
+
+from dattrs.convert import _profile_conversions
+from dattrs.engine import INDEX_COLUMN, _to_engine
+from dattrs.hooks import (
+    Hooks,
+    _field_hooks,
+    _resolve_hooks,
+    _stage,
+    _suppress_hooks,
+)
+from dattrs.plan import compile_plan
+from dattrs.quarantine import (
+    FAILURES_COLUMN,
+    _failure_masks,
+    _mask_columns,
+    _split,
+)
+from dattrs.report import FieldReport, ValidationReport
+from dattrs.utils import _project, _to_native_like
+from dattrs.validate import (
+    _attach_examples,
+    _count_failures,
+    _evaluate,
+    _log_report,
+    _profile_validations,
+)
+
+_PRE_VALIDATION_PREFIX = "__dattrs_pre__"
+_POST_VALIDATION_PREFIX = "__dattrs_post__"
+
+# hooks free to change any column around the conversion
+_CONVERT_HOOKS = ("__dattrs_pre_convert__", "__dattrs_post_convert__")
+
+# validation options that evaluate fields separately and cannot be fused
+_UNFUSED_OPTIONS = ("fail_fast", "sample", "workers")
+
+
+def pipe(
+    schema: type,
+    data: IntoFrameT,
+    *,
+    convert_options: dict | None = None,
+    validate_options: dict | None = None,
+    return_report: bool = False,
+    quarantine: bool = False,
+    hooks: Sequence[Hooks] = (),
+) -> FrameT | tuple[FrameT, ...]:
+    """
+    Convert and validate data as a single query plan.
+
+    Pre-convert validations are evaluated as boolean columns alongside the
+    input, the converted fields are added to the same plan and post-convert
+    validations are evaluated against its output. All failure counts are then
+    gathered in one `select`, meaning lazy inputs are collected exactly once.
+    Since pre-convert validations are counted on the output, convert hooks that
+    filter observations also filter them from pre-convert counts.
+
+    Parameters
+    ----------
+    schema : type
+        A `dattrs` schema class.
+    data : IntoFrameT
+        An object that can be converted to a Narwhals DataFrame or LazyFrame.
+    convert_options : dict, optional
+        Keyword arguments passed to the schema's `convert` method. If "project"
+        is set, input columns read by neither converters nor validators are
+        dropped up front, unless the schema defines a pre-convert hook.
+    validate_options : dict, optional
+        Keyword arguments used to configure validation. An "engine" passed in
+        either options runs the whole pipe on that eager backend, see
+        `dattrs.convert.convert`.
+    return_report : bool
+        Whether to return the validation report alongside the data.
+    quarantine : bool
+        Whether to split the converted data into observations passing all
+        post-convert validations and observations failing any, flagged in a
+        bitmask column (see `dattrs.quarantine`). Bitmasks are computed from
+        the same validation columns as the failure counts, and lazy inputs are
+        collected once, meaning neither output scans the input again.
+    hooks : Sequence[Hooks]
+        Hooks to call around the pipe and each field, in addition to registered
+        hooks. Field events time each field's conversion against the input and
+        validation against the output. See `dattrs.hooks`.
+
+    Returns
+    -------
+    FrameT | tuple[FrameT, ...]
+        The converted `data` in its original backend (or, if `quarantine`, its
+        valid and rejected observations) and, if `return_report`, the outcome
+        of pre- ("pre") and post-convert ("post") validations.
+    """
+    assert attrs.has(schema)
+
+    convert_options = dict(convert_options or {})
+    validate_options = dict(validate_options or {})
+    engine = convert_options.pop("engine", None)
+    engine = validate_options.pop("engine", None) or engine
+    _data, restore = _to_engine(nw.from_native(data), engine)
+
+    hooks = _resolve_hooks(schema, hooks)
+    if not hooks:
+        output, report = _pipe(
+            schema=schema,
+            data=_data,
+            convert_options=convert_options,
+            validate_options=validate_options,
+            quarantine=quarantine,
+        )
+    else:
+        output, report = _profile_pipe(
+            hooks,
+            schema=schema,
+            data=_data,
+            convert_options=convert_options,
+            validate_options=validate_options,
+            quarantine=quarantine,
+        )
+    _log_report(report)
+
+    outputs = _split(output, FAILURES_COLUMN) if quarantine else (output,)
+    outputs = tuple(_to_native_like(restore(output), data) for output in outputs)
+    if return_report:
+        return (*outputs, report)
+    return outputs if quarantine else outputs[0]
+
+
+def _profile_pipe(
+    hooks: tuple[Hooks, ...],
+    schema: type,
+    data: IntoFrameT,
+    *,
+    convert_options: dict | None = None,
+    validate_options: dict | None = None,
+    quarantine: bool = False,
+) -> tuple[FrameT, ValidationReport]:
+    """Run `_pipe` while emitting stage and field events."""
+    _data = nw.from_native(data)
+    with (
+        _stage(hooks, name="pipe", schema=schema, data=_data) as event,
+        _suppress_hooks(),
+    ):
+        output, report = _pipe(
+            schema=schema,
+            data=_data,
+            convert_options=convert_options,
+            validate_options=validate_options,
+            quarantine=quarantine,
+        )
+        if report.fields:
+            event.rows = report.fields[-1].observations
+
+    if not _field_hooks(hooks):
+        return output, report
+
+    conversions = compile_plan(
+        schema=schema,
+        columns=_data.collect_schema().names(),
+        implementation=_data.implementation,
+        fill_null=(convert_options or {}).get("fill_null", False),
+    ).conversions
+    _profile_conversions(hooks, schema=schema, data=_data, queries=conversions)
+    _profile_validations(
+        hooks,
+        schema=schema,
+        data=output.drop(*_mask_columns(output, FAILURES_COLUMN))
+        if quarantine
+        else output,
+        strict=(validate_options or {}).get("strict", True),
+    )
+    return output, report
+
+
+def _pipe(
+    schema: type,
+    data: IntoFrameT,
+    *,
+    convert_options: dict | None = None,
+    validate_options: dict | None = None,
+    quarantine: bool = False,
+) -> tuple[FrameT, ValidationReport]:
+    """
+    Convert and validate data as a single query plan, without logging.
+
+    See `pipe` for details. The output is always a Narwhals object. If
+    `quarantine`, it holds the bitmask column and lazy outputs are
+    materialized, ready to be split with `dattrs.quarantine._split`.
+    """
+    convert_options = dict(convert_options or {})
+    validate_options = dict(validate_options or {})
+    strict = convert_options.pop("strict", False)
+    max_examples = validate_options.get("max_examples", 0)
+
+    def _identity_function(data):
+        return data
+
+    _data = nw.from_native(data)
+    plan = compile_plan(
+        schema=schema,
+        columns=_data.collect_schema().names(),
+        implementation=_data.implementation,
+        fill_null=convert_options.get("fill_null", False),
+        strict=validate_options.get("strict", True),
+    )
+    pre_queries = plan.validations
+    if not pre_queries:
+        output = schema.convert(_data, strict=strict, **convert_options)
+        if quarantine:
+            output = output.with_columns(**_failure_masks({}))
+        return output, ValidationReport()
+
+    # pre-convert hooks may read any column, so only project without them
+    if convert_options.pop("project", False) and not hasattr(
+        schema, "__dattrs_pre_convert__"
+    ):
+        _data = _project(_data, plan.required_columns, keep=(INDEX_COLUMN,))
+
+    pre_flags = {
+        f"{_PRE_VALIDATION_PREFIX}{name}": query for name, query in pre_queries.items()
+    }
+
+    staged = (
+        _data.with_columns(**pre_flags)
+        .pipe(getattr(schema, "__dattrs_pre_convert__", _identity_function))
+        .pipe(schema.__dattrs_convert__, strict=False, **convert_options)
+    )
+    if strict:
+        columns = staged.collect_schema().names()
+        staged = staged.select(
+            *(fld.alias for fld in attrs.fields(schema)),
+            *(flag for flag in (*pre_flags, INDEX_COLUMN) if flag in columns),
+        )
+    output = staged.pipe(getattr(schema, "__dattrs_post_convert__", _identity_function))
+
+    # hooks are free to drop columns; any pre-validation that did not survive
+    # them falls back to a separate pass over the input
+    columns = output.collect_schema().names()
+    carried = {flag: nw.col(flag) for flag in pre_flags if flag in columns}
+    dropped = {
+        name: query
+        for name, query in pre_queries.items()
+        if f"{_PRE_VALIDATION_PREFIX}{name}" not in carried
+    }
+    # predicates only reading columns the conversion leaves as they are pass
+    # post-convert validations exactly when they passed pre-convert ones, so
+    # their flags are reused
+    reused = frozenset()
+    if not any(hasattr(schema, hook) for hook in _CONVERT_HOOKS):
+        reused = plan.reusable(_data.collect_schema())
+    post_flags = {
+        f"{_POST_VALIDATION_PREFIX}{name}": query
+        for name, query in pre_queries.items()
+        if name not in reused or f"{_PRE_VALIDATION_PREFIX}{name}" not in carried
+    }
+    post_columns = {
+        name: f"{_POST_VALIDATION_PREFIX}{name}"
+        if f"{_POST_VALIDATION_PREFIX}{name}" in post_flags
+        else f"{_PRE_VALIDATION_PREFIX}{name}"
+        for name in pre_queries
+    }
+
+    start = time.perf_counter()
+    flagged = output.with_columns(**post_flags) if post_flags else output
+    if quarantine:
+        masks = _failure_masks(
+            {name: nw.col(column) for name, column in post_columns.items()}
+        )
+        flagged = flagged.with_columns(**masks)
+        # counted and split from the same materialized flags
+        if isinstance(flagged, nw.LazyFrame):
+            flagged = flagged.collect().lazy(backend=flagged.implementation)
+        output = flagged.drop(*post_flags)
+    observations, counts = _count_failures(
+        data=flagged,
+        queries=carried | {flag: nw.col(flag) for flag in post_flags},
+    )
+    elapsed = time.perf_counter() - start
+    output = output.drop(*carried)
+
+    pre_fields = [
+        FieldReport(
+            name=name,
+            failures=counts[f"{_PRE_VALIDATION_PREFIX}{name}"],
+            observations=observations,
+            elapsed=elapsed,
+            stage="pre",
+        )
+        for name in pre_queries
+        if name not in dropped
+    ]
+    if dropped:
+        pre_fields += _evaluate(data=_data, queries=dropped, stage="pre").fields
+    post_fields = [
+        FieldReport(
+            name=name,
+            failures=counts[post_columns[name]],
+            observations=observations,
+            elapsed=elapsed,
+            stage="post",
+        )
+        for name in pre_queries
+    ]
+    _attach_examples(
+        data=_data, queries=pre_queries, fields=pre_fields, max_examples=max_examples
+    )
+    _attach_examples(
+        data=output.drop(*_mask_columns(output, FAILURES_COLUMN))
+        if quarantine
+        else output,
+        queries=pre_queries,
+        fields=post_fields,
+        max_examples=max_examples,
+    )
+
+    return output, ValidationReport(
+        fields=pre_fields + post_fields, elapsed=time.perf_counter() - start
+    )
@@ -0,0 +1,447 @@
+import functools
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import attrs
+import narwhals as nw
+from attrs import NOTHING
+from narwhals.dtypes import DType
+from narwhals.exceptions import NarwhalsError
+from narwhals.utils import Implementation
+
+from dattrs.utils import _field_option, _proxy_native_to_narwhals_dtype
+
+logger = logging.getLogger("dattrs")
+
+# maximum number of compiled plans kept per schema class
+PLAN_CACHE_SIZE: int = 128
+
+_PLAN_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+class Plan:
+    """
+    Compiled expressions for running a schema against one kind of input.
+
+    Plans are built once per schema, input column set and backend by
+    `compile_plan` and reused across calls, sparing each call from resolving
+    defaults, data types, converters and validators again. Expressions are
+    only compiled when first accessed.
+
+    Parameters
+    ----------
+    schema : type
+        An attrs-like class.
+    columns : frozenset[str]
+        Columns present in the input data.
+    implementation : Implementation
+        DataFrame backend implementation.
+    fill_null : bool
+        Whether to fill null values with the field's default value.
+    strict : bool
+        Whether all (True) or any (False) of a field's validators must pass.
+    """
+
+    def __init__(
+        self,
+        schema: type,
+        columns: frozenset[str],
+        implementation: Implementation,
+        fill_null: bool = False,
+        strict: bool = True,
+    ):
+        # only keep the class' fields since the plan cache is weakly keyed by it
+        self.fields = attrs.fields(schema)
+        self.columns = columns
+        self.implementation = implementation
+        self.fill_null = fill_null
+        self.strict = strict
+
+    @functools.cached_property
+    def conversions(self) -> tuple[nw.Expr, ...]:
+        """Expressions converting each field of the schema."""
+        # imported here since `dattrs.convert` compiles its queries with plans
+        from dattrs.convert import _convert_field
+
+        return tuple(
+            _convert_field(
+                fld=fld,
+                exists=fld.name in self.columns,
+                implementation=self.implementation,
+                fill_null=self.fill_null,
+            )
+            for fld in self.fields
+        )
+
+    @functools.cached_property
+    def validations(self) -> dict[str, nw.Expr]:
+        """Predicates validating each field of the schema, keyed by field name."""
+        # imported here since `dattrs.validate` compiles its queries with plans
+        from dattrs.validate import _validate_field
+
+        return {
+            fld.name: _validate_field(fld=fld, strict=self.strict)
+            for fld in self.fields
+            if fld.validator is not None
+        }
+
+    @functools.cached_property
+    def costs(self) -> dict[str, float]:
+        """
+        Relative cost of evaluating each field's validators, keyed by field name.
+
+        Defaults to the number of validators, and can be overridden per field
+        with the "cost" option, e.g. `field(metadata={"dattrs": {"cost": 10}})`.
+        """
+        # imported here since `dattrs.validate` compiles its queries with plans
+        from dattrs.validate import _field_validators
+
+        return {
+            fld.name: _field_option(fld, "cost", len(_field_validators(fld)))
+            for fld in self.fields
+            if fld.validator is not None
+        }
+
+    @functools.cached_property
+    def exact(self) -> frozenset[str]:
+        """
+        Fields to always validate against all observations, even if sampling.
+
+        Set per field with the "exact" option, e.g.
+        `field(metadata={"dattrs": {"exact": True}})`.
+        """
+        return frozenset(
+            fld.name
+            for fld in self.fields
+            if fld.validator is not None and _field_option(fld, "exact", False)
+        )
+
+    @functools.cached_property
+    def conversion_copies(self) -> dict[str, str]:
+        """
+        Fields converted identically to an earlier field, keyed by alias.
+
+        Maps each such field's alias to the alias of the earliest field with
+        the same conversion (e.g. the same column stripped and cast twice), so
+        that the conversion is evaluated once and copied. Conversions are
+        compared structurally and as a whole, see `_expression_key`: shared
+        sub-expressions of different conversions or validators (e.g. the same
+        cast followed by different checks) are evaluated once per expression,
+        unless the backend eliminates them itself (e.g. Polars LazyFrames).
+        """
+        copies = {}
+        seen: dict[bytes, str] = {}
+        for fld, expr in zip(self.fields, self.conversions):
+            key = _expression_key(expr)
+            if key is None:
+                continue
+            if key in seen:
+                copies[fld.alias] = seen[key]
+            else:
+                seen[key] = fld.alias
+        return copies
+
+    def unchanged(self, dtypes: Mapping[str, DType]) -> frozenset[str]:
+        """
+        Return fields whose conversion leaves the input column as is.
+
+        These fields are neither renamed, filled nor transformed, and are either
+        not cast or already of their data type, meaning predicates evaluated
+        before converting still hold after.
+
+        Parameters
+        ----------
+        dtypes : Mapping[str, DType]
+            Data types of the input columns, e.g. `frame.collect_schema()`.
+        """
+        unchanged = set()
+        for fld in self.fields:
+            if (
+                fld.name not in self.columns
+                or fld.alias != fld.name
+                or fld.converter is not None
+                or (self.fill_null and fld.default is not NOTHING)
+            ):
+                continue
+            if fld.type is not None:
+                dtype = _proxy_native_to_narwhals_dtype(
+                    dtype=fld.type, implementation=self.implementation
+                )
+                try:
+                    dtype = dtype() if isinstance(dtype, type) else dtype
+                except TypeError:
+                    # parametric data types without defaults, e.g. `nw.Enum`
+                    continue
+                if dtypes[fld.name] != dtype:
+                    continue
+            unchanged.add(fld.name)
+        return frozenset(unchanged)
+
+    def reusable(self, dtypes: Mapping[str, DType]) -> frozenset[str]:
+        """
+        Return fields whose pre-convert validations also hold after converting.
+
+        A field's predicate is reusable if every column it reads belongs to an
+        unchanged field (see `unchanged`), e.g. not if a validator compares the
+        field to another, converted column. Predicates whose columns cannot be
+        determined (see `_root_columns`) are never reusable.
+
+        Parameters
+        ----------
+        dtypes : Mapping[str, DType]
+            Data types of the input columns, e.g. `frame.collect_schema()`.
+        """
+        unchanged = self.unchanged(dtypes)
+        reusable = set()
+        for name, query in self.validations.items():
+            roots = _root_columns(query)
+            if roots is not None and roots <= unchanged:
+                reusable.add(name)
+        return frozenset(reusable)
+
+    @functools.cached_property
+    def conversion_columns(self) -> frozenset[str] | None:
+        """
+        Input columns read by the conversions.
+
+        None if they cannot be determined, e.g. if a converter selects columns
+        with a wildcard, see `_root_columns`.
+        """
+        return _input_columns(self.conversions, self.columns)
+
+    @functools.cached_property
+    def validation_columns(self) -> frozenset[str] | None:
+        """
+        Input columns read by the validations.
+
+        None if they cannot be determined, see `conversion_columns`.
+        """
+        return _input_columns(self.validations.values(), self.columns)
+
+    @property
+    def required_columns(self) -> frozenset[str] | None:
+        """
+        Input columns read by the conversions or the validations.
+
+        Selecting only these columns ahead of a lazy query lets the backend skip
+        reading (and decoding) all others. None if they cannot be determined.
+        """
+        if self.conversion_columns is None or self.validation_columns is None:
+            return None
+        return self.conversion_columns | self.validation_columns
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Whether the plan can be reused across calls.
+
+        Plans resolving a callable default are not cached since the default
+        must be evaluated on each call.
+        """
+        return not any(
+            callable(fld.default) and (fld.name not in self.columns or self.fill_null)
+            for fld in self.fields
+            if fld.default is not NOTHING
+        )
+
+
+def compile_plan(
+    schema: type,
+    columns: Iterable[str],
+    implementation: Implementation,
+    *,
+    fill_null: bool = False,
+    strict: bool = True,
+) -> Plan:
+    """
+    Return compiled plan for running `schema` against an input.
+
+    Plans are cached per schema class in a bounded, least-recently-used store
+    of `PLAN_CACHE_SIZE` entries keyed by the input's column set, backend and
+    plan options. The store is tied to the class object itself, meaning
+    redefining a class (e.g. re-running a notebook cell) starts a new store.
+
+    Parameters
+    ----------
+    schema : type
+        An attrs-like class.
+    columns : Iterable[str]
+        Columns present in the input data.
+    implementation : Implementation
+        DataFrame backend implementation.
+    fill_null : bool
+        Whether to fill null values with the field's default value.
+    strict : bool
+        Whether all (True) or any (False) of a field's validators must pass.
+
+    Returns
+    -------
+    Plan
+        Compiled plan for the schema.
+    """
+    assert attrs.has(schema)
+
+    columns = frozenset(columns)
+    key = (columns, implementation, fill_null, strict)
+    with _PLAN_CACHE_LOCK:
+        plans = _PLAN_CACHE.setdefault(schema, OrderedDict())
+        if key in plans:
+            plans.move_to_end(key)
+            return plans[key]
+
+    plan = Plan(
+        schema=schema,
+        columns=columns,
+        implementation=implementation,
+        fill_null=fill_null,
+        strict=strict,
+    )
+    if not plan.cacheable:
+        return plan
+
+    with _PLAN_CACHE_LOCK:
+        plans[key] = plan
+        while len(plans) > PLAN_CACHE_SIZE:
+            plans.popitem(last=False)
+    return plan
+
+
+def clear_plan_cache(schema: type | None = None) -> None:
+    """
+    Discard compiled plans.
+
+    Parameters
+    ----------
+    schema : type, optional
+        Schema whose plans to discard. If not provided, all plans are discarded.
+    """
+    with _PLAN_CACHE_LOCK:
+        if schema is None:
+            _PLAN_CACHE.clear()
+        else:
+            _PLAN_CACHE.pop(schema, None)
+
+
+@functools.cache
+def _polars_namespace() -> Any | None:
+    """
+    Return Narwhals' Polars namespace, if Polars is installed.
+
+    Polars is required to inspect expressions (see `_to_polars`); without it,
+    inputs are never projected and identical conversions are never shared,
+    which is logged once.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        logger.warning(
+            "Polars is not installed: columns read by expressions cannot be "
+            "determined, so inputs are not projected and identical conversions "
+            "are evaluated separately."
+        )
+        return None
+    return nw.from_native(pl.LazyFrame())._compliant_frame.__narwhals_namespace__()
+
+
+def _to_polars(expr: nw.Expr) -> Any | None:
+    """
+    Return Polars translation of an expression, whatever the input's backend.
+
+    Narwhals expressions are opaque, so their structure (e.g. the columns they
+    read) is inspected through Polars' `meta` namespace. Returns None if
+    Polars is not installed or the expression has no Polars equivalent.
+    """
+    plx = _polars_namespace()
+    if plx is None:
+        return None
+
+    import polars as pl
+
+    try:
+        return expr._to_compliant_expr(plx).native
+    except (NotImplementedError, NarwhalsError, pl.exceptions.PolarsError):
+        return None
+
+
+def _is_positional(native: Any) -> bool:
+    """
+    Return whether a Polars expression selects a column by position.
+
+    Positional selections (e.g. `nw.nth`) are the only inputs Polars cannot
+    pop off an expression tree, so the tree is walked until one is met.
+    """
+    import polars as pl
+
+    try:
+        inputs = native.meta.pop()
+    except pl.exceptions.InvalidOperationError:
+        return True
+    return any(_is_positional(expr) for expr in inputs)
+
+
+def _root_columns(expr: nw.Expr) -> frozenset[str] | None:
+    """
+    Return names of the columns an expression reads.
+
+    Returns None if the expression cannot be translated to Polars (see
+    `_to_polars`), or if it selects columns by wildcard, data type or
+    position (e.g. `nw.all()`, `nw.nth`).
+    """
+    native = _to_polars(expr)
+    if native is None:
+        return None
+    if native.meta.has_multiple_outputs() or _is_positional(native):
+        return None
+    return frozenset(native.meta.root_names())
+
+
+def _expression_key(expr: nw.Expr) -> bytes | None:
+    """
+    Return structural key of an expression, ignoring its output name.
+
+    Keys are Polars' serialization of the expression, meaning two expressions
+    share a key only if they compute the same values from the same columns.
+    Returns None for expressions that cannot be translated or serialized,
+    e.g. some user-defined functions.
+    """
+    native = _to_polars(expr)
+    if native is None:
+        return None
+
+    import polars as pl
+
+    try:
+        return native.meta.undo_aliases().meta.serialize()
+    except pl.exceptions.PolarsError:
+        return None
+
+
+def _is_elementwise(exprs: Iterable[nw.Expr]) -> bool:
+    """
+    Return whether each expression computes every row from that row alone.
+
+    Literals count as elementwise. Aggregations, window functions and other
+    expressions reading several rows (e.g. `is_unique`, `expr - expr.mean()`)
+    do not, meaning their result depends on the rows evaluated together.
+    """
+    return all(
+        expr._metadata.is_elementwise or expr._metadata.is_literal for expr in exprs
+    )
+
+
+def _input_columns(
+    exprs: Iterable[nw.Expr], columns: frozenset[str]
+) -> frozenset[str] | None:
+    """Return input columns read by any expression, None if unknown for one."""
+    required = set()
+    for expr in exprs:
+        roots = _root_columns(expr)
+        if roots is None:
+            return None
+        required |= roots
+    return frozenset(required & columns)
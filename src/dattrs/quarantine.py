@@ -0,0 +1,140 @@
+import re
+from collections.abc import Sequence
+
+import attrs
+import narwhals as nw
+from narwhals.typing import FrameT, IntoFrameT
+
+from dattrs.plan import compile_plan
+from dattrs.utils import _to_native_like
+
+# column of rejected observations flagging the fields they failed
+FAILURES_COLUMN: str = "__dattrs_failures__"
+
+# bits of a signed 64-bit integer usable as flags, i.e. fields per bitmask
+_MASK_FIELDS = 63
+
+
+def quarantine(
+    schema: type,
+    data: IntoFrameT,
+    *,
+    strict: bool = True,
+    column: str = FAILURES_COLUMN,
+) -> tuple[IntoFrameT, IntoFrameT]:
+    """
+    Split observations passing all validations from those failing any.
+
+    Each field's predicate is evaluated once, into a bitmask whose n-th bit
+    is set if the observation failed the n-th validated field (in definition
+    order, see `failed_fields`). A bitmask holds 63 fields; schemas with more
+    validated fields are flagged in further bitmask columns, suffixed with
+    their position (e.g. "__dattrs_failures___1" for fields 63 to 125). Lazy
+    inputs are collected once with their bitmasks and both outputs are
+    returned as lazy frames of the materialized data, meaning writing either
+    output never scans the input again.
+
+    Parameters
+    ----------
+    schema : type
+        An attrs-like class.
+    data : IntoFrameT
+        An object that can be converted to a Narwhals DataFrame or LazyFrame.
+    strict : bool
+        Whether all (True) or any (False) of a field's validators must pass.
+    column : str
+        Name of the (first) bitmask column added to rejected observations.
+
+    Returns
+    -------
+    tuple[IntoFrameT, IntoFrameT]
+        Observations passing all validations, and observations failing any
+        with their bitmasks, in the original backend.
+    """
+    assert attrs.has(schema)
+
+    _data = nw.from_native(data)
+    queries = compile_plan(
+        schema=schema,
+        columns=_data.collect_schema().names(),
+        implementation=_data.implementation,
+        strict=strict,
+    ).validations
+    valid, rejected = _split(
+        _data.with_columns(**_failure_masks(queries, column=column)), column=column
+    )
+    return _to_native_like(valid, data), _to_native_like(rejected, data)
+
+
+def failed_fields(schema: type, mask: int | Sequence[int]) -> list[str]:
+    """
+    Return names of the fields flagged in bitmasks of `quarantine`.
+
+    Parameters
+    ----------
+    schema : type
+        Schema the bitmasks were computed for.
+    mask : int | Sequence[int]
+        Value of a rejected observation's bitmask column or, for schemas with
+        more than 63 validated fields, values of all its bitmask columns in
+        order.
+
+    Returns
+    -------
+    list[str]
+        Names of the fields the observation failed.
+    """
+    masks = (mask,) if isinstance(mask, int) else mask
+    combined = sum(
+        int(value) << (_MASK_FIELDS * index) for index, value in enumerate(masks)
+    )
+    names = [fld.name for fld in attrs.fields(schema) if fld.validator is not None]
+    return [name for index, name in enumerate(names) if combined >> index & 1]
+
+
+def _failure_masks(
+    queries: dict[str, nw.Expr], column: str = FAILURES_COLUMN
+) -> dict[str, nw.Expr]:
+    """
+    Return bitmasks of the predicates each observation fails, keyed by column.
+
+    Each bitmask holds `_MASK_FIELDS` predicates, see `quarantine`. Null
+    predicates count as passing, as they do in failure counts.
+    """
+    predicates = list(queries.values())
+    if not predicates:
+        return {column: nw.lit(0, dtype=nw.Int64)}
+    return {
+        _mask_column(column, position): nw.sum_horizontal(
+            *(
+                (~query).cast(nw.Int64).fill_null(0) * (1 << index)
+                for index, query in enumerate(predicates[start : start + _MASK_FIELDS])
+            )
+        )
+        for position, start in enumerate(range(0, len(predicates), _MASK_FIELDS))
+    }
+
+
+def _mask_column(column: str, position: int) -> str:
+    """Return name of the bitmask column at `position`."""
+    return column if position == 0 else f"{column}_{position}"
+
+
+def _mask_columns(data: FrameT, column: str) -> list[str]:
+    """Return names of the bitmask columns of `data`, see `_mask_column`."""
+    pattern = re.compile(rf"{re.escape(column)}(_[1-9][0-9]*)?")
+    return [name for name in data.collect_schema().names() if pattern.fullmatch(name)]
+
+
+def _split(data: FrameT, column: str) -> tuple[FrameT, FrameT]:
+    """
+    Split observations on their bitmask columns, materializing lazy frames.
+
+    Valid observations are returned without the bitmask columns.
+    """
+    if isinstance(data, nw.LazyFrame):
+        data = data.collect().lazy(backend=data.implementation)
+    columns = _mask_columns(data, column)
+    valid = data.filter(*(nw.col(name) == 0 for name in columns)).drop(*columns)
+    rejected = data.filter(nw.any_horizontal(*(nw.col(name) != 0 for name in columns)))
+    return valid, rejected
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import attrs
+from attrs import define, field
+
+
+@define
+class FieldReport:
+    """
+    Outcome of validating a single field.
+
+    Parameters
+    ----------
+    name : str
+        Name of the validated field.
+    failures : int
+        Number of observations failing the field's validators.
+    observations : int
+        Number of observations evaluated.
+    elapsed : float
+        Seconds spent evaluating the field. Fields checked in the same pass
+        over the data share that pass' duration.
+    stage : str, optional
+        Stage the field was validated at (e.g. "pre" or "post" conversion).
+    exact : bool
+        Whether `failures` and `observations` are exact counts. Fail-fast
+        validation only checks whether any observation failed, and sampled
+        validation only counts failures within the sample.
+    interval : tuple[float, float], optional
+        Confidence interval of the failure ratio, if estimated from a sample.
+    examples : list[dict[str, Any]]
+        Bounded sample of failing observations.
+    """
+
+    name: str
+    failures: int
+    observations: int
+    elapsed: float = 0.0
+    stage: str | None = None
+    exact: bool = True
+    interval: tuple[float, float] | None = None
+    examples: list[dict[str, Any]] = field(factory=list)
+
+    @property
+    def key(self) -> str:
+        """Identifier of the field, prefixed by its stage if defined."""
+        return self.name if self.stage is None else f"{self.stage}.{self.name}"
+
+    @property
+    def passed(self) -> bool:
+        """Whether all observations passed."""
+        return self.failures == 0
+
+    @property
+    def ratio(self) -> float:
+        """Proportion of observations that failed."""
+        return self.failures / self.observations if self.observations else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return report as a dictionary of builtin types."""
+        return attrs.asdict(self) | {"passed": self.passed, "ratio": self.ratio}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FieldReport:
+        """Return report from the output of `to_dict`."""
+        data = {
+            key: value for key, value in data.items() if key in attrs.fields_dict(cls)
+        }
+        if data.get("interval") is not None:
+            data["interval"] = tuple(data["interval"])
+        return cls(**data)
+
+
+@define
+class ValidationReport:
+    """
+    Outcome of validating data against a schema.
+
+    Parameters
+    ----------
+    fields : list[FieldReport]
+        Outcome of each validated field.
+    elapsed : float
+        Seconds spent validating.
+    """
+
+    fields: list[FieldReport] = field(factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        """Whether all observations passed for all fields."""
+        return all(fld.passed for fld in self.fields)
+
+    @property
+    def failures(self) -> dict[str, int]:
+        """Number of failures per field, prefixed by stage if defined."""
+        return {fld.key: fld.failures for fld in self.fields}
+
+    def __getitem__(self, key: str) -> FieldReport:
+        """Return first field report matching `key` (e.g. "a" or "post.a")."""
+        for fld in self.fields:
+            if key in (fld.name, fld.key):
+                return fld
+        raise KeyError(key)
+
+    @classmethod
+    def from_stages(cls, **reports: ValidationReport) -> ValidationReport:
+        """Combine reports of separate stages, labelling fields by stage."""
+        return cls(
+            fields=[
+                attrs.evolve(fld, stage=stage)
+                for stage, report in reports.items()
+                for fld in report.fields
+            ],
+            elapsed=sum(report.elapsed for report in reports.values()),
+        )
+
+    def merge(
+        self,
+        other: ValidationReport,
+        *,
+        max_examples: int | None = None,
+        confidence: float = 0.95,
+    ) -> ValidationReport:
+        """
+        Combine reports of separate chunks of the same data.
+
+        Failures, observations and timings are summed per field, and examples
+        are concatenated up to `max_examples` (if defined). Confidence
+        intervals of fields sampled in both reports are recomputed from the
+        summed counts at `confidence`, which should match the level they were
+        estimated at; those of fields sampled in only one report are dropped,
+        since the summed counts are then not a sample.
+        """
+        # imported here since reports do not otherwise depend on sampling
+        from dattrs.sample import _wilson_interval
+
+        fields = {fld.key: attrs.evolve(fld) for fld in self.fields}
+        for fld in other.fields:
+            if fld.key not in fields:
+                fields[fld.key] = attrs.evolve(fld)
+                continue
+            merged = fields[fld.key]
+            merged.failures += fld.failures
+            merged.observations += fld.observations
+            merged.elapsed += fld.elapsed
+            merged.exact = merged.exact and fld.exact
+            merged.interval = (
+                _wilson_interval(merged.failures, merged.observations, confidence)
+                if merged.interval is not None and fld.interval is not None
+                else None
+            )
+            merged.examples = merged.examples + fld.examples
+        if max_examples is not None:
+            for fld in fields.values():
+                fld.examples = fld.examples[:max_examples]
+        return ValidationReport(
+            fields=list(fields.values()), elapsed=self.elapsed + other.elapsed
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return report as a dictionary of builtin types."""
+        return {
+            "passed": self.passed,
+            "elapsed": self.elapsed,
+            "fields": [fld.to_dict() for fld in self.fields],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ValidationReport:
+        """Return report from the output of `to_dict`."""
+        return cls(
+            fields=[FieldReport.from_dict(fld) for fld in data.get("fields", [])],
+            elapsed=data.get("elapsed", 0.0),
+        )
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Return report as a JSON string.
+
+        Parameters
+        ----------
+        **kwargs
+            Keyword arguments passed to `json.dumps`. Values that are not
+            JSON-serializable (e.g. dates in examples) are cast to strings.
+        """
+        kwargs.setdefault("default", str)
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,135 @@
+import math
+import random
+import statistics
+from collections.abc import Callable
+from typing import Any
+
+import narwhals as nw
+from narwhals.typing import FrameT
+from narwhals.utils import Implementation
+
+
+def _sample_polars(native: Any, fraction: float, seed: int) -> Any:
+    """Bernoulli sample of a Polars LazyFrame by hashing row positions."""
+    import polars as pl
+
+    threshold = int(fraction * 2**32)
+    return native.filter(pl.int_range(0, pl.len()).hash(seed) % 2**32 < threshold)
+
+
+def _sample_duckdb(native: Any, fraction: float, seed: int) -> Any:
+    """Bernoulli sample of a DuckDB relation."""
+    return native.query(
+        "_dattrs_sample",
+        f"SELECT * FROM _dattrs_sample "
+        f"USING SAMPLE bernoulli({fraction * 100}%) REPEATABLE ({seed})",
+    )
+
+
+def _sample_dask(native: Any, fraction: float, seed: int) -> Any:
+    """Bernoulli sample of a Dask DataFrame."""
+    return native.sample(frac=fraction, random_state=seed)
+
+
+def _sample_spark(native: Any, fraction: float, seed: int) -> Any:
+    """Bernoulli sample of a Spark-like DataFrame."""
+    return native.sample(fraction=fraction, seed=seed)
+
+
+# lazy backends do not share a sampling method, so each is sampled natively
+_LAZY_SAMPLERS: dict[Implementation, Callable[[Any, float, int], Any]] = {
+    Implementation.POLARS: _sample_polars,
+    Implementation.DUCKDB: _sample_duckdb,
+    Implementation.DASK: _sample_dask,
+    Implementation.PYSPARK: _sample_spark,
+    Implementation.PYSPARK_CONNECT: _sample_spark,
+    Implementation.SQLFRAME: _sample_spark,
+}
+
+
+def _sample(data: FrameT, sample: float | int, seed: int | None = None) -> FrameT:
+    """
+    Return random subset of `data`.
+
+    Parameters
+    ----------
+    data : FrameT
+        A Narwhals DataFrame or LazyFrame.
+    sample : float | int
+        Fraction of observations (if float) or number of observations (if int)
+        to sample. Eager frames are sampled exactly; lazy frames are sampled
+        with a seeded Bernoulli sample in their own backend, meaning the sample
+        size is approximate.
+    seed : int, optional
+        Seed for the random number generator.
+
+    Returns
+    -------
+    FrameT
+        Sampled observations.
+    """
+    if isinstance(sample, bool) or not isinstance(sample, (int, float)):
+        raise TypeError(f"Sample must be a float or an int, received: {sample!r}.")
+    if isinstance(sample, float) and not 0 < sample <= 1:
+        raise ValueError(f"Sample fraction must be in (0, 1], received: {sample}.")
+    if isinstance(sample, int) and sample < 1:
+        raise ValueError(f"Sample size must be positive, received: {sample}.")
+
+    if isinstance(data, nw.DataFrame):
+        if isinstance(sample, float):
+            return data.sample(fraction=sample, seed=seed)
+        return data.sample(n=min(sample, len(data)), seed=seed)
+
+    if data.implementation not in _LAZY_SAMPLERS:
+        raise ValueError(
+            f"Sampling is not supported for {data.implementation} LazyFrames."
+        )
+
+    fraction = sample
+    if isinstance(sample, int):
+        observations = data.select(nw.len()).collect().item()
+        fraction = min(1.0, sample / observations) if observations else 1.0
+
+    seed = random.randrange(2**31) if seed is None else seed
+    return nw.from_native(
+        _LAZY_SAMPLERS[data.implementation](data.to_native(), fraction, seed)
+    )
+
+
+def _wilson_interval(
+    failures: int, observations: int, confidence: float = 0.95
+) -> tuple[float, float]:
+    """
+    Return Wilson score interval of a sampled failure ratio.
+
+    Parameters
+    ----------
+    failures : int
+        Number of failing observations in the sample.
+    observations : int
+        Number of observations in the sample.
+    confidence : float
+        Confidence level of the interval.
+
+    Returns
+    -------
+    tuple[float, float]
+        Lower and upper bound of the population's failure ratio.
+    """
+    if observations == 0:
+        return (0.0, 1.0)
+
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    ratio = failures / observations
+    denominator = 1 + z**2 / observations
+    centre = (ratio + z**2 / (2 * observations)) / denominator
+    margin = (
+        z
+        * math.sqrt(ratio * (1 - ratio) / observations + z**2 / (4 * observations**2))
+        / denominator
+    )
+    # bounds are exactly 0 (or 1) when no (or every) observation failed, which
+    # floating-point rounding may otherwise miss
+    lower = 0.0 if failures == 0 else max(0.0, centre - margin)
+    upper = 1.0 if failures == observations else min(1.0, centre + margin)
+    return (lower, upper)
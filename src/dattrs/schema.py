@@ -1,9 +1,25 @@
+from collections.abc import Callable, Iterable, Sequence
+
 from attrs import define
 
 import narwhals as nw
-from narwhals.typing import IntoDataFrameT, DataFrameT
+from narwhals.typing import IntoFrameT, FrameT
 
+from dattrs.batch import (
+    convert_many as _convert_many,
+    validate_many as _validate_many,
+)
 from dattrs.convert import convert as _convert
+from dattrs.hooks import Hooks
+from dattrs.incremental import (
+    ValidationCache,
+    validate_partitions as _validate_partitions,
+)
+from dattrs.pipe import _UNFUSED_OPTIONS, pipe as _pipe
+from dattrs.quarantine import quarantine as _quarantine
+from dattrs.report import ValidationReport
+from dattrs.stream import ConvertStream
+from dattrs.utils import _to_native_like
 from dattrs.validate import validate as _validate
 
 
@@ -24,24 +40,48 @@ def schema(cls: type = None, **attrs_define_kwargs):
         cls = define(cls, **attrs_define_kwargs)
 
         @classmethod
-        def __dattrs_validate__(cls, data: IntoDataFrameT) -> DataFrameT:
-            return _validate(schema=cls, data=data)
+        def __dattrs_validate__(
+            cls, data: IntoFrameT, **configuration
+        ) -> ValidationReport:
+            return _validate(schema=cls, data=data, **configuration)
 
         @classmethod
-        def validate(cls, data: IntoDataFrameT) -> DataFrameT:
+        def validate(cls, data: IntoFrameT, **configuration) -> ValidationReport:
             """Validate data according to class-defined schema."""
-            cls.__dattrs_validate__(data=data)
+            return cls.__dattrs_validate__(data=data, **configuration)
 
         @classmethod
         def __dattrs_convert__(
-            cls, data: IntoDataFrameT, *, strict: bool = False, fill_null: bool = False
-        ) -> DataFrameT:
-            return _convert(schema=cls, data=data, strict=strict, fill_null=fill_null)
+            cls,
+            data: IntoFrameT,
+            *,
+            strict: bool = False,
+            fill_null: bool = False,
+            project: bool = False,
+            engine: str | None = None,
+            hooks: Sequence[Hooks] = (),
+        ) -> FrameT:
+            return _convert(
+                schema=cls,
+                data=data,
+                strict=strict,
+                fill_null=fill_null,
+                project=project,
+                engine=engine,
+                hooks=hooks,
+            )
 
         @classmethod
         def convert(
-            cls, data: IntoDataFrameT, *, strict: bool = False, fill_null: bool = False
-        ) -> DataFrameT:
+            cls,
+            data: IntoFrameT,
+            *,
+            strict: bool = False,
+            fill_null: bool = False,
+            project: bool = False,
+            engine: str | None = None,
+            hooks: Sequence[Hooks] = (),
+        ) -> FrameT:
             """Convert data according to class-defined schema."""
 
             def _identity_function(data):
@@ -49,22 +89,65 @@ def schema(cls: type = None, **attrs_define_kwargs):
 
             _data = nw.from_native(data)
 
-            return (
+            return _to_native_like(
                 _data.pipe(getattr(cls, "__dattrs_pre_convert__", _identity_function))
-                .pipe(cls.__dattrs_convert__, strict=strict, fill_null=fill_null)
-                .pipe(getattr(cls, "__dattrs_post_convert__", _identity_function))
-                .to_native()
+                .pipe(
+                    cls.__dattrs_convert__,
+                    strict=strict,
+                    fill_null=fill_null,
+                    project=project,
+                    engine=engine,
+                    hooks=hooks,
+                )
+                .pipe(getattr(cls, "__dattrs_post_convert__", _identity_function)),
+                data,
             )
 
         @classmethod
         def pipe(
             cls,
-            data: IntoDataFrameT,
+            data: IntoFrameT,
             *,
             convert_options: dict | None = None,
             validate_options: dict | None = None,
-        ) -> DataFrameT:
-            """Convert and validate data according to class-defined schema."""
+            fused: bool = True,
+            return_report: bool = False,
+            quarantine: bool = False,
+            hooks: Sequence[Hooks] = (),
+        ) -> FrameT | tuple[FrameT, ...]:
+            """
+            Convert and validate data according to class-defined schema.
+
+            Lazy inputs stay lazy throughout; they are only collected to count
+            validation failures and a lazy result is returned. If `fused`, pre-
+            and post-validations are gathered in a single collect alongside the
+            conversion; otherwise, each step is run one after the other. If
+            `return_report`, the validation report is returned alongside the data.
+            Fail-fast, sampled and parallel validations evaluate fields separately
+            and are never fused. If `quarantine`, valid and rejected observations
+            are returned separately (see `dattrs.pipe.pipe`), which is always
+            fused. `hooks` are called around each step, see `dattrs.hooks`.
+            """
+            unfused = [
+                option
+                for option in _UNFUSED_OPTIONS
+                if (validate_options or {}).get(option)
+            ]
+            if quarantine and unfused:
+                raise ValueError(
+                    f"Cannot quarantine observations with validation options: {unfused}."
+                )
+            if quarantine or (fused and not unfused):
+                return _pipe(
+                    schema=cls,
+                    data=data,
+                    convert_options=convert_options,
+                    validate_options=validate_options,
+                    return_report=return_report,
+                    quarantine=quarantine,
+                    hooks=hooks,
+                )
+
             if convert_options is None:
                 convert_options = dict()
 
@@ -73,21 +156,102 @@ def schema(cls: type = None, **attrs_define_kwargs):
 
             _data = nw.from_native(data)
 
-            print("Running pre-validations ...")
-            cls.validate(data=_data, **validate_options)
+            pre_report = cls.validate(data=_data, hooks=hooks, **validate_options)
+            _data = cls.convert(data=_data, hooks=hooks, **convert_options)
+            post_report = cls.validate(data=_data, hooks=hooks, **validate_options)
 
-            _data = cls.convert(data=_data, **convert_options)
+            _data = _to_native_like(_data, data)
+            if return_report:
+                report = ValidationReport.from_stages(pre=pre_report, post=post_report)
+                return _data, report
+            return _data
+
+        @classmethod
+        def convert_many(
+            cls, frames: Iterable[IntoFrameT], **configuration
+        ) -> list[IntoFrameT]:
+            """
+            Convert many DataFrames according to class-defined schema.
 
-            print("\nRunning post-validations ...")
-            cls.validate(data=_data, **validate_options)
+            See `dattrs.batch.convert_many` for details.
+            """
+            return _convert_many(schema=cls, frames=frames, **configuration)
 
-            return _data
+        @classmethod
+        def validate_many(
+            cls, frames: Iterable[IntoFrameT], **configuration
+        ) -> list[ValidationReport]:
+            """
+            Validate many DataFrames according to class-defined schema.
+
+            See `dattrs.batch.validate_many` for details.
+            """
+            return _validate_many(schema=cls, frames=frames, **configuration)
+
+        @classmethod
+        def quarantine(
+            cls, data: IntoFrameT, **configuration
+        ) -> tuple[IntoFrameT, IntoFrameT]:
+            """
+            Split observations passing all validations from those failing any.
+
+            See `dattrs.quarantine.quarantine` for details.
+            """
+            return _quarantine(schema=cls, data=data, **configuration)
+
+        @classmethod
+        def convert_stream(
+            cls,
+            batches: Iterable[IntoFrameT],
+            *,
+            convert_options: dict | None = None,
+            validate_options: dict | None = None,
+        ) -> ConvertStream:
+            """
+            Convert and validate batches of data according to class-defined schema.
+
+            Returns a `ConvertStream` yielding converted batches one at a time;
+            its `report` accumulates validation outcomes across all batches.
+            """
+            return ConvertStream(
+                schema=cls,
+                batches=batches,
+                convert_options=convert_options,
+                validate_options=validate_options,
+            )
+
+        @classmethod
+        def validate_partitions(
+            cls,
+            partitions: Iterable[str],
+            *,
+            reader: Callable[[str], IntoFrameT],
+            cache: str | ValidationCache,
+            **configuration,
+        ) -> ValidationReport:
+            """
+            Validate partitioned data, skipping partitions validated before.
+
+            See `dattrs.incremental.validate_partitions` for details.
+            """
+            return _validate_partitions(
+                schema=cls,
+                partitions=partitions,
+                reader=reader,
+                cache=cache,
+                **configuration,
+            )
 
         cls.__dattrs_validate__ = __dattrs_validate__
         cls.validate = validate
         cls.__dattrs_convert__ = __dattrs_convert__
         cls.convert = convert
         cls.pipe = pipe
+        cls.convert_many = convert_many
+        cls.validate_many = validate_many
+        cls.quarantine = quarantine
+        cls.convert_stream = convert_stream
+        cls.validate_partitions = validate_partitions
         return cls
 
     return wrapper if cls is None else wrapper(cls)
@@ -0,0 +1,121 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from narwhals.dependencies import get_pyarrow
+from narwhals.typing import IntoFrameT
+
+from dattrs.pipe import _UNFUSED_OPTIONS, _pipe
+from dattrs.report import ValidationReport
+from dattrs.utils import _to_native_like
+from dattrs.validate import _log_report
+
+
+class ConvertStream:
+    """
+    Convert and validate a stream of batches, one batch at a time.
+
+    Iterating over the stream yields each converted batch in its original
+    backend, meaning memory is bounded by the size of a batch. Each batch runs
+    through the same fused plan as `pipe`; since plans are cached per schema,
+    input column set and backend, expressions are only compiled for the first
+    batch. Validation outcomes are accumulated across batches into `report`,
+    which is complete once the stream is exhausted and starts over each time
+    the stream is iterated.
+
+    PyArrow `RecordBatch` objects (e.g. from a `RecordBatchReader`) are wrapped
+    in a zero-copy `Table` and yielded as such.
+
+    Parameters
+    ----------
+    schema : type
+        A `dattrs` schema class.
+    batches : Iterable[IntoFrameT]
+        Batches of data, e.g. a `pyarrow.RecordBatchReader`.
+    convert_options : dict, optional
+        Keyword arguments passed to the schema's `convert` method.
+    validate_options : dict, optional
+        Keyword arguments used to configure validation. Options that cannot be
+        fused (e.g. `fail_fast`, `sample`) are not supported.
+    """
+
+    def __init__(
+        self,
+        schema: type,
+        batches: Iterable[IntoFrameT],
+        *,
+        convert_options: dict | None = None,
+        validate_options: dict | None = None,
+    ):
+        validate_options = dict(validate_options or {})
+        unsupported = [
+            option for option in _UNFUSED_OPTIONS if validate_options.get(option)
+        ]
+        if unsupported:
+            raise ValueError(
+                f"Streams do not support the following validation options: {unsupported}."
+            )
+
+        self.schema = schema
+        self.batches = batches
+        self.convert_options = convert_options
+        self.validate_options = validate_options
+        self.report = ValidationReport()
+
+    def __iter__(self) -> Iterator[IntoFrameT]:
+        max_examples = self.validate_options.get("max_examples", 0)
+        # each iteration validates the batches anew
+        self.report = ValidationReport()
+        for batch in self.batches:
+            batch = _from_batch(batch)
+            output, report = _pipe(
+                schema=self.schema,
+                data=batch,
+                convert_options=self.convert_options,
+                validate_options=self.validate_options,
+            )
+            self.report = self.report.merge(report, max_examples=max_examples)
+            yield _to_native_like(output, batch)
+        _log_report(self.report)
+
+
+def _from_batch(batch: Any) -> IntoFrameT:
+    """Wrap PyArrow record batches in a table, leaving other batches as-is."""
+    pa = get_pyarrow()
+    if pa is not None and isinstance(batch, pa.RecordBatch):
+        return pa.Table.from_batches([batch])
+    return batch
+
+
+def iter_batches(
+    source: str | Sequence[str],
+    *,
+    format: str = "parquet",
+    batch_size: int = 131_072,
+    columns: Sequence[str] | None = None,
+    **dataset_options,
+) -> Iterator[Any]:
+    """
+    Read file(s) as a stream of PyArrow record batches.
+
+    Parameters
+    ----------
+    source : str | Sequence[str]
+        Path(s) to file(s) or directories, as accepted by `pyarrow.dataset`.
+    format : str
+        File format, e.g. "parquet", "csv" or "ipc".
+    batch_size : int
+        Maximum number of rows per batch.
+    columns : Sequence[str], optional
+        Columns to read. If not provided, all columns are read.
+    **dataset_options
+        Keyword arguments passed to `pyarrow.dataset.dataset`.
+
+    Returns
+    -------
+    Iterator[pyarrow.RecordBatch]
+        Batches of at most `batch_size` rows.
+    """
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(source, format=format, **dataset_options)
+    return dataset.to_batches(columns=columns, batch_size=batch_size)
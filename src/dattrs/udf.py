@@ -0,0 +1,80 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import narwhals as nw
+from narwhals.dtypes import DType
+
+# column formats user-defined functions can receive
+_FORMATS = ("numpy", "arrow")
+
+
+def batch_udf(
+    function: Callable[[Any], Any],
+    return_dtype: DType | type[DType],
+    *,
+    format: str = "numpy",
+) -> Callable[[nw.Expr], nw.Expr]:
+    """
+    Return converter (or validator) applying a function to whole columns.
+
+    The function receives a field's values as a NumPy array or a PyArrow
+    array, and must return an array-like of the same length, e.g. the
+    output of a NumPy ufunc or of `pyarrow.compute`. It runs within the same
+    query as all other expressions, once per column, meaning custom logic is
+    neither evaluated row by row nor in a separate pass.
+
+    Batch functions run through Narwhals' `Expr.map_batches`, meaning they
+    only run on eager frames (Polars, pandas-like and PyArrow DataFrames).
+    Narwhals treats them as reading whole columns (not as elementwise), so
+    lazy frames (e.g. Polars LazyFrames, DuckDB relations) raise Narwhals'
+    `OrderDependentExprError` - collect them first - and batch APIs never
+    concatenate frames of schemas using them (see `dattrs.batch`). Results
+    are passed back as NumPy arrays, meaning nulls of "arrow" results are
+    only kept in floating-point results (as NaN).
+
+    Parameters
+    ----------
+    function : Callable[[Any], Any]
+        Function mapping an array of values to an array of results.
+    return_dtype : DType | type[DType]
+        Data type of the results, e.g. `nw.Boolean` for validators.
+    format : str
+        Format of the arrays passed to `function`, either "numpy" or "arrow".
+
+    Returns
+    -------
+    Callable[[nw.Expr], nw.Expr]
+        Function to pass as a field's converter or validator, e.g.
+        `field(validator=batch_udf(np.isfinite, nw.Boolean))`.
+    """
+    if format not in _FORMATS:
+        raise ValueError(f"Format must be one of {_FORMATS}, received: {format!r}.")
+
+    call = functools.partial(_call_batch, function, format)
+
+    def apply(expr: nw.Expr) -> nw.Expr:
+        return expr.map_batches(call, return_dtype=return_dtype)
+
+    return apply
+
+
+def _call_batch(function: Callable[[Any], Any], format: str, series: Any) -> Any:
+    """
+    Call a batch function with a column in `format`, returning a NumPy array.
+
+    Narwhals passes each backend's series, which are read through the public
+    `nw.Series` API.
+    """
+    import numpy as np
+
+    column = nw.from_native(series, series_only=True)
+    values = column.to_numpy() if format == "numpy" else column.to_arrow()
+
+    result = function(values)
+    if len(result) != len(column):
+        raise ValueError(
+            f"Batch functions must return one value per observation, received {len(result)} for {len(column)}."
+        )
+    # NumPy arrays are the only results all eager backends take back
+    return np.asarray(result)
@@ -1,16 +1,104 @@
 from typing import Any
-from typing import Callable
+from collections.abc import Callable, Hashable, Iterable
+import functools
+import importlib
+import inspect
+
+from attrs import Attribute
 
 import narwhals as nw
 from narwhals.dtypes import DType
+from narwhals.typing import FrameT, IntoFrameT
 from narwhals.utils import Implementation, Version, isinstance_or_issubclass
 
 
+def _field_option(fld: Attribute, key: str, default: Any = None) -> Any:
+    """
+    Return `dattrs` option defined in a field's metadata.
+
+    Options are namespaced under the "dattrs" key, e.g.
+    `field(metadata={"dattrs": {"cost": 10}})`.
+    """
+    return fld.metadata.get("dattrs", {}).get(key, default)
+
+
+def _is_narwhals_frame(data: Any) -> bool:
+    """Whether `data` is already a Narwhals DataFrame or LazyFrame."""
+    return isinstance(data, (nw.DataFrame, nw.LazyFrame))
+
+
+def _to_native_like(frame: FrameT, data: IntoFrameT) -> IntoFrameT:
+    """
+    Return `frame` in the same form as `data`.
+
+    Narwhals inputs are returned as Narwhals objects, native inputs are
+    returned as native objects. Lazy inputs are never collected.
+    """
+    return frame if _is_narwhals_frame(data) else frame.to_native()
+
+
+# narwhals module defining `native_to_narwhals_dtype` for each backend
+_NATIVE_DTYPE_MODULES: dict[Implementation, str] = {
+    Implementation.PYARROW: "narwhals._arrow.utils",
+    Implementation.DASK: "narwhals._dask.utils",
+    Implementation.DUCKDB: "narwhals._duckdb.utils",
+    Implementation.IBIS: "narwhals._ibis.utils",
+    Implementation.PANDAS: "narwhals._pandas_like.utils",
+    Implementation.MODIN: "narwhals._pandas_like.utils",
+    Implementation.CUDF: "narwhals._pandas_like.utils",
+    Implementation.POLARS: "narwhals._polars.utils",
+    Implementation.PYSPARK: "narwhals._spark_like.utils",
+    Implementation.PYSPARK_CONNECT: "narwhals._spark_like.utils",
+    Implementation.SQLFRAME: "narwhals._spark_like.utils",
+}
+
+
+@functools.cache
+def _backend_version(implementation: Implementation) -> tuple[int, ...]:
+    """Return (cached) version of the backend's installed package."""
+    return implementation._backend_version()
+
+
+@functools.cache
+def _native_dtype_resolver(
+    implementation: Implementation, version: Version
+) -> Callable[[Any], DType]:
+    """
+    Return backend's native-to-Narwhals dtype function with arguments bound.
+
+    Narwhals backends differ in the arguments their casting functions expect,
+    so the signature is inspected once and only supported arguments are bound.
+    """
+    module = importlib.import_module(_NATIVE_DTYPE_MODULES[implementation])
+    cast_func = module.native_to_narwhals_dtype
+    parameters = inspect.signature(cast_func).parameters
+
+    arguments = {"version": version}
+    if "backend_version" in parameters:
+        arguments["backend_version"] = _backend_version(implementation)
+    if "implementation" in parameters:
+        arguments["implementation"] = implementation
+    if "spark_types" in parameters:
+        arguments["spark_types"] = module.import_native_dtypes(implementation)
+    return functools.partial(cast_func, **arguments)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_native_dtype(
+    dtype: Any,
+    version: Version,
+    implementation: Implementation,
+    backend_version: tuple[int, ...],
+) -> DType:
+    """Resolve (and cache) native data type, keyed by backend and its version."""
+    return _native_dtype_resolver(implementation, version)(dtype)
+
+
 def _proxy_native_to_narwhals_dtype(
     dtype: Any | DType,
     version: Version = Version.MAIN,
     implementation: Implementation | None = None,
-) -> Callable:
+) -> DType:
     """Cast data type to narwhals from any supported backend."""
 
     if isinstance_or_issubclass(dtype, DType):
@@ -19,38 +107,33 @@ def _proxy_native_to_narwhals_dtype(
     if not isinstance(implementation, Implementation):
         raise ValueError("Must pass implementation to infer data type.")
 
-    if implementation.is_pyarrow():
-        cast_func = nw._arrow.utils.native_to_narwhals_dtype
-
-    elif implementation.is_dask():
-        cast_func = nw._dask.utils.native_to_narwhals_dtype
-
-    elif implementation.is_duckdb():
-        cast_func = nw._duckdb.utils.native_to_narwhals_dtype
-
-    elif implementation.is_ibis():
-        cast_func = nw._ibis.utils.native_to_narwhals_dtype
-
-    elif implementation.is_pandas_like():
-        cast_func = nw._pandas_like.utils.native_to_narwhals_dtype
-
-    elif implementation.is_polars():
-        cast_func = nw._polars.utils.native_to_narwhals_dtype
-
-    elif implementation.is_spark_like():
-        cast_func = nw._spark_like.utils.native_to_narwhals_dtype
-
-    else:
+    if implementation not in _NATIVE_DTYPE_MODULES:
         raise ValueError(
             f"Unable to find Narwhals data type casting method for {implementation}. Please make sure this backend is supported by Narwhals."
         )
 
-    try:
-        return cast_func(
-            dtype, version=version, backend_version=implementation._backend_version()
-        )
-    except Exception:
-        return cast_func(
-            dtype,
-            version=version,
-        )
+    if not isinstance(dtype, Hashable):
+        return _native_dtype_resolver(implementation, version)(dtype)
+    return _resolve_native_dtype(
+        dtype, version, implementation, _backend_version(implementation)
+    )
+
+
+def _project(
+    frame: FrameT, columns: frozenset[str] | None, keep: Iterable[str] = ()
+) -> FrameT:
+    """
+    Select `columns` of `frame`, keeping their order.
+
+    Returns `frame` unchanged if `columns` is None (i.e. unknown) or already
+    covers all of its columns. If no column is required, the first column is
+    kept, since frames without columns cannot count observations. Columns in
+    `keep` are selected too, if present.
+    """
+    if columns is None:
+        return frame
+    columns = columns.union(keep)
+    names = frame.collect_schema().names()
+    if columns.issuperset(names):
+        return frame
+    return frame.select(*([name for name in names if name in columns] or names[:1]))
@@ -1,50 +1,222 @@
-from typing import Iterable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from collections.abc import Iterable, Callable, Sequence
 import functools
+import logging
 import operator
+import time
 
 import attrs
 from attrs import Attribute
 
 import narwhals as nw
-from narwhals.typing import IntoDataFrameT, DataFrameT
+from narwhals.typing import IntoFrameT, FrameT
 
+from dattrs.engine import _to_engine
+from dattrs.hooks import Hooks, _field_hooks, _profile_fields, _resolve_hooks, _stage
+from dattrs.plan import compile_plan
+from dattrs.report import FieldReport, ValidationReport
+from dattrs.sample import _sample, _wilson_interval
+from dattrs.utils import _project
 
-def validate(schema: type, data: IntoDataFrameT, **configuration) -> IntoDataFrameT:
+
+logger = logging.getLogger("dattrs")
+
+
+def validate(
+    schema: type,
+    data: IntoFrameT,
+    *,
+    max_examples: int = 0,
+    fail_fast: bool = False,
+    sample: float | int | None = None,
+    seed: int | None = None,
+    confidence: float = 0.95,
+    workers: int | None = None,
+    engine: str | None = None,
+    hooks: Sequence[Hooks] = (),
+    **configuration,
+) -> ValidationReport:
     """
     Run class-defined validations against a DataFrame.
 
+    All field-level predicates are reduced to failure counts in a single
+    `select`, meaning the data is scanned once regardless of how many fields
+    define validators. Lazy inputs are only collected to compute these counts,
+    and only the columns read by validators are selected from them (unless
+    examples are kept), meaning other columns of a scan are never read.
+
     Parameters
     ----------
     schema : type
         An attrs-like class.
-    data : IntoDataFrameT
-        An object that can be converted to a Narwhals DataFrame.
+    data : IntoFrameT
+        An object that can be converted to a Narwhals DataFrame or LazyFrame.
+    max_examples : int
+        Maximum number of failing observations to keep per field. Examples are
+        gathered with `head`, meaning failures are never fully materialized.
+    fail_fast : bool
+        Whether to stop at the first field with a failing observation. Fields
+        are checked one at a time from cheapest to most expensive (see
+        `Plan.costs`), each by probing for a single failing observation.
+        Cannot be combined with `sample` or `workers`.
+    sample : float | int, optional
+        Fraction (if float) or number (if int) of observations to validate.
+        Failure ratios are estimated from the sample, except for fields marked
+        as exact, e.g. `field(metadata={"dattrs": {"exact": True}})`.
+    seed : int, optional
+        Seed used to draw the sample.
+    confidence : float
+        Confidence level of intervals around sampled failure ratios.
+    workers : int, optional
+        Number of threads evaluating fields concurrently. Only applies to eager
+        backends (e.g. pandas, PyArrow) whose compute kernels release the GIL;
+        lazy backends are validated in a single pass and parallelize on their own.
+        If sampling, both the sampled and the exact fields are evaluated
+        concurrently.
+    engine : str, optional
+        Eager backend to run validations on, e.g. "polars" for pandas inputs.
+        Data is moved there through Arrow, without copying buffers Arrow can
+        share. Ignored for lazy inputs.
+    hooks : Sequence[Hooks]
+        Hooks to call around the validation and each field, in addition to
+        registered hooks. See `dattrs.hooks`.
+    **configuration
+        Keyword arguments to configure validation.
 
     Returns
     -------
-    IntoDataFrameT
-        The `data` in its original backend.
+    ValidationReport
+        Failure counts, ratios, timings and examples of each validated field.
+    """
+    options = dict(
+        max_examples=max_examples,
+        fail_fast=fail_fast,
+        sample=sample,
+        seed=seed,
+        confidence=confidence,
+        workers=workers,
+        **configuration,
+    )
+
+    if engine is not None:
+        data, _ = _to_engine(nw.from_native(data), engine)
+
+    hooks = _resolve_hooks(schema, hooks)
+    if not hooks:
+        report = _validate(schema=schema, data=data, **options)
+        _log_report(report)
+        return report
+
+    _data = nw.from_native(data)
+    with _stage(hooks, name="validate", schema=schema, data=_data) as event:
+        report = _validate(schema=schema, data=_data, **options)
+        if report.fields and report.fields[0].exact:
+            event.rows = report.fields[0].observations
+    _profile_validations(
+        hooks, schema=schema, data=_data, strict=configuration.get("strict", True)
+    )
+    _log_report(report)
+    return report
+
+
+def _validate(
+    schema: type,
+    data: IntoFrameT,
+    *,
+    max_examples: int = 0,
+    fail_fast: bool = False,
+    sample: float | int | None = None,
+    seed: int | None = None,
+    confidence: float = 0.95,
+    workers: int | None = None,
+    **configuration,
+) -> ValidationReport:
     """
+    Run class-defined validations against a DataFrame, without logging.
 
+    See `validate` for details.
+    """
     assert attrs.has(schema)
 
+    if fail_fast:
+        combined = [
+            name
+            for name, value in (("sample", sample), ("workers", workers))
+            if value is not None
+        ]
+        if combined:
+            raise ValueError(f"Cannot combine fail_fast with options: {combined}.")
+
     _data = nw.from_native(data)
-    for fld in attrs.fields(schema):
-        if fld.validator is None:
-            continue
-        _validate_field(data=_data, fld=fld, **configuration)
+    plan = compile_plan(
+        schema=schema,
+        columns=_data.collect_schema().names(),
+        implementation=_data.implementation,
+        strict=configuration.get("strict", True),
+    )
+    # examples are whole observations, so only project if none are kept
+    if isinstance(_data, nw.LazyFrame) and not max_examples:
+        _data = _project(_data, plan.validation_columns)
+
+    if fail_fast:
+        report = _evaluate_fail_fast(
+            data=_data, queries=plan.validations, costs=plan.costs
+        )
+    elif sample is not None:
+        report = _evaluate_sample(
+            data=_data,
+            queries=plan.validations,
+            exact=plan.exact,
+            sample=sample,
+            seed=seed,
+            confidence=confidence,
+            max_examples=max_examples,
+            workers=workers,
+        )
+    elif workers is not None and isinstance(_data, nw.DataFrame):
+        report = _evaluate_parallel(
+            data=_data,
+            queries=plan.validations,
+            workers=workers,
+            max_examples=max_examples,
+        )
+    else:
+        report = _evaluate(
+            data=_data, queries=plan.validations, max_examples=max_examples
+        )
+    return report
 
-    return data
 
+def _profile_validations(
+    hooks: tuple[Hooks, ...], schema: type, data: FrameT, strict: bool = True
+) -> None:
+    """Emit field events timing each field's validation on its own."""
+    if not _field_hooks(hooks):
+        return
 
-def _validate_field(data: DataFrameT, fld: Attribute, **configuration) -> None:
+    plan = compile_plan(
+        schema=schema,
+        columns=data.collect_schema().names(),
+        implementation=data.implementation,
+        strict=strict,
+    )
+    _profile_fields(
+        hooks,
+        stage="validate",
+        schema=schema,
+        data=data,
+        queries=plan.validations,
+        evaluate=lambda data, query: _count_failures(data, {"failures": query})[0],
+    )
+
+
+def _validate_field(fld: Attribute, **configuration) -> nw.Expr:
     """
-    Apply validations, if defined, at field level.
+    Construct validation predicate, if defined, at field level.
 
     Parameters
     ----------
-    data : DataFrameT
-        A Narwhals DataFrame.
     fld : Attribute
         An `attrs` attribute, typically an instance of `attrs.field()`.
     **configuration
@@ -52,25 +224,331 @@ def _validate_field(data: DataFrameT, fld: Attribute, **configuration) -> None:
 
     Returns
     -------
-    None
-        This function runs as a side-effect. Eventually, it will return
-        failures and other useful information.
+    nw.Expr
+        Boolean expression evaluating to True for observations that pass all
+        (or any, if not `strict`) of the field's validators.
     """
 
     configuration.setdefault("strict", True)
-    validators: Iterable[Callable] = (
+    return functools.reduce(
+        operator.and_ if configuration.get("strict") else operator.or_,
+        map(lambda func: func(nw.col(fld.alias)), _field_validators(fld)),
+    )
+
+
+def _field_validators(fld: Attribute) -> Iterable[Callable]:
+    """Return validators defined on a field, unpacking composed validators."""
+    return (
         fld.validator._validators
         if hasattr(fld.validator, "_validators")
         else (fld.validator,)
     )
 
-    query = functools.reduce(
-        operator.and_ if configuration.get("strict") else operator.or_,
-        map(lambda func: func(nw.col(fld.alias)), validators),
+
+def _evaluate(
+    data: FrameT,
+    queries: dict[str, nw.Expr],
+    *,
+    max_examples: int = 0,
+    stage: str | None = None,
+) -> ValidationReport:
+    """
+    Evaluate predicates against `data` in a single pass.
+
+    Parameters
+    ----------
+    data : FrameT
+        A Narwhals DataFrame or LazyFrame.
+    queries : dict[str, nw.Expr]
+        Mapping of field names to boolean predicates.
+    max_examples : int
+        Maximum number of failing observations to keep per field.
+    stage : str, optional
+        Stage to label field reports with.
+
+    Returns
+    -------
+    ValidationReport
+        Outcome of each predicate.
+    """
+    start = time.perf_counter()
+    if not queries:
+        return ValidationReport()
+
+    observations, counts = _count_failures(data=data, queries=queries)
+    elapsed = time.perf_counter() - start
+    fields = [
+        FieldReport(
+            name=name,
+            failures=failures,
+            observations=observations,
+            elapsed=elapsed,
+            stage=stage,
+        )
+        for name, failures in counts.items()
+    ]
+    _attach_examples(
+        data=data, queries=queries, fields=fields, max_examples=max_examples
+    )
+    return ValidationReport(fields=fields, elapsed=time.perf_counter() - start)
+
+
+def _evaluate_fail_fast(
+    data: FrameT,
+    queries: dict[str, nw.Expr],
+    costs: dict[str, float],
+    *,
+    stage: str | None = None,
+) -> ValidationReport:
+    """
+    Evaluate predicates one at a time, stopping at the first failure.
+
+    Parameters
+    ----------
+    data : FrameT
+        A Narwhals DataFrame or LazyFrame.
+    queries : dict[str, nw.Expr]
+        Mapping of field names to boolean predicates.
+    costs : dict[str, float]
+        Relative cost of evaluating each predicate; cheapest are run first.
+    stage : str, optional
+        Stage to label field reports with.
+
+    Returns
+    -------
+    ValidationReport
+        Outcome of each evaluated predicate. Fields after the first failure
+        are not evaluated and the failure count of the failed field is a
+        lower bound.
+    """
+    start = time.perf_counter()
+    fields = []
+    for name in sorted(queries, key=costs.__getitem__):
+        field_start = time.perf_counter()
+        failed = _probe(data=data, query=queries[name])
+        fields.append(
+            FieldReport(
+                name=name,
+                failures=int(failed),
+                observations=0,
+                elapsed=time.perf_counter() - field_start,
+                stage=stage,
+                exact=False,
+            )
+        )
+        if failed:
+            break
+    return ValidationReport(fields=fields, elapsed=time.perf_counter() - start)
+
+
+def _evaluate_parallel(
+    data: nw.DataFrame,
+    queries: dict[str, nw.Expr],
+    workers: int,
+    *,
+    max_examples: int = 0,
+    stage: str | None = None,
+) -> ValidationReport:
+    """
+    Evaluate predicates concurrently, one field per task.
+
+    Parameters
+    ----------
+    data : nw.DataFrame
+        A Narwhals DataFrame.
+    queries : dict[str, nw.Expr]
+        Mapping of field names to boolean predicates.
+    workers : int
+        Maximum number of threads evaluating fields.
+    max_examples : int
+        Maximum number of failing observations to keep per field.
+    stage : str, optional
+        Stage to label field reports with.
+
+    Returns
+    -------
+    ValidationReport
+        Outcome of each predicate, timed per field.
+    """
+    if workers < 1:
+        raise ValueError(f"Number of workers must be positive, received: {workers}.")
+
+    def _evaluate_field(name: str) -> FieldReport:
+        (fld,) = _evaluate(
+            data=data,
+            queries={name: queries[name]},
+            max_examples=max_examples,
+            stage=stage,
+        ).fields
+        return fld
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fields = list(executor.map(_evaluate_field, queries))
+    return ValidationReport(fields=fields, elapsed=time.perf_counter() - start)
+
+
+def _evaluate_sample(
+    data: FrameT,
+    queries: dict[str, nw.Expr],
+    exact: frozenset[str],
+    sample: float | int,
+    *,
+    seed: int | None = None,
+    confidence: float = 0.95,
+    max_examples: int = 0,
+    workers: int | None = None,
+    stage: str | None = None,
+) -> ValidationReport:
+    """
+    Estimate failure ratios from a random sample of observations.
+
+    Parameters
+    ----------
+    data : FrameT
+        A Narwhals DataFrame or LazyFrame.
+    queries : dict[str, nw.Expr]
+        Mapping of field names to boolean predicates.
+    exact : frozenset[str]
+        Fields to always validate against all observations.
+    sample : float | int
+        Fraction (if float) or number (if int) of observations to sample.
+    seed : int, optional
+        Seed used to draw the sample.
+    confidence : float
+        Confidence level of intervals around sampled failure ratios.
+    max_examples : int
+        Maximum number of failing observations to keep per field.
+    workers : int, optional
+        Number of threads evaluating fields concurrently, for eager frames.
+    stage : str, optional
+        Stage to label field reports with.
+
+    Returns
+    -------
+    ValidationReport
+        Outcome of each predicate; sampled fields are marked as not exact and
+        include a confidence interval of their failure ratio.
+    """
+    evaluate = _evaluate
+    if workers is not None and isinstance(data, nw.DataFrame):
+        evaluate = functools.partial(_evaluate_parallel, workers=workers)
+
+    start = time.perf_counter()
+    exact_report = evaluate(
+        data=data,
+        queries={name: query for name, query in queries.items() if name in exact},
+        max_examples=max_examples,
+        stage=stage,
+    )
+    sample_report = evaluate(
+        data=_sample(data=data, sample=sample, seed=seed),
+        queries={name: query for name, query in queries.items() if name not in exact},
+        max_examples=max_examples,
+        stage=stage,
     )
-    try:
-        failures = data.filter(~query)
-        assert failures.is_empty()
-        print(f"[SUCCESS] All observations passed for {fld.name}.")
-    except AssertionError:
-        print(f"[FAILURE] {failures.shape[0]:,} observations failed for {fld.name}.")
+    for fld in sample_report.fields:
+        fld.exact = False
+        fld.interval = _wilson_interval(
+            failures=fld.failures,
+            observations=fld.observations,
+            confidence=confidence,
+        )
+
+    fields = {fld.name: fld for fld in exact_report.fields + sample_report.fields}
+    return ValidationReport(
+        fields=[fields[name] for name in queries],
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def _probe(data: FrameT, query: nw.Expr) -> bool:
+    """
+    Return whether any observation fails `query`.
+
+    Lazy backends are asked for a single failing observation, allowing them to
+    stop scanning at the first match; eager backends reduce with `any`.
+    """
+    if isinstance(data, nw.LazyFrame):
+        return not data.filter(~query).head(1).collect().is_empty()
+    return bool(data.select((~query).any()).item())
+
+
+def _count_failures(
+    data: FrameT, queries: dict[str, nw.Expr]
+) -> tuple[int, dict[str, int]]:
+    """
+    Count observations failing each predicate in a single pass over `data`.
+
+    Parameters
+    ----------
+    data : FrameT
+        A Narwhals DataFrame or LazyFrame.
+    queries : dict[str, nw.Expr]
+        Mapping of output names to boolean predicates.
+
+    Returns
+    -------
+    tuple[int, dict[str, int]]
+        Number of observations and number of observations failing each
+        predicate.
+    """
+    counts = data.select(
+        nw.len().cast(nw.Int64).alias("__dattrs_observations__"),
+        *((~query).sum().cast(nw.Int64).alias(name) for name, query in queries.items()),
+    )
+    if isinstance(counts, nw.LazyFrame):
+        counts = counts.collect()
+    observations, *failures = (int(value or 0) for value in counts.row(0))
+    return observations, dict(zip(queries, failures))
+
+
+def _collect_examples(
+    data: FrameT, query: nw.Expr, max_examples: int
+) -> list[dict[str, Any]]:
+    """Return at most `max_examples` observations failing `query`."""
+    examples = data.filter(~query).head(max_examples)
+    if isinstance(examples, nw.LazyFrame):
+        examples = examples.collect()
+    return examples.rows(named=True)
+
+
+def _attach_examples(
+    data: FrameT,
+    queries: dict[str, nw.Expr],
+    fields: list[FieldReport],
+    max_examples: int,
+) -> None:
+    """Gather examples of failing observations for each failed field report."""
+    if max_examples <= 0:
+        return
+
+    for fld in fields:
+        if fld.passed:
+            continue
+        start = time.perf_counter()
+        fld.examples = _collect_examples(
+            data=data, query=queries[fld.name], max_examples=max_examples
+        )
+        fld.elapsed += time.perf_counter() - start
+
+
+def _log_report(report: ValidationReport) -> None:
+    """Log outcome of each field's validation."""
+    for fld in report.fields:
+        if fld.passed:
+            logger.info("[SUCCESS] All observations passed for %s.", fld.key)
+        elif fld.interval is not None:
+            logger.warning(
+                "[FAILURE] %.2f%% (%.2f%% - %.2f%%) of sampled observations failed for %s.",
+                fld.ratio * 100,
+                fld.interval[0] * 100,
+                fld.interval[1] * 100,
+                fld.key,
+            )
+        elif not fld.exact:
+            logger.warning("[FAILURE] Observations failed for %s.", fld.key)
+        else:
+            logger.warning(
+                "[FAILURE] %s observations failed for %s.", f"{fld.failures:,}", fld.key
+            )
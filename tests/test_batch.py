@@ -0,0 +1,119 @@
+import duckdb
+import narwhals as nw
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from attrs import field
+
+from dattrs.batch import _map_concatenated
+from dattrs.hooks import TraceCollector
+from dattrs.schema import schema
+
+
+@schema
+class Unique:
+    id: nw.Int64 = field(validator=nw.Expr.is_unique)
+
+
+@schema
+class Centered:
+    value: nw.Float64 = field(converter=lambda expr: expr - expr.mean())
+
+
+@schema
+class Scaled:
+    value: nw.Float64 = field(
+        converter=lambda expr: expr * 2, validator=lambda expr: expr > 0
+    )
+
+
+CONSTRUCTORS = {
+    "polars": pl.DataFrame,
+    "polars-lazy": pl.LazyFrame,
+    "pandas": pd.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+def _values(frame, column):
+    return nw.from_native(frame).lazy().collect()[column].to_list()
+
+
+def _failures(reports):
+    return [[fld.failures for fld in report.fields] for report in reports]
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_concat_validate_keeps_predicates_per_frame(constructor):
+    frames = [constructor({"id": [1, 2]}), constructor({"id": [1, 2]})]
+    separate = Unique.validate_many(frames)
+    concatenated = Unique.validate_many(frames, concat=True)
+    assert _failures(separate) == _failures(concatenated) == [[0], [0]]
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_concat_convert_keeps_aggregations_per_frame(constructor):
+    frames = [
+        constructor({"value": [1.0, 3.0]}),
+        constructor({"value": [10.0, 30.0]}),
+    ]
+    separate = Centered.convert_many(frames)
+    concatenated = Centered.convert_many(frames, concat=True)
+    expected = [[-1.0, 1.0], [-10.0, 10.0]]
+    assert [_values(frame, "value") for frame in separate] == expected
+    assert [_values(frame, "value") for frame in concatenated] == expected
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_concat_matches_per_frame(constructor):
+    frames = [
+        constructor({"value": [1.0, -2.0]}),
+        constructor({"value": [-3.0, 4.0, 5.0]}),
+    ]
+    separate = Scaled.convert_many(frames)
+    concatenated = Scaled.convert_many(frames, concat=True)
+    assert [_values(frame, "value") for frame in concatenated] == [
+        _values(frame, "value") for frame in separate
+    ]
+    assert _failures(Scaled.validate_many(frames, concat=True)) == _failures(
+        Scaled.validate_many(frames)
+    )
+    assert _failures(Scaled.validate_many(frames)) == [[1], [1]]
+
+
+@pytest.mark.parametrize(
+    "constructor",
+    [pl.LazyFrame, lambda data: duckdb.from_arrow(pa.table(data))],
+    ids=["polars-lazy", "duckdb"],
+)
+def test_concat_splits_shuffled_lazy_output(constructor):
+    frames = [constructor({"value": [1, 2]}), constructor({"value": [10, 20, 30]})]
+
+    def shuffle(data, keep=()):
+        # lazy backends may return concatenated rows in any order
+        return data.sort("value", descending=True)
+
+    outputs = _map_concatenated(frames, shuffle, elementwise=lambda data: True)
+    assert [sorted(_values(output, "value")) for output in outputs] == [
+        [1, 2],
+        [10, 20, 30],
+    ]
+    assert all(isinstance(output, nw.LazyFrame) for output in outputs)
+
+
+def test_validate_many_honours_hooks():
+    collector = TraceCollector()
+    frames = [pl.DataFrame({"id": [1, 1]}), pl.DataFrame({"id": [2]})]
+    reports = Unique.validate_many(frames, hooks=[collector])
+    assert _failures(reports) == [[2], [0]]
+    assert len(collector.events) == len(frames)
+
+
+@pytest.mark.parametrize("concat", [False, True])
+def test_validate_many_honours_engine(concat):
+    frames = [pd.DataFrame({"id": [1, 1]}), pd.DataFrame({"id": [2, 3]})]
+    reports = Unique.validate_many(frames, engine="polars", concat=concat)
+    assert _failures(reports) == [[2], [0]]
+    with pytest.raises(ValueError, match="Engine must be an eager backend"):
+        Unique.validate_many(frames, engine="duckdb", concat=concat)
@@ -0,0 +1,70 @@
+import importlib.util
+import json
+import logging
+import pathlib
+
+import pytest
+
+PATH = pathlib.Path(__file__).parents[1] / "benchmarks" / "run.py"
+
+
+@pytest.fixture(scope="module")
+def benchmarks():
+    spec = importlib.util.spec_from_file_location("benchmarks_run", PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # cases silence the dattrs logger, which later tests rely on
+    level = logging.getLogger("dattrs").level
+    yield module
+    logging.getLogger("dattrs").setLevel(level)
+
+
+def _run(benchmarks, output, *arguments):
+    return benchmarks.main(
+        [
+            "--rows",
+            "100",
+            "--fields",
+            "2",
+            "--validators",
+            "0",
+            "2",
+            "--repeat",
+            "1",
+            "--in-process",
+            "--output",
+            str(output),
+            *arguments,
+        ]
+    )
+
+
+def test_benchmarks_run_every_case(benchmarks, tmp_path):
+    output = tmp_path / "results.json"
+    assert _run(benchmarks, output) == 0
+    results = json.loads(output.read_text())
+    cases = {
+        (result["backend"], result["validators"], result["operation"])
+        for result in results["results"]
+    }
+    assert len(cases) == len(results["results"]) == 5 * 2 * 4
+    assert all(
+        result["rows"] == 100 and result["median"] > 0 and result["peak_memory_mb"] > 0
+        for result in results["results"]
+    )
+    assert results["metadata"]["repeat"] == 1
+    assert set(results["metadata"]["versions"]) >= {"narwhals", "polars", "duckdb"}
+
+
+def test_benchmarks_flag_regressions(benchmarks, tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    _run(benchmarks, baseline, "--backends", "polars", "--operations", "validate")
+    data = json.loads(baseline.read_text())
+    for result in data["results"]:
+        result["median"] /= 1_000
+    baseline.write_text(json.dumps(data))
+
+    output = tmp_path / "results.json"
+    arguments = ("--backends", "polars", "--operations", "validate")
+    assert _run(benchmarks, output, *arguments, "--compare", str(baseline)) == 1
+    assert capsys.readouterr().out.count("REGRESSION") == 2
@@ -0,0 +1,100 @@
+import datetime
+
+import attrs
+import narwhals as nw
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from dattrs.config.compile import compile_stage
+from dattrs.config.models import Expression, Field, Stage
+
+STAGE = """
+schema:
+  id:
+    dtype: int
+    validator:
+      - function: ge
+        parameters:
+          other: 0
+  name:
+    alias: label
+    converter:
+      - function: str.to_uppercase
+  day:
+    dtype: date
+    validator:
+      - function: is_between
+        parameters:
+          lower_bound: "2024-01-01"
+          upper_bound: "2024-12-31"
+  score:
+    dtype: double
+    default: 0.0
+"""
+
+CONSTRUCTORS = {
+    "polars": pl.DataFrame,
+    "pandas": pd.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+@pytest.fixture
+def stage(tmp_path):
+    path = tmp_path / "stage.yaml"
+    path.write_text(STAGE)
+    return Stage(name="Events", path=str(path))
+
+
+def test_compiled_stage_is_a_schema(stage):
+    Events = compile_stage(stage)
+    assert Events.__name__ == "Events"
+    fields = attrs.fields_dict(Events)
+    assert list(fields) == ["id", "name", "day", "score"]
+    assert fields["id"].type is nw.Int64 and fields["day"].type is None
+    assert fields["name"].alias == "label"
+    assert fields["score"].default == 0.0 and fields["id"].default is attrs.NOTHING
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_compiled_stage_runs_on_backends(stage, constructor):
+    data = constructor(
+        {
+            "id": [1, -1],
+            "name": ["a", "b"],
+            "day": ["2024-01-02 00:00:00", "2025-01-02 00:00:00"],
+        }
+    )
+    Events = compile_stage(stage)
+    output = nw.from_native(Events.convert(data, strict=True))
+    assert output["label"].to_list() == ["A", "B"]
+    assert output["day"].to_list() == [
+        datetime.date(2024, 1, 2),
+        datetime.date(2025, 1, 2),
+    ]
+    assert output["score"].to_list() == [0.0, 0.0]
+    report = Events.validate(output)
+    assert report.failures == {"id": 1, "day": 1}
+
+
+def test_compiled_stages_are_cached(stage):
+    assert compile_stage(stage) is compile_stage(stage.parse()) is stage.compile()
+    changed = Stage(
+        name="Events",
+        path=stage.path,
+        schema=[Field(name="id", dtype="int")],
+    )
+    assert compile_stage(changed) is not compile_stage(stage)
+
+
+def test_unknown_definitions_raise(stage):
+    with pytest.raises(ValueError, match="Unknown dtype"):
+        compile_stage(
+            Stage(name="Bad", path="", schema=[Field(name="x", dtype="decimal")])
+        )
+    unknown = Field(name="x", dtype="int")
+    unknown.validator = [Expression(function="is_positive")]
+    with pytest.raises(ValueError, match="Unknown expression function"):
+        compile_stage(Stage(name="Bad", path="", schema=[unknown]))
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+import yaml
+
+from dattrs.config import cache as cache_module
+from dattrs.config.cache import clear_config_cache, load_yaml
+
+
+@pytest.fixture
+def parses(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    clear_config_cache()
+    calls = []
+    load = yaml.load
+
+    def counted(stream, Loader):
+        calls.append(stream)
+        return load(stream, Loader=Loader)
+
+    monkeypatch.setattr(cache_module.yaml, "load", counted)
+    yield calls
+    clear_config_cache()
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "stage.yaml"
+    path.write_text("schema:\n  id:\n    dtype: int\n")
+    return path
+
+
+def _touch(path, offset):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset))
+
+
+def test_cached_documents_are_copies(parses, path):
+    document = load_yaml(str(path))
+    document["schema"]["id"]["dtype"] = "string"
+    assert load_yaml(str(path)) == {"schema": {"id": {"dtype": "int"}}}
+    assert len(parses) == 1
+
+
+def test_changed_files_are_parsed_again(parses, path):
+    load_yaml(str(path))
+    path.write_text("schema:\n  id:\n    dtype: string\n")
+    _touch(path, 1_000_000_000)
+    assert load_yaml(str(path)) == {"schema": {"id": {"dtype": "string"}}}
+    assert len(parses) == 2
+
+
+def test_same_size_edits_are_detected(parses, path):
+    load_yaml(str(path))
+    path.write_text("schema:\n  id:\n    dtype: abc\n")
+    _touch(path, 1_000_000_000)
+    assert load_yaml(str(path)) == {"schema": {"id": {"dtype": "abc"}}}
+
+
+def test_touched_files_are_hashed_not_parsed(parses, path):
+    load_yaml(str(path))
+    _touch(path, 1_000_000_000)
+    assert load_yaml(str(path)) == {"schema": {"id": {"dtype": "int"}}}
+    assert len(parses) == 1
+
+
+def test_disk_cache_outlives_memory(parses, path, tmp_path):
+    load_yaml(str(path))
+    clear_config_cache()
+    load_yaml(str(path))
+    assert len(parses) == 1
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    clear_config_cache(disk=True)
+    assert os.listdir(tmp_path / "cache") == []
+    load_yaml(str(path))
+    assert len(parses) == 2
+
+
+def test_disabled_disk_cache(parses, path, monkeypatch):
+    monkeypatch.setattr(cache_module, "CONFIG_CACHE_DIR", "")
+    load_yaml(str(path))
+    clear_config_cache()
+    load_yaml(str(path))
+    assert len(parses) == 2
+
+
+def test_corrupt_entries_are_ignored(parses, path, tmp_path):
+    load_yaml(str(path))
+    (entry,) = (tmp_path / "cache").iterdir()
+    entry.write_bytes(b"not a pickle")
+    clear_config_cache()
+    assert load_yaml(str(path)) == {"schema": {"id": {"dtype": "int"}}}
+    assert len(parses) == 2
@@ -0,0 +1,73 @@
+import duckdb
+import narwhals as nw
+import polars as pl
+import pyarrow as pa
+import pytest
+from attrs import field
+
+from dattrs.schema import schema
+
+
+@schema
+class Scaled:
+    x: nw.Int64 = field(
+        converter=lambda expr: expr * 10, validator=lambda expr: expr > 0
+    )
+    y: nw.String = field(default="missing")
+
+
+LAZY = {
+    "polars-lazy": pl.LazyFrame,
+    "duckdb": lambda data: duckdb.from_arrow(pa.table(data)),
+}
+
+
+@pytest.fixture
+def collects(monkeypatch):
+    calls = []
+    collect = nw.LazyFrame.collect
+
+    def counted(self, *args, **kwargs):
+        calls.append(self)
+        return collect(self, *args, **kwargs)
+
+    monkeypatch.setattr(nw.LazyFrame, "collect", counted)
+    return calls
+
+
+def _rows(frame):
+    return sorted(nw.from_native(frame).lazy().collect().rows())
+
+
+@pytest.mark.parametrize("constructor", LAZY.values(), ids=LAZY)
+def test_lazy_convert_is_not_collected(constructor, collects):
+    data = constructor({"x": [2, -1, 1]})
+    output = Scaled.convert(data)
+    assert type(output) is type(data)
+    assert not collects
+    assert _rows(output) == [(-10, "missing"), (10, "missing"), (20, "missing")]
+
+
+@pytest.mark.parametrize("constructor", LAZY.values(), ids=LAZY)
+def test_lazy_validate_collects_counts_only(constructor, collects):
+    report = Scaled.validate(constructor({"x": [2, -1, 1]}))
+    assert len(collects) == 1
+    assert report.failures == {"x": 1}
+    assert report["x"].observations == 3
+
+
+@pytest.mark.parametrize("constructor", LAZY.values(), ids=LAZY)
+def test_lazy_pipe_returns_lazy_output(constructor, collects):
+    data = constructor({"x": [2, -1, 1]})
+    output, report = Scaled.pipe(data, return_report=True)
+    assert type(output) is type(data)
+    assert len(collects) == 1
+    assert report.failures == {"pre.x": 1, "post.x": 1}
+    assert _rows(output) == [(-10, "missing"), (10, "missing"), (20, "missing")]
+
+
+def test_narwhals_lazy_input_stays_narwhals():
+    data = nw.from_native(pl.LazyFrame({"x": [1]}))
+    output = Scaled.convert(data)
+    assert isinstance(output, nw.LazyFrame)
+    assert output.collect().rows() == [(10, "missing")]
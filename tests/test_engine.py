@@ -0,0 +1,60 @@
+import narwhals as nw
+import pandas as pd
+import pytest
+from attrs import field
+
+from dattrs.schema import schema
+
+
+@schema
+class Positive:
+    x: nw.Float64 = field(validator=lambda expr: expr > 0)
+
+
+@schema
+class Doubled:
+    x: nw.Float64 = field(converter=lambda expr: expr * 2)
+
+
+ENGINES = ["polars", "pyarrow"]
+
+
+def _frame(dtype="float64"):
+    return pd.DataFrame(
+        {"x": pd.array([1.0, -1.0, 2.0], dtype=dtype), "y": ["a", "b", "c"]},
+        index=[10, 20, 30],
+    )
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_quarantine_keeps_index(engine, strict):
+    valid, rejected = Positive.pipe(
+        _frame(),
+        quarantine=True,
+        convert_options={"engine": engine, "strict": strict},
+    )
+    assert valid.index.tolist() == [10, 30]
+    assert rejected.index.tolist() == [20]
+    assert valid["x"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_convert_keeps_index(engine, strict):
+    output = Doubled.convert(_frame(), engine=engine, strict=strict)
+    assert output.index.tolist() == [10, 20, 30]
+    assert output.columns.tolist() == (["x"] if strict else ["x", "y"])
+    assert output["x"].tolist() == [2.0, -2.0, 4.0]
+
+
+@pytest.mark.parametrize("dtype", ["Float64", "float64[pyarrow]"])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_keeps_dtype_backend(engine, dtype):
+    data = _frame(dtype)
+    output = Doubled.convert(data, engine=engine)
+    assert output["x"].dtype == data["x"].dtype
+    assert output["y"].dtype == data["y"].dtype
+
+    valid, _ = Positive.pipe(data, quarantine=True, convert_options={"engine": engine})
+    assert valid["x"].dtype == data["x"].dtype
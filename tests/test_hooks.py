@@ -0,0 +1,94 @@
+import json
+
+import narwhals as nw
+import polars as pl
+import pytest
+from attrs import field
+from narwhals.exceptions import InvalidOperationError
+
+from dattrs import pipe as pipe_module
+from dattrs import validate as validate_module
+from dattrs.hooks import Hooks, TraceCollector, profile
+from dattrs.schema import schema
+
+
+@schema
+class Sample:
+    x: nw.Int64 = field(
+        converter=lambda expr: expr * 2, validator=lambda expr: expr > 0
+    )
+    y: nw.String = field(validator=lambda expr: ~expr.is_null())
+
+
+@pytest.fixture
+def data():
+    return pl.DataFrame({"x": [1, -1, 2], "y": ["a", None, "c"]})
+
+
+def _names(collector, kind):
+    return [
+        (event.stage, event.name) for event in collector.events if event.kind == kind
+    ]
+
+
+@pytest.mark.parametrize("method", ["convert", "validate", "pipe"])
+def test_profile_records_stages_only_by_default(data, method):
+    with profile() as collector:
+        getattr(Sample, method)(data)
+    assert _names(collector, "stage") == [(None, method)]
+    assert _names(collector, "field") == []
+    (event,) = collector.events
+    assert event.rows == len(data) and event.elapsed >= 0
+    assert event.schema == "Sample" and event.backend == "polars"
+
+
+def test_profile_fields_records_field_events(data, tmp_path):
+    path = tmp_path / "trace.json"
+    with profile(str(path), fields=True) as collector:
+        Sample.pipe(data)
+    assert _names(collector, "stage") == [(None, "pipe")]
+    assert _names(collector, "field") == [
+        ("convert", "x"),
+        ("convert", "y"),
+        ("validate", "x"),
+        ("validate", "y"),
+    ]
+
+    trace = json.loads(path.read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        "pipe",
+        "convert.x",
+        "convert.y",
+        "validate.x",
+        "validate.y",
+    ]
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+
+
+def test_failing_stage_is_closed(data):
+    @schema
+    class Broken:
+        y: nw.Int64 = field()
+
+    collector = TraceCollector()
+    with pytest.raises(InvalidOperationError):
+        Broken.convert(data, hooks=[collector])
+    (event,) = collector.events
+    assert event.name == "convert" and event.elapsed is not None
+
+
+@pytest.mark.parametrize("module", [validate_module, pipe_module])
+def test_stage_hooks_compile_no_extra_plan(data, module, monkeypatch):
+    calls = []
+    compile_plan = module.compile_plan
+
+    def counted(*args, **kwargs):
+        calls.append(kwargs.get("schema"))
+        return compile_plan(*args, **kwargs)
+
+    monkeypatch.setattr(module, "compile_plan", counted)
+    method = Sample.validate if module is validate_module else Sample.pipe
+    method(data)
+    unprofiled = len(calls)
+    method(data, hooks=[Hooks()])
+    assert len(calls) == 2 * unprofiled
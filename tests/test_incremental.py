@@ -0,0 +1,146 @@
+import json
+import subprocess
+import sys
+import textwrap
+import threading
+
+import narwhals as nw
+import numpy as np
+import polars as pl
+from attrs import field
+
+from dattrs.incremental import _schema_hash, _value_fingerprint, validate_partitions
+from dattrs.schema import schema
+from dattrs.udf import batch_udf
+
+THRESHOLD = 0
+
+SCRIPT = textwrap.dedent(
+    """
+    import narwhals as nw
+    import numpy as np
+    from attrs import field
+
+    from dattrs.incremental import _schema_hash
+    from dattrs.schema import schema
+    from dattrs.udf import batch_udf
+
+    LIMIT = 10
+
+    def below(expr):
+        return expr < LIMIT
+
+    @schema
+    class Sample:
+        x: nw.Float64 = field(validator=[batch_udf(np.isfinite, nw.Boolean), below])
+
+    print(_schema_hash(Sample, {"strict": True}))
+    """
+)
+
+
+def _positive(expr: nw.Expr) -> nw.Expr:
+    return expr > THRESHOLD
+
+
+@schema
+class Positive:
+    x: nw.Int64 = field(validator=_positive)
+
+
+def test_schema_hash_is_stable_across_processes(tmp_path):
+    script = tmp_path / "schema.py"
+    script.write_text(SCRIPT)
+    hashes = {
+        subprocess.run(
+            [sys.executable, str(script)], capture_output=True, text=True, check=True
+        ).stdout
+        for _ in range(2)
+    }
+    (value,) = hashes
+    assert value.strip() not in ("", "None")
+
+
+def test_schema_hash_tracks_globals(monkeypatch):
+    before = _schema_hash(Positive, {})
+    monkeypatch.setattr(sys.modules[__name__], "THRESHOLD", 5)
+    assert _schema_hash(Positive, {}) != before
+
+
+def test_schema_hash_tracks_closures():
+    def make(limit):
+        @schema
+        class Bounded:
+            x: nw.Int64 = field(validator=lambda expr: expr < limit)
+
+        return Bounded
+
+    assert _schema_hash(make(1), {}) != _schema_hash(make(2), {})
+    assert _schema_hash(make(1), {}) == _schema_hash(make(1), {})
+
+
+def test_unknown_fingerprints_are_not_cached(tmp_path):
+    opaque = object()
+
+    @schema
+    class Opaque:
+        x: nw.Int64 = field(validator=lambda expr: expr.is_null() | (opaque is None))
+
+    assert _schema_hash(Opaque, {}) is None
+
+    path = tmp_path / "part.parquet"
+    pl.DataFrame({"x": [1, 2]}).write_parquet(path)
+    reads = []
+
+    def reader(path):
+        reads.append(path)
+        return pl.scan_parquet(path)
+
+    for _ in range(2):
+        validate_partitions(Opaque, [str(path)], reader=reader, cache=str(tmp_path))
+    assert len(reads) == 2
+
+
+def test_cached_partitions_are_skipped(tmp_path):
+    @schema
+    class Finite:
+        x: nw.Float64 = field(validator=batch_udf(np.isfinite, nw.Boolean))
+
+    path = tmp_path / "part.parquet"
+    pl.DataFrame({"x": [1.0, float("inf")]}).write_parquet(path)
+    reads = []
+
+    # batch functions only run on eager frames
+    def reader(path):
+        reads.append(path)
+        return pl.read_parquet(path)
+
+    reports = [
+        validate_partitions(Finite, [str(path)], reader=reader, cache=str(tmp_path))
+        for _ in range(2)
+    ]
+    assert len(reads) == 1
+    assert [report.fields[0].failures for report in reports] == [1, 1]
+
+
+def test_cache_keeps_latest_fingerprint_per_partition(tmp_path):
+    path = tmp_path / "part.parquet"
+    cache = tmp_path / "cache"
+    for values in ([1], [1, -1], [1, -1, -2]):
+        pl.DataFrame({"x": values}).write_parquet(path)
+        report = validate_partitions(
+            Positive, [str(path)], reader=pl.scan_parquet, cache=str(cache)
+        )
+        assert report.fields[0].failures == len(values) - 1
+
+    (entries,) = [json.loads(file.read_text()) for file in cache.iterdir()]
+    assert list(entries) == [str(path)]
+    assert entries[str(path)]["report"]["fields"][0]["failures"] == 2
+
+
+def test_fingerprint_of_bound_builtins():
+    low, high = {"x": 1}.get, {"x": 2}.get
+    assert _value_fingerprint(low) != _value_fingerprint(high)
+    assert _value_fingerprint(low) == _value_fingerprint({"x": 1}.get)
+    assert _value_fingerprint(len) == _value_fingerprint(len)
+    assert _value_fingerprint(threading.Lock().acquire) is None
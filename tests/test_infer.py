@@ -0,0 +1,110 @@
+import decimal
+import logging
+
+import narwhals as nw
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import yaml
+
+from dattrs.config import infer_schema, infer_stage
+from dattrs.config.compile import compile_stage
+from dattrs.config.infer import infer_columns
+from dattrs.config.models import Stage
+
+
+@pytest.fixture
+def parquet(tmp_path):
+    path = tmp_path / "data.parquet"
+    table = pa.table(
+        {
+            "id": pa.array([1, 2], pa.int32()),
+            "price": pa.array([1.5, 2.5], pa.float64()),
+            "amount": pa.array(
+                [decimal.Decimal("1.50"), decimal.Decimal("2.25")],
+                pa.decimal128(10, 2),
+            ),
+            "tags": pa.array([["a"], []], pa.list_(pa.string())),
+            "not valid": pa.array([True, False]),
+        }
+    )
+    pq.write_table(table, path)
+    return str(path)
+
+
+@pytest.fixture
+def csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,price,name,seen\n1,1.5,a,2024-01-02 03:04:05\n2,2.5,b,\n")
+    return str(path)
+
+
+def _compile(tmp_path, contents):
+    path = tmp_path / "stage.yaml"
+    path.write_text(contents)
+    return compile_stage(Stage(name="Inferred", path=str(path)).parse())
+
+
+def test_infer_columns(parquet, csv):
+    assert infer_columns(parquet) == {
+        "id": nw.Int32(),
+        "price": nw.Float64(),
+        "amount": nw.Decimal(),
+        "tags": nw.List(nw.String()),
+        "not valid": nw.Boolean(),
+    }
+    assert infer_columns(csv) == {
+        "id": nw.Int64(),
+        "price": nw.Float64(),
+        "name": nw.String(),
+        "seen": nw.Datetime("s"),
+    }
+
+
+def test_infer_columns_rejects_unknown_formats(tmp_path):
+    with pytest.raises(ValueError, match="Cannot infer data types"):
+        infer_columns(str(tmp_path / "data.ndjson"), format="ndjson")
+
+
+def test_infer_stage_names(parquet, csv, caplog):
+    with caplog.at_level(logging.WARNING, logger="dattrs"):
+        stage = yaml.safe_load(infer_stage(parquet, name="Sample"))
+    assert stage == {
+        "name": "Sample",
+        "schema": {"id": {"dtype": "Int32"}, "price": {"dtype": "double"}},
+    }
+    assert {"amount", "tags", "not valid"} == {
+        record.args[0] for record in caplog.records
+    }
+
+    assert yaml.safe_load(infer_stage(csv))["schema"] == {
+        "id": {"dtype": "int"},
+        "price": {"dtype": "double"},
+        "name": {"dtype": "string"},
+        "seen": {"dtype": "datetime"},
+    }
+
+
+def test_inferred_stages_convert(tmp_path, parquet, csv):
+    Parquet = _compile(tmp_path, infer_stage(parquet))
+    output = Parquet.convert(pl.read_parquet(parquet), strict=True)
+    assert output.schema == {"id": pl.Int32, "price": pl.Float64}
+
+    Csv = _compile(tmp_path, infer_stage(csv))
+    output = Csv.convert(pl.read_csv(csv, try_parse_dates=False), strict=True)
+    assert output["seen"].dtype == pl.Datetime
+    assert output["seen"].null_count() == 1
+
+
+def test_inferred_schema_keeps_decimals(parquet):
+    Inferred = infer_schema(parquet, name="Inferred")
+    assert Inferred.__name__ == "Inferred"
+    output = Inferred.convert(pl.read_parquet(parquet), strict=True)
+    assert output.columns == ["id", "price", "amount", "tags"]
+    assert output["amount"].dtype == pl.Decimal(10, 2)
+
+
+def test_inferred_schema_parses_csv_timestamps(csv):
+    output = infer_schema(csv).convert(pl.read_csv(csv, try_parse_dates=False))
+    assert output["seen"].dtype == pl.Datetime
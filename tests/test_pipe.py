@@ -0,0 +1,94 @@
+import narwhals as nw
+import pandas as pd
+import polars as pl
+import pytest
+from attrs import field
+
+from dattrs import pipe as pipe_module
+from dattrs.schema import schema
+
+
+@schema
+class Bounds:
+    lo: nw.Int64 = field(validator=lambda expr: expr <= nw.col("hi"))
+    hi: nw.Int64 = field(converter=lambda expr: expr * 10)
+
+
+@schema
+class Unchanged:
+    x: nw.Int64 = field(validator=lambda expr: expr > 0)
+    y: nw.Int64 = field(validator=lambda expr: expr < 0)
+
+
+CONSTRUCTORS = {
+    "polars": pl.DataFrame,
+    "polars-lazy": pl.LazyFrame,
+    "pandas": pd.DataFrame,
+}
+
+
+def _failures(report, stage):
+    return {fld.name: fld.failures for fld in report.fields if fld.stage == stage}
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_fused_pipe_matches_unfused(constructor):
+    data = constructor({"lo": [5, 8, 1], "hi": [1, 2, 3]})
+    _, fused = Bounds.pipe(data, return_report=True)
+    _, unfused = Bounds.pipe(data, return_report=True, fused=False)
+    assert _failures(fused, "pre") == _failures(unfused, "pre") == {"lo": 2}
+    assert _failures(fused, "post") == _failures(unfused, "post") == {"lo": 0}
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_unchanged_fields_reuse_flags(constructor):
+    data = constructor({"x": [1, -1, 2], "y": [-1, -1, 1]})
+    output, report = Unchanged.pipe(data, return_report=True)
+    assert _failures(report, "pre") == _failures(report, "post") == {"x": 1, "y": 1}
+    assert nw.from_native(output).lazy().collect().rows() == [(1, -1), (-1, -1), (2, 1)]
+
+
+def test_fused_pipe_counts_in_one_select(monkeypatch):
+    calls = []
+    count_failures = pipe_module._count_failures
+
+    def counted(data, queries):
+        calls.append(sorted(queries))
+        return count_failures(data, queries)
+
+    monkeypatch.setattr(pipe_module, "_count_failures", counted)
+    data = pl.LazyFrame({"lo": [5, 8, 1], "hi": [1, 2, 3]})
+    output = Bounds.pipe(data)
+    assert calls == [["__dattrs_post__lo", "__dattrs_pre__lo"]]
+    assert output.collect().equals(Bounds.convert(data).collect())
+
+
+def test_fused_pipe_matches_convert_output():
+    data = pd.DataFrame({"lo": [5, 8, 1], "hi": [1, 2, 3]}, index=[3, 2, 1])
+    output = Bounds.pipe(data)
+    pd.testing.assert_frame_equal(output, Bounds.convert(data))
+
+
+def test_unfused_options_fall_back_to_separate_steps():
+    data = pl.DataFrame({"lo": [5, 8, 1], "hi": [1, 2, 3]})
+    _, report = Bounds.pipe(
+        data, validate_options={"fail_fast": True}, return_report=True
+    )
+    assert [fld.stage for fld in report.fields] == ["pre", "post"]
+    assert not any(fld.exact for fld in report.fields)
+    assert not report["pre.lo"].passed and report["post.lo"].passed
+
+
+def test_pre_convert_hook_runs_in_fused_plan():
+    @schema
+    class Filtered:
+        x: nw.Int64 = field(validator=lambda expr: expr > 0)
+
+        @staticmethod
+        def __dattrs_pre_convert__(data):
+            return data.filter(nw.col("x") > -5)
+
+    data = pl.DataFrame({"x": [-10, -1, 1]})
+    output, report = Filtered.pipe(data, return_report=True)
+    assert output["x"].to_list() == [-1, 1]
+    assert _failures(report, "pre") == _failures(report, "post") == {"x": 1}
@@ -0,0 +1,179 @@
+import narwhals as nw
+import polars as pl
+import pytest
+from attrs import field
+from narwhals.utils import Implementation
+
+from dattrs import plan as plan_module
+from dattrs.plan import clear_plan_cache, compile_plan
+from dattrs.schema import schema
+
+
+@schema
+class Sample:
+    id: nw.Int64 = field(validator=lambda expr: expr > 0)
+    name: nw.String = field(default="unknown")
+
+
+def test_compile_plan_reuses_plans():
+    clear_plan_cache(Sample)
+    plan = compile_plan(Sample, ["id", "name"], Implementation.POLARS)
+    assert compile_plan(Sample, ["name", "id"], Implementation.POLARS) is plan
+    assert compile_plan(Sample, ["id"], Implementation.POLARS) is not plan
+    assert compile_plan(Sample, ["id", "name"], Implementation.PANDAS) is not plan
+    assert (
+        compile_plan(Sample, ["id", "name"], Implementation.POLARS, fill_null=True)
+        is not plan
+    )
+
+
+def test_clear_plan_cache():
+    plan = compile_plan(Sample, ["id", "name"], Implementation.POLARS)
+    clear_plan_cache(Sample)
+    assert compile_plan(Sample, ["id", "name"], Implementation.POLARS) is not plan
+
+
+def test_plan_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(plan_module, "PLAN_CACHE_SIZE", 2)
+    clear_plan_cache(Sample)
+    first = compile_plan(Sample, ["id"], Implementation.POLARS)
+    compile_plan(Sample, ["id", "name"], Implementation.POLARS)
+    compile_plan(Sample, ["id", "other"], Implementation.POLARS)
+    assert compile_plan(Sample, ["id"], Implementation.POLARS) is not first
+
+
+def test_callable_defaults_are_not_cached():
+    @schema
+    class Stamped:
+        id: nw.Int64
+        loaded: nw.Int64 = field(default=lambda: nw.lit(1))
+
+    plan = compile_plan(Stamped, ["id"], Implementation.POLARS)
+    assert not plan.cacheable
+    assert compile_plan(Stamped, ["id"], Implementation.POLARS) is not plan
+    assert compile_plan(Stamped, ["id", "loaded"], Implementation.POLARS).cacheable
+
+
+def test_cached_plans_give_same_results():
+    data = pl.DataFrame({"id": [1, -1], "name": ["a", None]})
+    first = Sample.convert(data, fill_null=True)
+    assert Sample.convert(data, fill_null=True).equals(first)
+    assert first["name"].to_list() == ["a", "unknown"]
+    assert Sample.validate(data).fields[0].failures == 1
+    assert Sample.validate(data).fields[0].failures == 1
+
+
+@schema
+class Projected:
+    id: nw.Int64 = field(validator=lambda expr: expr > 0)
+    total: nw.Float64 = field(converter=lambda expr: expr + nw.col("tax"))
+
+
+@schema
+class Positional:
+    id: nw.Int64 = field(converter=lambda expr: nw.nth(0) + expr)
+
+
+@pytest.mark.parametrize(
+    ("expr", "columns"),
+    [
+        (nw.col("a") + 1, {"a"}),
+        (nw.col("a").fill_null(nw.col("b")), {"a", "b"}),
+        (nw.when(nw.col("a") > 1).then(nw.col("c")).otherwise(0), {"a", "c"}),
+        (nw.col("a").sum().over("g"), {"a", "g"}),
+        (nw.lit(1), set()),
+        (nw.all(), None),
+        (nw.col("a", "b"), None),
+        (nw.nth(0), None),
+        (nw.nth(0) + nw.col("b"), None),
+    ],
+)
+def test_root_columns(expr, columns):
+    roots = plan_module._root_columns(expr)
+    assert roots == (None if columns is None else frozenset(columns))
+
+
+def test_plan_columns():
+    plan = compile_plan(
+        Projected, ["id", "total", "tax", "unused"], Implementation.POLARS
+    )
+    assert plan.conversion_columns == {"id", "total", "tax"}
+    assert plan.validation_columns == {"id"}
+    assert plan.required_columns == {"id", "total", "tax"}
+
+    positional = compile_plan(Positional, ["id", "unused"], Implementation.POLARS)
+    assert positional.conversion_columns is None
+    assert positional.required_columns is None
+
+
+def test_convert_projects_lazy_input():
+    data = pl.LazyFrame({"id": [1], "total": [1.0], "tax": [0.5], "unused": ["x"]})
+    output = Projected.convert(data, project=True)
+    assert output.collect_schema().names() == ["id", "total", "tax"]
+    assert output.collect()["total"].to_list() == [1.5]
+
+    positional = Positional.convert(
+        pl.LazyFrame({"id": [1], "unused": [2]}), project=True
+    )
+    assert positional.collect_schema().names() == ["id", "unused"]
+
+
+def test_pipe_projects_lazy_input():
+    data = pl.LazyFrame(
+        {"id": [1, -1], "total": [1.0, 2.0], "tax": [0.5, 0.5], "unused": ["x", "y"]}
+    )
+    output, report = Projected.pipe(
+        data, convert_options={"project": True}, return_report=True
+    )
+    assert output.collect_schema().names() == ["id", "total", "tax"]
+    assert [fld.failures for fld in report.fields] == [1, 1]
+
+
+def test_project_keeps_a_column_without_required_columns():
+    @schema
+    class Constant:
+        flag: nw.Boolean = field(default=True)
+
+    output = Constant.convert(pl.LazyFrame({"unused": [1, 2]}), project=True)
+    assert output.collect()["flag"].to_list() == [True, True]
+
+
+def test_project_without_polars_keeps_all_columns(monkeypatch):
+    @schema
+    class Unprojected:
+        id: nw.Int64 = field(validator=lambda expr: expr > 0)
+
+    monkeypatch.setattr(plan_module, "_polars_namespace", lambda: None)
+    data = pl.LazyFrame({"id": [1], "unused": [2]})
+    output = Unprojected.convert(data, project=True)
+    assert output.collect_schema().names() == ["id", "unused"]
+
+
+def _strip(expr):
+    return expr.str.strip_chars()
+
+
+@schema
+class Copied:
+    code: nw.String = field(converter=lambda expr: nw.col("raw").str.strip_chars())
+    label: nw.String = field(converter=lambda expr: nw.col("raw").str.strip_chars())
+    other: nw.String = field(converter=_strip)
+
+
+def test_identical_conversions_are_copied():
+    plan = compile_plan(
+        Copied, ["raw", "code", "label", "other"], Implementation.POLARS
+    )
+    assert plan.conversion_copies == {"label": "code"}
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_copied_conversions_match(strict):
+    data = pl.DataFrame(
+        {"raw": [" a "], "code": ["x"], "label": ["y"], "other": [" b "]}
+    )
+    output = Copied.convert(data, strict=strict)
+    assert output.columns == (
+        ["code", "label", "other"] if strict else ["raw", "code", "label", "other"]
+    )
+    assert output.select("code", "label", "other").row(0) == ("a", "a", "b")
@@ -0,0 +1,96 @@
+import narwhals as nw
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from attrs import field
+
+from dattrs.quarantine import FAILURES_COLUMN, failed_fields
+from dattrs.schema import schema
+
+WIDTH = 130
+
+
+def _wide_schema():
+    namespace = {"__annotations__": {}}
+    for index in range(WIDTH):
+        namespace["__annotations__"][f"c{index}"] = nw.Int64
+        namespace[f"c{index}"] = field(validator=lambda expr: expr >= 0)
+    return schema(type("Wide", (), namespace))
+
+
+Wide = _wide_schema()
+
+# row 0 passes, row 1 fails c0, row 2 fails c64 and c129
+DATA = {
+    f"c{index}": [
+        0,
+        -1 if index == 0 else 0,
+        -1 if index in (64, 129) else 0,
+    ]
+    for index in range(WIDTH)
+}
+
+CONSTRUCTORS = {
+    "polars": pl.DataFrame,
+    "polars-lazy": lambda data: pl.LazyFrame(data),
+    "pandas": pd.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+def _rows(frame):
+    data = nw.from_native(frame)
+    if isinstance(data, nw.LazyFrame):
+        data = data.collect()
+    return data.rows(named=True)
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_quarantine_more_than_63_fields(constructor):
+    valid, rejected = Wide.quarantine(constructor(DATA))
+    assert [row["c0"] for row in _rows(valid)] == [0]
+    assert FAILURES_COLUMN not in _rows(valid)[0]
+
+    masks = [
+        [
+            row[name]
+            for name in (
+                FAILURES_COLUMN,
+                f"{FAILURES_COLUMN}_1",
+                f"{FAILURES_COLUMN}_2",
+            )
+        ]
+        for row in _rows(rejected)
+    ]
+    assert [failed_fields(Wide, mask) for mask in masks] == [
+        ["c0"],
+        ["c64", "c129"],
+    ]
+
+
+@pytest.mark.parametrize("constructor", CONSTRUCTORS.values(), ids=CONSTRUCTORS)
+def test_pipe_quarantine_matches_report(constructor):
+    valid, rejected, report = Wide.pipe(
+        constructor(DATA), quarantine=True, return_report=True
+    )
+    post = {fld.name: fld.failures for fld in report.fields if fld.stage == "post"}
+    assert sum(post.values()) == 3
+    assert len(_rows(valid)) == 1 and len(_rows(rejected)) == 2
+
+
+def test_failed_fields_single_mask():
+    @schema
+    class Narrow:
+        a: nw.Int64 = field(validator=lambda expr: expr > 0)
+        b: nw.Int64
+        c: nw.Int64 = field(validator=lambda expr: expr > 0)
+
+    valid, rejected = Narrow.quarantine(
+        pl.DataFrame({"a": [1, 0], "b": 0, "c": [0, 1]})
+    )
+    assert valid.is_empty()
+    assert [failed_fields(Narrow, mask) for mask in rejected[FAILURES_COLUMN]] == [
+        ["c"],
+        ["a"],
+    ]
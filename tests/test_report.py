@@ -0,0 +1,117 @@
+import datetime
+import json
+import logging
+
+import narwhals as nw
+import polars as pl
+import pytest
+from attrs import field
+
+from dattrs.report import FieldReport, ValidationReport
+from dattrs.sample import _wilson_interval
+from dattrs.schema import schema
+
+
+def _report(failures, observations, *, sampled=False, examples=()):
+    interval = _wilson_interval(failures, observations) if sampled else None
+    return ValidationReport(
+        fields=[
+            FieldReport(
+                name="x",
+                failures=failures,
+                observations=observations,
+                elapsed=1.0,
+                exact=not sampled,
+                interval=interval,
+                examples=list(examples),
+            )
+        ],
+        elapsed=1.0,
+    )
+
+
+def test_merge_sums_counts():
+    merged = _report(1, 10, examples=[{"x": 1}]).merge(
+        _report(2, 20, examples=[{"x": 2}, {"x": 3}]), max_examples=2
+    )
+    (fld,) = merged.fields
+    assert (fld.failures, fld.observations, fld.elapsed) == (3, 30, 2.0)
+    assert fld.exact and fld.interval is None
+    assert fld.examples == [{"x": 1}, {"x": 2}]
+    assert merged.elapsed == 2.0
+
+
+def test_merge_recomputes_sampled_intervals():
+    merged = _report(5, 100, sampled=True).merge(_report(45, 100, sampled=True))
+    (fld,) = merged.fields
+    assert not fld.exact
+    assert fld.interval == pytest.approx(_wilson_interval(50, 200))
+
+    wider = _report(5, 100, sampled=True).merge(
+        _report(45, 100, sampled=True), confidence=0.99
+    )
+    assert wider.fields[0].interval == pytest.approx(_wilson_interval(50, 200, 0.99))
+
+
+def test_merge_drops_intervals_of_partly_sampled_fields():
+    (fld,) = _report(5, 100, sampled=True).merge(_report(1, 1_000)).fields
+    assert not fld.exact and fld.interval is None
+
+
+def test_merge_into_empty_report_keeps_interval():
+    report = _report(5, 100, sampled=True)
+    merged = ValidationReport().merge(report)
+    assert merged.fields[0].interval == report.fields[0].interval
+
+
+def test_validate_returns_report():
+    @schema
+    class Positive:
+        x: nw.Int64 = field(validator=lambda expr: expr > 0)
+        y: nw.String = field(validator=lambda expr: ~expr.is_null())
+
+    data = pl.DataFrame({"x": [1, -1, -2, 3], "y": ["a", "b", "c", "d"]})
+    report = Positive.validate(data, max_examples=1)
+    assert not report.passed
+    assert report.failures == {"x": 2, "y": 0}
+    assert report["x"].ratio == 0.5 and report["y"].passed
+    assert report["x"].examples == [{"x": -1, "y": "b"}]
+    assert report["y"].examples == []
+    assert report.elapsed >= report["x"].elapsed >= 0
+
+
+def test_validate_logs_outcomes(caplog):
+    @schema
+    class Positive:
+        x: nw.Int64 = field(validator=lambda expr: expr > 0)
+
+    with caplog.at_level(logging.INFO, logger="dattrs"):
+        Positive.validate(pl.DataFrame({"x": [1, -1]}))
+    (record,) = caplog.records
+    assert record.levelno == logging.WARNING
+    assert record.getMessage() == "[FAILURE] 1 observations failed for x."
+
+
+def test_report_round_trips_through_json():
+    report = ValidationReport.from_stages(
+        pre=_report(1, 10, examples=[{"x": datetime.date(2024, 1, 2)}]),
+        post=_report(5, 100, sampled=True),
+    )
+    data = json.loads(report.to_json())
+    assert data["passed"] is False
+    assert [fld["stage"] for fld in data["fields"]] == ["pre", "post"]
+    assert data["fields"][0]["ratio"] == 0.1
+    assert data["fields"][0]["examples"] == [{"x": "2024-01-02"}]
+
+    restored = ValidationReport.from_dict(data)
+    assert restored.failures == report.failures == {"pre.x": 1, "post.x": 5}
+    assert restored["post.x"].interval == report["post.x"].interval
+    assert restored.elapsed == report.elapsed
+
+
+def test_report_lookup_by_name_or_key():
+    report = ValidationReport.from_stages(pre=_report(1, 10), post=_report(0, 10))
+    assert report["x"].stage == "pre"
+    assert report["post.x"].passed
+    with pytest.raises(KeyError):
+        report["y"]
@@ -0,0 +1,159 @@
+import graphlib
+import threading
+
+import narwhals as nw
+import polars as pl
+import pytest
+import yaml
+
+from dattrs.config import run_model, run_models
+from dattrs.config import runner as runner_module
+from dattrs.config.models import Model
+
+RAW = {
+    "schema": {
+        "x": {
+            "dtype": "int",
+            "validator": [{"function": "ge", "parameters": {"other": 0}}],
+        },
+        "y": {"dtype": "string"},
+    }
+}
+CLEAN = {
+    "schema": {
+        "x": {
+            "dtype": "int",
+            "converter": [{"function": "mul", "parameters": {"other": 10}}],
+            "validator": [{"function": "lt", "parameters": {"other": 50}}],
+        }
+    }
+}
+
+
+def _write(path, document):
+    path.write_text(yaml.safe_dump(document, sort_keys=False))
+    return str(path)
+
+
+@pytest.fixture
+def model(tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("x,y,unused\n1,a,u\n-1,b,u\n6,c,u\n")
+    config = {
+        "sources": [{"path": str(source)}],
+        "stages": {
+            "raw": _write(tmp_path / "raw.yaml", RAW),
+            "clean": _write(tmp_path / "clean.yaml", CLEAN),
+        },
+    }
+    return Model(name="events", config=_write(tmp_path / "events.yaml", config))
+
+
+@pytest.fixture
+def counts(monkeypatch):
+    calls = []
+    count_failures = runner_module._count_failures
+
+    def counted(data, queries):
+        calls.append(len(queries))
+        return count_failures(data, queries)
+
+    monkeypatch.setattr(runner_module, "_count_failures", counted)
+    return calls
+
+
+def test_stages_are_fused_into_one_pass(model, counts):
+    output, report = run_model(model)
+    assert isinstance(output, pl.LazyFrame)
+    assert counts == [2]
+    assert list(report.failures.items()) == [("raw.x", 1), ("clean.x", 1)]
+    assert all(fld.observations == 3 for fld in report.fields)
+    assert output.collect()["x"].to_list() == [10, -10, 60]
+
+
+def test_checkpoints_materialize_stages(model, counts, monkeypatch):
+    collects = []
+    collect = nw.LazyFrame.collect
+
+    def counted(self, *args, **kwargs):
+        collects.append(self)
+        return collect(self, *args, **kwargs)
+
+    monkeypatch.setattr(nw.LazyFrame, "collect", counted)
+    _, report = run_model(model, checkpoints=["raw"])
+    assert counts == [1, 1]
+    # the checkpoint, then counts over the materialized and final data
+    assert len(collects) == 3
+    assert list(report.failures.items()) == [("raw.x", 1), ("clean.x", 1)]
+
+    with pytest.raises(ValueError, match="Checkpoints must name stages"):
+        run_model(model, checkpoints=["missing"])
+
+
+def test_projection_skips_unused_columns(model):
+    output, _ = run_model(model, project=True)
+    assert output.collect_schema().names() == ["x", "y"]
+    output, _ = run_model(model)
+    assert output.collect_schema().names() == ["x", "y", "unused"]
+
+
+@pytest.fixture
+def models(tmp_path, model):
+    stages = {"clean": _write(tmp_path / "clean.yaml", CLEAN)}
+
+    def dependent(name, source, **options):
+        config = {"sources": [{"model": source}], "stages": stages, **options}
+        return Model(name=name, config=_write(tmp_path / f"{name}.yaml", config))
+
+    return [
+        dependent("audit", "events", depends_on=["rescaled"]),
+        dependent("rescaled", "scaled"),
+        dependent("scaled", "events"),
+        model,
+    ]
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    calls = []
+    run = runner_module.run_model
+
+    def recorded(model, **kwargs):
+        calls.append((model.name, threading.get_ident()))
+        return run(model, **kwargs)
+
+    monkeypatch.setattr(runner_module, "run_model", recorded)
+    return calls
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_models_run_after_dependencies(models, runs, max_workers):
+    results = run_models(models, max_workers=max_workers)
+    assert list(results) == ["audit", "rescaled", "scaled", "events"]
+    assert [name for name, _ in runs] == ["events", "scaled", "rescaled", "audit"]
+
+    scaled, report = results["scaled"]
+    assert scaled.collect()["x"].to_list() == [100, -100, 600]
+    assert report.failures == {"clean.x": 2}
+
+
+def test_duckdb_models_run_serially(models, runs):
+    results = run_models(models, backend="duckdb")
+    assert {thread for _, thread in runs} == {threading.get_ident()}
+    output, _ = results["rescaled"]
+    assert sorted(nw.from_native(output).lazy().collect()["x"].to_list()) == [
+        -1_000,
+        1_000,
+        6_000,
+    ]
+
+
+def test_invalid_dependencies_raise(models):
+    audit, _, scaled, events = models
+    with pytest.raises(ValueError, match="unknown models"):
+        run_models([audit, events])
+    with pytest.raises(ValueError, match="unique"):
+        run_models([events, events])
+    cyclic = Model(name="events", sources=events.parse().sources, depends_on=["scaled"])
+    with pytest.raises(graphlib.CycleError):
+        run_models([scaled, cyclic])
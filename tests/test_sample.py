@@ -0,0 +1,78 @@
+import narwhals as nw
+import polars as pl
+import pytest
+from attrs import field
+
+from dattrs import sample as sample_module
+from dattrs.sample import _sample, _wilson_interval
+from dattrs.schema import schema
+
+
+@schema
+class Positive:
+    x: nw.Int64 = field(validator=lambda expr: expr > 0)
+
+
+@pytest.fixture
+def data():
+    return pl.DataFrame({"x": range(-5_000, 5_000)})
+
+
+def test_eager_sample_is_exact_and_seeded(data):
+    frame = nw.from_native(data)
+    sampled = _sample(frame, 0.1, seed=0)
+    assert len(sampled) == 1_000
+    assert sampled["x"].to_list() == _sample(frame, 0.1, seed=0)["x"].to_list()
+    assert len(_sample(frame, 250, seed=0)) == 250
+    assert len(_sample(frame, 20_000, seed=0)) == len(data)
+
+
+def test_lazy_sample_is_seeded(data):
+    frame = nw.from_native(data.lazy())
+    sampled = _sample(frame, 0.1, seed=0).collect()
+    assert 800 < len(sampled) < 1_200
+    assert (
+        sampled["x"].to_list() == _sample(frame, 0.1, seed=0).collect()["x"].to_list()
+    )
+    assert 150 < len(_sample(frame, 250, seed=0).collect()) < 350
+
+
+@pytest.mark.parametrize("sample", [0.0, 1.5, 0, -1, True, "10%"])
+def test_sample_rejects_invalid_sizes(data, sample):
+    with pytest.raises((TypeError, ValueError)):
+        _sample(nw.from_native(data), sample)
+
+
+def test_sample_rejects_unsupported_lazy_backend(data, monkeypatch):
+    monkeypatch.setattr(sample_module, "_LAZY_SAMPLERS", {})
+    with pytest.raises(ValueError, match="Sampling is not supported"):
+        _sample(nw.from_native(data.lazy()), 0.1)
+
+
+@pytest.mark.parametrize(
+    ("failures", "observations"), [(0, 100), (50, 100), (100, 100), (3, 1_000)]
+)
+def test_wilson_interval_bounds(failures, observations):
+    lower, upper = _wilson_interval(failures, observations)
+    assert 0.0 <= lower <= failures / observations <= upper <= 1.0
+    wider_lower, wider_upper = _wilson_interval(failures, observations, 0.99)
+    assert wider_lower <= lower and upper <= wider_upper
+
+
+def test_wilson_interval_values():
+    assert _wilson_interval(50, 100) == pytest.approx((0.4038, 0.5962), abs=1e-4)
+    assert _wilson_interval(0, 100) == pytest.approx((0.0, 0.0370), abs=1e-4)
+    assert _wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_sampled_report_holds_interval(data):
+    (fld,) = Positive.validate(data, sample=0.1, seed=0).fields
+    assert not fld.exact and fld.observations == 1_000
+    assert fld.interval == _wilson_interval(fld.failures, fld.observations)
+    assert fld.interval[0] <= 0.5 <= fld.interval[1]
+
+
+@pytest.mark.parametrize("sample", [0.1, 100])
+def test_fail_fast_rejects_sample(data, sample):
+    with pytest.raises(ValueError, match="fail_fast"):
+        Positive.validate(data, fail_fast=True, sample=sample)
@@ -0,0 +1,89 @@
+import threading
+
+import duckdb
+import narwhals as nw
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from dattrs.config import load_sources
+from dattrs.config import sources as sources_module
+from dattrs.config.models import Source
+from dattrs.config.sources import load_source
+
+NATIVE = {
+    "polars": pl.LazyFrame,
+    "duckdb": duckdb.DuckDBPyRelation,
+    "pandas": pd.DataFrame,
+    "pyarrow": pa.Table,
+}
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"part-{index}.csv"
+        path.write_text(f"id,name\n{2 * index},a\n{2 * index + 1},b\n")
+        paths.append(str(path))
+    return paths
+
+
+def _ids(frame):
+    return sorted(nw.from_native(frame).lazy().collect()["id"].to_list())
+
+
+@pytest.mark.parametrize("backend", NATIVE)
+def test_load_source_per_backend(paths, backend):
+    frame = load_source(Source(path=paths[0]), backend=backend)
+    assert isinstance(frame, NATIVE[backend])
+    assert _ids(frame) == [0, 1]
+
+
+@pytest.mark.parametrize("backend", NATIVE)
+def test_load_sources_concatenates(paths, backend):
+    frame = load_sources([Source(path=path) for path in paths], backend=backend)
+    assert isinstance(frame, NATIVE[backend])
+    assert _ids(frame) == list(range(6))
+
+
+@pytest.mark.parametrize(("backend", "serial"), [("polars", False), ("duckdb", True)])
+def test_load_sources_threads(paths, backend, serial, monkeypatch):
+    threads = []
+    scan = sources_module._SCANNERS[backend]
+
+    def recorded(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return scan(*args, **kwargs)
+
+    monkeypatch.setitem(sources_module._SCANNERS, backend, recorded)
+    load_sources([Source(path=path) for path in paths], backend=backend)
+    assert len(threads) == len(paths)
+    assert (set(threads) == {threading.get_ident()}) is serial
+
+
+def test_format_option_overrides_extension(tmp_path):
+    path = tmp_path / "data.dat"
+    path.write_text('{"id": 1}\n{"id": 2}\n')
+    with pytest.raises(ValueError, match="Cannot infer format"):
+        load_source(Source(path=str(path)))
+    source = Source(path=str(path), options={"format": "ndjson"})
+    assert _ids(load_source(source)) == [1, 2]
+
+
+def test_model_outputs_are_sources(paths):
+    output = pl.LazyFrame({"id": [9]})
+    source = Source(model="upstream")
+    assert load_source(source, outputs={"upstream": output}) is output
+    with pytest.raises(ValueError, match="not available"):
+        load_source(source)
+
+
+def test_invalid_arguments_raise(paths):
+    with pytest.raises(ValueError, match="Backend must be one of"):
+        load_source(Source(path=paths[0]), backend="spark")
+    with pytest.raises(ValueError, match="Format must be one of"):
+        load_source(Source(path=paths[0], options={"format": "xlsx"}))
+    with pytest.raises(ValueError, match="at least one source"):
+        load_sources([])
@@ -0,0 +1,46 @@
+import narwhals as nw
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from attrs import field
+
+from dattrs.schema import schema
+from dattrs.stream import iter_batches
+
+
+@schema
+class Positive:
+    x: nw.Int64 = field(
+        converter=lambda expr: expr * 2, validator=lambda expr: expr > 0
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.table({"x": [1, -1, 2, -2, 3]}), path)
+    return str(path)
+
+
+def test_stream_converts_each_batch(path):
+    stream = Positive.convert_stream(iter_batches(path, batch_size=2))
+    outputs = list(stream)
+    assert [len(output) for output in outputs] == [2, 2, 1]
+    assert all(isinstance(output, pa.Table) for output in outputs)
+    assert pa.concat_tables(outputs)["x"].to_pylist() == [2, -2, 4, -4, 6]
+    assert stream.report.failures == {"pre.x": 2, "post.x": 2}
+    assert stream.report["post.x"].observations == 5
+
+
+def test_stream_report_starts_over_on_each_iteration():
+    batches = [pa.table({"x": [1, -1]}), pa.table({"x": [-2]})]
+    stream = Positive.convert_stream(batches)
+    for _ in range(2):
+        list(stream)
+        assert stream.report.failures == {"pre.x": 2, "post.x": 2}
+        assert stream.report["pre.x"].observations == 3
+
+
+def test_stream_rejects_unfused_options():
+    with pytest.raises(ValueError, match="Streams do not support"):
+        Positive.convert_stream([], validate_options={"sample": 0.5})
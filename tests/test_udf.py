@@ -0,0 +1,103 @@
+import duckdb
+import narwhals as nw
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+from attrs import field
+from narwhals.exceptions import OrderDependentExprError
+
+from dattrs.plan import _is_elementwise, compile_plan
+from dattrs.schema import schema
+from dattrs.udf import batch_udf
+
+
+@schema
+class Measurements:
+    value: nw.Float64 = field(
+        converter=batch_udf(np.log1p, nw.Float64),
+        validator=batch_udf(np.isfinite, nw.Boolean),
+    )
+
+
+@schema
+class ArrowMeasurements:
+    value: nw.Float64 = field(
+        converter=batch_udf(
+            lambda values: pc.multiply(values, 2), nw.Float64, format="arrow"
+        ),
+        validator=batch_udf(
+            lambda values: pc.less(values, 5), nw.Boolean, format="arrow"
+        ),
+    )
+
+
+EAGER = {
+    "polars": pl.DataFrame,
+    "pandas": pd.DataFrame,
+    "pyarrow": pa.table,
+}
+
+
+def _values(frame):
+    return nw.from_native(frame)["value"].to_list()
+
+
+@pytest.mark.parametrize("constructor", EAGER.values(), ids=EAGER)
+def test_numpy_udf(constructor):
+    data = constructor({"value": [0.0, np.exp(1) - 1, np.inf]})
+    assert _values(Measurements.convert(data)) == pytest.approx([0.0, 1.0, np.inf])
+    report = Measurements.validate(data)
+    assert [fld.failures for fld in report.fields] == [1]
+
+
+@pytest.mark.parametrize("constructor", EAGER.values(), ids=EAGER)
+def test_arrow_udf(constructor):
+    data = constructor({"value": [1.0, 2.0, 3.0]})
+    assert _values(ArrowMeasurements.convert(data)) == [2.0, 4.0, 6.0]
+    _, report = ArrowMeasurements.pipe(data, return_report=True)
+    failures = {(fld.stage, fld.name): fld.failures for fld in report.fields}
+    assert failures == {("pre", "value"): 0, ("post", "value"): 1}
+
+
+def test_pandas_udf_keeps_index():
+    data = pd.DataFrame({"value": [0.0, 1.0]}, index=[10, 20])
+    assert Measurements.convert(data).index.tolist() == [10, 20]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [pl.LazyFrame({"value": [1.0]}), duckdb.sql("select 1.0::double as value")],
+    ids=["polars-lazy", "duckdb"],
+)
+def test_lazy_udf_raises(data):
+    with pytest.raises(OrderDependentExprError):
+        Measurements.validate(data)
+    with pytest.raises(OrderDependentExprError):
+        nw.from_native(Measurements.convert(data)).lazy().collect()
+
+
+def test_udf_is_not_elementwise():
+    plan = compile_plan(
+        Measurements, columns=("value",), implementation=nw.Implementation.POLARS
+    )
+    assert not _is_elementwise(plan.conversions)
+    assert not _is_elementwise(plan.validations.values())
+
+
+def test_udf_rejects_wrong_length():
+    @schema
+    class Truncated:
+        value: nw.Float64 = field(
+            converter=batch_udf(lambda values: values[:1], nw.Float64)
+        )
+
+    with pytest.raises(ValueError, match="one value per observation"):
+        Truncated.convert(pl.DataFrame({"value": [1.0, 2.0]}))
+
+
+def test_udf_rejects_unknown_format():
+    with pytest.raises(ValueError, match="Format must be one of"):
+        batch_udf(np.log1p, nw.Float64, format="pandas")
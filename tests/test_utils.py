@@ -0,0 +1,57 @@
+import duckdb
+import narwhals as nw
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pytest
+from narwhals.utils import Implementation
+
+from dattrs.utils import _proxy_native_to_narwhals_dtype, _resolve_native_dtype
+
+
+@pytest.mark.parametrize(
+    ("dtype", "implementation", "expected"),
+    [
+        (pl.Int64, Implementation.POLARS, nw.Int64),
+        (pl.List(pl.String), Implementation.POLARS, nw.List(nw.String)),
+        (pa.int32(), Implementation.PYARROW, nw.Int32),
+        (pa.timestamp("ms"), Implementation.PYARROW, nw.Datetime("ms")),
+        (np.dtype("float64"), Implementation.PANDAS, nw.Float64),
+        ("string[pyarrow]", Implementation.PANDAS, nw.String),
+        (duckdb.typing.BIGINT, Implementation.DUCKDB, nw.Int64),
+    ],
+)
+def test_native_dtypes_resolve(dtype, implementation, expected):
+    resolved = _proxy_native_to_narwhals_dtype(dtype, implementation=implementation)
+    assert resolved == expected
+
+
+def test_narwhals_dtypes_pass_through():
+    assert _proxy_native_to_narwhals_dtype(nw.Int8) is nw.Int8
+    dtype = nw.Datetime("us")
+    assert _proxy_native_to_narwhals_dtype(dtype) is dtype
+
+
+def test_resolution_is_cached():
+    _resolve_native_dtype.cache_clear()
+    for _ in range(3):
+        _proxy_native_to_narwhals_dtype(pl.Int16, implementation=Implementation.POLARS)
+    info = _resolve_native_dtype.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_resolution_is_keyed_by_backend():
+    _resolve_native_dtype.cache_clear()
+    for implementation in (Implementation.PANDAS, Implementation.PYARROW):
+        resolved = _proxy_native_to_narwhals_dtype(
+            pa.int8(), implementation=implementation
+        )
+        assert resolved == nw.Int8
+    assert _resolve_native_dtype.cache_info().misses == 2
+
+
+def test_unresolvable_dtypes_raise():
+    with pytest.raises(ValueError, match="Must pass implementation"):
+        _proxy_native_to_narwhals_dtype(pl.Int64)
+    with pytest.raises(ValueError, match="Unable to find"):
+        _proxy_native_to_narwhals_dtype(pl.Int64, implementation=Implementation.UNKNOWN)
@@ -0,0 +1,122 @@
+import narwhals as nw
+import pandas as pd
+import polars as pl
+import pytest
+from attrs import field
+
+from dattrs.schema import schema
+from dattrs.validate import _count_failures
+
+
+@schema
+class Positive:
+    x: nw.Int64 = field(validator=lambda expr: expr > 0)
+    y: nw.Int64 = field(
+        validator=lambda expr: expr < 0, metadata={"dattrs": {"exact": True}}
+    )
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"x": range(-5_000, 5_000), "y": range(10_000)})
+
+
+def test_workers_match_single_pass(data):
+    single = Positive.validate(data)
+    parallel = Positive.validate(data, workers=2)
+    assert [fld.failures for fld in parallel.fields] == [
+        fld.failures for fld in single.fields
+    ]
+
+
+def test_sample_with_workers_samples(data):
+    report = Positive.validate(data, sample=0.01, seed=0, workers=2)
+    sampled, exact = report.fields
+    assert not sampled.exact and sampled.observations == 100
+    assert exact.exact and exact.observations == len(data)
+
+
+@pytest.mark.parametrize("option", [{"sample": 0.01}, {"workers": 2}])
+def test_fail_fast_rejects_combined_options(data, option):
+    with pytest.raises(ValueError, match="fail_fast"):
+        Positive.validate(data, fail_fast=True, **option)
+
+
+@pytest.mark.parametrize(
+    "constructor",
+    [pd.DataFrame, pl.DataFrame, pl.LazyFrame],
+    ids=["pandas", "polars", "polars-lazy"],
+)
+def test_count_failures_counts_each_query(constructor):
+    data = nw.from_native(constructor({"x": [-1, 0, 1, 2]}))
+    observations, counts = _count_failures(
+        data,
+        {
+            "positive": nw.col("x") > 0,
+            "small": nw.col("x") < 2,
+            "present": ~nw.col("x").is_null(),
+        },
+    )
+    assert observations == 4
+    assert counts == {"positive": 2, "small": 1, "present": 0}
+
+
+def test_validate_scans_lazy_data_once(monkeypatch):
+    scans = []
+    collect = nw.LazyFrame.collect
+
+    def counted(self, *args, **kwargs):
+        scans.append(self)
+        return collect(self, *args, **kwargs)
+
+    monkeypatch.setattr(nw.LazyFrame, "collect", counted)
+    data = pl.LazyFrame({"x": range(-5, 5), "y": range(10)})
+    report = Positive.validate(data)
+    assert len(scans) == 1
+    assert report.failures == {"x": 6, "y": 10}
+    assert all(fld.observations == 10 and fld.exact for fld in report.fields)
+
+
+@schema
+class Ordered:
+    expensive: nw.Int64 = field(
+        validator=lambda expr: expr > 0, metadata={"dattrs": {"cost": 10}}
+    )
+    cheap: nw.Int64 = field(validator=lambda expr: expr > 0)
+    composed: nw.Int64 = field(
+        validator=[lambda expr: expr > 0, lambda expr: expr < 100]
+    )
+
+
+@pytest.mark.parametrize(
+    "constructor",
+    [pd.DataFrame, pl.DataFrame, pl.LazyFrame],
+    ids=["pandas", "polars", "polars-lazy"],
+)
+def test_fail_fast_stops_at_cheapest_failure(constructor):
+    data = constructor({"expensive": [-1, 1], "cheap": [1, 1], "composed": [1, -1]})
+    report = Ordered.validate(data, fail_fast=True)
+    assert [fld.name for fld in report.fields] == ["cheap", "composed"]
+    assert report.failures == {"cheap": 0, "composed": 1}
+    assert not report.passed and not any(fld.exact for fld in report.fields)
+
+
+def test_fail_fast_checks_every_passing_field():
+    data = pl.DataFrame({"expensive": [1], "cheap": [1], "composed": [1]})
+    report = Ordered.validate(data, fail_fast=True)
+    assert [fld.name for fld in report.fields] == ["cheap", "composed", "expensive"]
+    assert report.passed
+
+
+def test_fail_fast_probes_lazy_data_with_head(monkeypatch):
+    heads = []
+    head = nw.LazyFrame.head
+
+    def counted(self, n=5):
+        heads.append(n)
+        return head(self, n)
+
+    monkeypatch.setattr(nw.LazyFrame, "head", counted)
+    data = pl.LazyFrame({"expensive": [1], "cheap": [-1], "composed": [1]})
+    assert Ordered.validate(data, fail_fast=True).failures == {"cheap": 1}
+    assert heads == [1]